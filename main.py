@@ -608,6 +608,7 @@ def main():
     # create help overlay
     help_showing = True
     help_font = pygame.freetype.SysFont("Arial", 18)
+    info_font = pygame.freetype.SysFont("Arial", 16)  # year/civs/speed line, drawn every frame
     help_overlay = pygame.Surface((width, height), pygame.SRCALPHA)
     help_overlay.fill((0, 0, 0, 180))  # semi-transparent background
     
@@ -763,7 +764,7 @@ def main():
                     if major_events:
                         # show notification for the first major event
                         event = major_events[0]
-                        renderer.show_notification(event["title"], event["message"], event["civ"])
+                        renderer.show_notification(event.title, event.message, event.civ)
                         
                         if auto_paused:
                             controls._show_feedback("Simulation paused due to major event")
@@ -778,7 +779,7 @@ def main():
                     major_events = simulation.get_major_events()
                     if major_events:
                         event = major_events[0]
-                        renderer.show_notification(event["title"], event["message"], event["civ"])
+                        renderer.show_notification(event.title, event.message, event.civ)
                         
                         if auto_paused:
                             controls._show_feedback("Simulation paused due to major event")
@@ -789,18 +790,17 @@ def main():
         
         # display simulation info
         current_civ_count = len(world.civilizations)
-        font = pygame.freetype.SysFont("Arial", 16)
         # position info at the top of the map area (not in either panel)
         info_x = renderer.offset_x
         info_y = 10
-        font.render_to(screen, (info_x, info_y), 
+        info_font.render_to(screen, (info_x, info_y), 
                     f"Year: {simulation.year} | Civs: {current_civ_count} | " +
                     f"{'PAUSED' if simulation.paused else 'RUNNING'} | Speed: {speed_values[simulation_speed]}x", 
                     (0, 0, 0))  # changed to black for better visibility
         
         # add fps counter (performance monitoring)
         fps = clock.get_fps()
-        font.render_to(screen, (info_x + 500, info_y), f"FPS: {fps:.1f}", (0, 0, 0))  # changed to black
+        info_font.render_to(screen, (info_x + 500, info_y), f"FPS: {fps:.1f}", (0, 0, 0))  # changed to black
         
         # update help overlay with new keyboard shortcuts
         if help_showing:
@@ -4,6 +4,11 @@ civilization module for civ simulator
 import random
 import uuid
 import math
+import itertools
+from collections.abc import MutableMapping
+from enum import IntEnum
+import numpy as np
+from src.world import NEIGHBOUR_OFFSETS
 
 class CivilizationTrait:
     AGGRESSIVE = "aggressive"
@@ -14,6 +19,26 @@ class CivilizationTrait:
     EXPANSIONIST = "expansionist"
     ISOLATIONIST = "isolationist"
     TRADING = "trading"
+
+    # one bit per trait so a civ's traits pack into a single int
+    BITS = {
+        AGGRESSIVE: 1 << 0,
+        TECH_SAVVY: 1 << 1,
+        RELIGIOUS: 1 << 2,
+        WEIRD: 1 << 3,
+        PEACEFUL: 1 << 4,
+        EXPANSIONIST: 1 << 5,
+        ISOLATIONIST: 1 << 6,
+        TRADING: 1 << 7
+    }
+    
+    @classmethod
+    def to_mask(cls, traits):
+        """pack a list of traits into a bitmask"""
+        mask = 0
+        for trait in traits:
+            mask |= cls.BITS.get(trait, 0)
+        return mask
     
     @classmethod
     def get_random_traits(cls, count=3):
@@ -46,12 +71,31 @@ class CivilizationTrait:
         
         return selected
 
+class ForeignStance(IntEnum):
+    """how a belief system treats foreign beliefs - same order as BeliefSystem.STANCES"""
+    OPEN = 0
+    NEUTRAL = 1
+    HOSTILE = 2
+    CONVERT = 3
+
 class BeliefSystem:
-    def __init__(self):
-        self.name = self._generate_name()
+    # stance names, in ForeignStance order
+    STANCES = ("open", "neutral", "hostile", "convert")
+
+    def __init__(self, name=None):
+        self.name = name if name is not None else self._generate_name()
         self.values = self._generate_core_values()
         self.foreign_stance = self._generate_foreign_stance()
     
+    @property
+    def foreign_stance(self):
+        """stance as a string, for the ui, lore and save files - compare against self.stance instead"""
+        return self.STANCES[self.stance]
+    
+    @foreign_stance.setter
+    def foreign_stance(self, stance):
+        self.stance = ForeignStance(self.STANCES.index(stance) if isinstance(stance, str) else stance)
+    
     def _generate_name(self):
         """come up with a random name for the belief system"""
         prefixes = ["Church of", "Cult of", "Order of", "Way of", "Faith of", 
@@ -95,8 +139,61 @@ class BeliefSystem:
         # normalize to 0-1 range
         return similarity / len(self.values)
 
+class Relations(MutableMapping):
+    """civ.relations - looks like a {other civ id: relation} dict, but reads and writes
+    the civ's row of world.relation_matrix"""
+    __slots__ = ("civ",)
+    
+    def __init__(self, civ):
+        self.civ = civ
+    
+    def _row(self):
+        world = self.civ.world
+        if self.civ.index is None:
+            return world.relation_matrix[:0, :0].ravel()  # not in the world yet, so no relations
+        return world.relation_matrix[self.civ.index, :world._next_civ_index]
+    
+    def __getitem__(self, civ_id):
+        world = self.civ.world
+        index = world._index_of_id.get(civ_id)
+        if index is None or self.civ.index is None:
+            raise KeyError(civ_id)
+        value = world.relation_matrix[self.civ.index, index]
+        if value != value:  # nan - never met
+            raise KeyError(civ_id)
+        return float(value)
+    
+    def __setitem__(self, civ_id, value):
+        world = self.civ.world
+        world.relation_matrix[self.civ.index, world.index_for_id(civ_id)] = value
+    
+    def __delitem__(self, civ_id):
+        if civ_id not in self:
+            raise KeyError(civ_id)
+        world = self.civ.world
+        world.relation_matrix[self.civ.index, world._index_of_id[civ_id]] = np.nan
+    
+    def __iter__(self):
+        world = self.civ.world
+        for index in np.flatnonzero(~np.isnan(self._row())).tolist():
+            yield world.id_for_index(index)
+    
+    def __len__(self):
+        return int(np.count_nonzero(~np.isnan(self._row())))
+    
+    def clear(self):
+        self._row()[:] = np.nan
+    
+    def __repr__(self):
+        return repr(dict(self))
+
 class Civilization:
-    def __init__(self, world, position=None):
+    # defaults for code that checks these on every civ, so it can read them without hasattr
+    has_collapsed = False
+    protected_until_tick = None  # tick (for the simulation) / age the civ is protected until
+    
+    def __init__(self, world, position=None, skip_init=False):
+        """skip_init gives a bare civ (no land, no founding) for load_state to fill in"""
         self.id = str(uuid.uuid4())
         self.world = world
         
@@ -104,7 +201,7 @@ class Civilization:
         self.name = self._generate_name()
         
         # find a suitable position if none provided
-        if position is None:
+        if position is None and not skip_init:
             self.position = world.find_settlement_location()
         else:
             self.position = position
@@ -113,20 +210,32 @@ class Civilization:
         self.population = random.randint(50, 200)
         self.age = 0  # age in ticks
         
+        # small int handed out by the world when the civ joins it (see world.tile_owner)
+        self.index = None
+        
         # initialize territory with the starting position and some surrounding area
+        self._territory_xy = None  # numpy copy of territory, rebuilt lazily
+        self._border_xy = None  # tiles with at least one neighbour outside the territory, also lazy
+        self.territory_version = 0  # bumped on every territory change, for caches outside the civ
         self.territory = set()
-        self._initialize_starting_territory()
+        if not skip_init:
+            self._initialize_starting_territory()
         
         # create the first city
-        self.cities = {self.position: {"name": self.name, "population": self.population}}
+        self.cities = {} if skip_init else {self.position: {"name": self.name, "population": self.population}}
         
         # traits and beliefs
         self.traits = CivilizationTrait.get_random_traits()
         self.belief_system = BeliefSystem()
         
         # relations with other civilizations
-        self.relations = {}  # maps civ_id -> relation_value (-1 to 1)
+        self._relations = Relations(self)  # maps civ_id -> relation_value (-1 to 1)
         self.permanently_hostile_to_all = False # For God Mode war influence
+        self.at_war_with = set()  # ids of civs we're currently fighting
+        
+        # set when the civ falls apart or is conquered/absorbed, simulation cleans it up
+        self.has_collapsed = False
+        self.collapse_logged = False
         
         # technology level (0-50000) - much higher cap now
         self.technology = random.randint(10, 30)
@@ -150,6 +259,7 @@ class Civilization:
         
         # event log
         self.event_log = []
+        self._event_log_hwm = 0  # how far the simulation has read into event_log
         
         # battle victories and territory gains
         self.battle_victories = 0
@@ -161,7 +271,8 @@ class Civilization:
         self.protected_until_tick = 20
         
         # add founding event
-        self._add_event(f"Founded at {self.position}")
+        if not skip_init:
+            self._add_event(f"Founded at {self.position}")
     
     def _generate_name(self):
         """come up with a random name for the civilization"""
@@ -314,7 +425,7 @@ class Civilization:
         
         # NEW: Territory expansion bonus - growing civilizations should see population growth
         expansion_factor = 1.0
-        if hasattr(self, 'territory_last_tick') and self.territory_last_tick:
+        if self.territory_last_tick:
             # Check if territory has expanded since last tick
             # This ensures expanding civilizations see population growth
             territory_growth = len(self.territory) - len(self.territory_last_tick)
@@ -373,7 +484,7 @@ class Civilization:
             food_efficiency *= (1.0 - young_age_factor * 0.3)  # Up to 30% more efficient food use
         
         # Protected civilizations get additional help
-        if hasattr(self, 'protected_until_tick') and self.age < self.protected_until_tick:
+        if self.protected_until_tick is not None and self.age < self.protected_until_tick:
             food_efficiency *= 0.7  # 30% more efficient while protected
         
         # Special case: ensure minimum food consumption doesn't exhaust all food
@@ -479,7 +590,7 @@ class Civilization:
             if expansion_candidates:
                 # Pick a random candidate
                 new_territory = random.choice(expansion_candidates)
-                self.territory.add(new_territory)
+                self.add_tile(new_territory)
                 
                 # Sometimes establish a new city, but only if we don't have too many
                 # and the population is large enough
@@ -662,12 +773,14 @@ class Civilization:
     
     def _check_interactions(self):
         """Check for interactions with neighboring civilizations"""
+        # only civs whose land touches ours (worked out from the world's ownership map)
+        neighbours = self.world.neighbour_indices().get(self.index, ())
         for civ in self.world.civilizations:
             if civ.id == self.id:
                 continue
                 
             # Check if territories are adjacent
-            if self._territories_adjacent(civ):
+            if civ.index in neighbours:
                 # Initialize relation if needed
                 if civ.id not in self.relations:
                     initial_relation = random.uniform(-0.3, 0.3)
@@ -683,8 +796,7 @@ class Civilization:
                     belief_similarity = self.belief_system.get_similarity(civ.belief_system)
                     initial_relation += belief_similarity - 0.5  # -0.5 to 0.5 adjustment
                     
-                    self.relations[civ.id] = max(-1.0, min(1.0, initial_relation))
-                    civ.relations[self.id] = self.relations[civ.id]
+                    self.world.set_relation(self.index, civ.index, max(-1.0, min(1.0, initial_relation)))
                     
                     self._add_event(f"First contact with {civ.name}")
                 
@@ -693,28 +805,21 @@ class Civilization:
     
     def _territories_adjacent(self, other_civ):
         """Check if two civilizations' territories are adjacent"""
-        for pos1 in self.territory:
-            x1, y1 = pos1
-            for pos2 in other_civ.territory:
-                x2, y2 = pos2
-                # Check if positions are adjacent (including diagonals)
-                if abs(x1 - x2) <= 1 and abs(y1 - y2) <= 1:
-                    return True
-        return False
+        return other_civ.index in self.world.neighbour_indices().get(self.index, ())
     
     def _consider_diplomacy(self, other_civ):
         """Consider diplomatic actions with another civilization"""
         # If this civ is permanently hostile, always try to declare war if not already at war
         if self.permanently_hostile_to_all:
-            if not hasattr(self, 'at_war_with') or other_civ.id not in self.at_war_with:
+            if other_civ.id not in self.at_war_with:
                 self._declare_war(other_civ)
                 return # No further diplomacy needed if war is declared
             else:
                 return # Already at war, no other diplomacy
 
         # If other_civ is permanently hostile, this civ might react by also declaring war or maintaining distance
-        if hasattr(other_civ, 'permanently_hostile_to_all') and other_civ.permanently_hostile_to_all:
-            if not hasattr(self, 'at_war_with') or other_civ.id not in self.at_war_with:
+        if other_civ.permanently_hostile_to_all:
+            if other_civ.id not in self.at_war_with:
                 # High chance to declare war in defense or pre-emptively
                 if random.random() < 0.75:
                     self._declare_war(other_civ)
@@ -792,7 +897,7 @@ class Civilization:
         # Consider major actions based on relations
         if new_relation < -0.7:
             # Very negative relations might lead to war
-            if not hasattr(self, 'at_war_with') or other_civ.id not in self.at_war_with:
+            if other_civ.id not in self.at_war_with:
                 # Higher chance of war for aggressive civs, lower for peaceful
                 war_threshold = 0.3
                 if self._has_trait(CivilizationTrait.AGGRESSIVE):
@@ -842,7 +947,7 @@ class Civilization:
             return
 
         # If the other civ is permanently hostile, this civ reacts
-        if hasattr(other_civ, 'permanently_hostile_to_all') and other_civ.permanently_hostile_to_all:
+        if other_civ.permanently_hostile_to_all:
             self._declare_war(other_civ) # This civ is forced into war
             self._add_event(f"Forced into war upon first contact with the divinely hostile {other_civ.name}!")
             return
@@ -904,21 +1009,14 @@ class Civilization:
     
     def _declare_war(self, other_civ):
         """Declare war on another civilization"""
-        # Initialize war state if doesn't exist
-        if not hasattr(self, 'at_war_with'):
-            self.at_war_with = set()
-            
         # Add to war list
         self.at_war_with.add(other_civ.id)
         
         # Set reciprocal war state for other civ
-        if not hasattr(other_civ, 'at_war_with'):
-            other_civ.at_war_with = set()
         other_civ.at_war_with.add(self.id)
         
         # Set relations to minimum
-        self.relations[other_civ.id] = -1.0
-        other_civ.relations[self.id] = -1.0
+        self.world.set_relation(self.index, other_civ.index, -1.0)
         
         # Log the event
         war_desc = f"War declared between {self.name} and {other_civ.name}"
@@ -951,18 +1049,16 @@ class Civilization:
         other_civ._add_event(unification_desc)
         
         # Merge territories
-        dominant_civ.territory = dominant_civ.territory.union(absorbed_civ.territory)
+        dominant_civ.add_tiles(absorbed_civ.territory)
         
         # Merge populations
         dominant_civ.population += absorbed_civ.population
         
-        # Merge cities
-        for pos, city in absorbed_civ.cities.items():
-            if pos not in dominant_civ.cities:
-                dominant_civ.cities[pos] = city
-            else:
-                # If both have a city at the same position, combine them
-                dominant_civ.cities[pos]["population"] += city["population"]
+        # Merge cities - if both have a city at the same position, combine them
+        shared = dominant_civ.cities.keys() & absorbed_civ.cities.keys()
+        for pos in shared:
+            dominant_civ.cities[pos]["population"] += absorbed_civ.cities[pos]["population"]
+        dominant_civ.cities.update((pos, city) for pos, city in absorbed_civ.cities.items() if pos not in shared)
         
         # Merge resources
         for resource in dominant_civ.resources:
@@ -1009,7 +1105,99 @@ class Civilization:
     
     def _has_trait(self, trait):
         """Check if civilization has a specific trait"""
-        return trait in self.traits
+        return (self.trait_mask & CivilizationTrait.BITS.get(trait, 0)) != 0
+    
+    @property
+    def traits(self):
+        """list of trait names - assign a new list to change them so trait_mask stays in sync"""
+        return self._traits
+    
+    @traits.setter
+    def traits(self, traits):
+        self._traits = list(traits)
+        self.trait_mask = CivilizationTrait.to_mask(self._traits)  # CivilizationTrait.BITS packed together
+    
+    @property
+    def relations(self):
+        """{other civ id: relation} - a view over the world's relation matrix"""
+        return self._relations
+    
+    @relations.setter
+    def relations(self, relations):
+        self._relations.clear()
+        self._relations.update(relations)
+    
+    @property
+    def territory(self):
+        """set of (x, y) tiles this civ controls - change it via add_tile/remove_tile"""
+        return self._territory
+    
+    @territory.setter
+    def territory(self, tiles):
+        if self.index is not None and self._territory:
+            self.world.release_tiles(self, self.territory_xy())
+        self._territory = tiles if isinstance(tiles, set) else set(tiles)
+        self._invalidate_territory_cache()
+        if self.index is not None and self._territory:
+            self.world.claim_tiles(self, self.territory_xy())
+    
+    def add_tile(self, position):
+        """claim a tile"""
+        self._territory.add(position)
+        self._invalidate_territory_cache()
+        if self.index is not None:
+            self.world.claim_tile(self, position)
+    
+    def add_tiles(self, positions):
+        """claim a whole set of tiles in one go"""
+        new_tiles = set(positions) - self._territory
+        if not new_tiles:
+            return
+        self._territory |= new_tiles
+        self._invalidate_territory_cache()
+        if self.index is not None:
+            xy = np.fromiter(itertools.chain.from_iterable(new_tiles), dtype=np.int32, count=2 * len(new_tiles))
+            self.world.claim_tiles(self, xy.reshape(-1, 2))
+    
+    def remove_tile(self, position):
+        """give up a tile"""
+        self._territory.discard(position)
+        self._invalidate_territory_cache()
+        if self.index is not None:
+            self.world.release_tile(self, position)
+    
+    def _invalidate_territory_cache(self):
+        """drop anything derived from the territory set"""
+        self._territory_xy = None
+        self._border_xy = None
+        self.territory_version += 1
+    
+    def territory_xy(self):
+        """territory as an (N, 2) int array of x, y - cached until territory changes"""
+        if self._territory_xy is None:
+            flat = np.fromiter(itertools.chain.from_iterable(self._territory), dtype=np.int32,
+                               count=2 * len(self._territory))
+            self._territory_xy = flat.reshape(-1, 2)
+        return self._territory_xy
+    
+    def border_xy(self):
+        """the territory_xy rows on the edge of our land - cached until territory changes"""
+        if self._border_xy is None:
+            xy = self.territory_xy()
+            if len(xy) == 0:
+                self._border_xy = xy
+                return xy
+            
+            # stamp our land onto a small grid around it (1 tile of padding), then a tile is
+            # interior only if all 8 neighbours are ours too
+            local = xy - xy.min(axis=0) + 1
+            mine = np.zeros(local.max(axis=0) + 2, dtype=bool)
+            mine[local[:, 0], local[:, 1]] = True
+            interior = np.ones(len(xy), dtype=bool)
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                interior &= mine[local[:, 0] + dx, local[:, 1] + dy]
+            self._border_xy = xy[~interior]
+        return self._border_xy
     
     def has_territory_at(self, position):
         """Check if civilization has territory at a position"""
@@ -1040,7 +1228,7 @@ class Civilization:
     def _initialize_starting_territory(self):
         """Initialize the civilization's starting territory with some surrounding land"""
         # Start with the center position
-        self.territory.add(self.position)
+        self.add_tile(self.position)
         
         # Add some surrounding territory based on a small radius (3-5 tiles)
         radius = random.randint(3, 5)  # Increased radius for more starting territory
@@ -1049,17 +1237,20 @@ class Civilization:
         # Count how many tiles we add
         added_tiles = 1  # Start with 1 for the center position
         
+        # read the terrain grid directly rather than through is_valid_position/get_terrain_at per cell
+        terrain_grid = self.world.terrain
+        width, height = self.world.width, self.world.height
         for x in range(x0 - radius, x0 + radius + 1):
             for y in range(y0 - radius, y0 + radius + 1):
                 # Only add if within world bounds and is land
-                if self.world.is_valid_position((x, y)):
-                    terrain = self.world.get_terrain_at((x, y))
+                if 0 <= x < width and 0 <= y < height:
+                    terrain = terrain_grid[x, y]
                     # Check if it's land, forest, or desert (not water or mountain)
                     if terrain in [1, 3, 4]:  # Land, Forest, Desert
                         # Add with decreasing probability based on distance from center
                         distance = ((x - x0) ** 2 + (y - y0) ** 2) ** 0.5
                         if distance <= 2 or random.random() < (2.0 - distance / radius):
-                            self.territory.add((x, y))
+                            self.add_tile((x, y))
                             added_tiles += 1
         
         print(f"Initialized {self.name} with {added_tiles} territory tiles") 
\ No newline at end of file
@@ -2,11 +2,17 @@
 event logging module for civ simulator
 """
 import json
+import os
 import time
 
 class EventLogger:
     def __init__(self):
         self.events = []
+        
+        # optional jsonl file every new event gets appended to (see open_stream)
+        self.stream_path = None
+        self._stream = None
+        self._stream_request = None  # the path open_stream was asked for
     
     def add_event(self, year, description, event_type="general"):
         """add a new event to the log"""
@@ -17,6 +23,8 @@ class EventLogger:
             "timestamp": time.time()
         }
         self.events.append(event)
+        if self._stream is not None:
+            self._stream.write((json.dumps(event) + "\n").encode("utf-8"))
     
     def get_events_by_year(self, year):
         """get all events for a specific year"""
@@ -36,8 +44,48 @@ class EventLogger:
     
     def set_events(self, events):
         """set the events (used when loading saved games)"""
+        self.close_stream()
         self.events = events
     
+    def open_stream(self, path):
+        """start appending events to a jsonl file, writing out everything logged so far.
+        a file that's already there may still be needed by an older save, so it's never
+        overwritten - a numbered file next to it is used instead (see stream_path)"""
+        if self._stream is not None and self._stream_request == path:
+            return
+        self.close_stream()
+        root, ext = os.path.splitext(path)
+        target, n = path, 0
+        while os.path.exists(target):
+            n += 1
+            target = f"{root}.{n}{ext}"
+        self._stream = open(target, "xb")
+        self.stream_path = target
+        self._stream_request = path
+        for event in self.events:
+            self._stream.write((json.dumps(event) + "\n").encode("utf-8"))
+    
+    def stream_offset(self):
+        """byte offset of the end of the stream - everything before it is on disk"""
+        self._stream.flush()
+        return self._stream.tell()
+    
+    def load_stream(self, path, offset):
+        """read events back from a jsonl file up to offset. the file is left alone - anything
+        after offset may belong to a later save - and the next open_stream starts a new one"""
+        self.close_stream()
+        with open(path, "rb") as file:
+            data = file.read(offset)
+        self.events = [json.loads(line) for line in data.splitlines() if line]
+    
+    def close_stream(self):
+        """stop mirroring events to disk"""
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = None
+        self.stream_path = None
+        self._stream_request = None
+    
     def export_to_json(self, filename):
         """export events to a json file"""
         with open(filename, "w") as file:
@@ -74,4 +122,5 @@ class EventLogger:
     
     def clear(self):
         """clear all events"""
-        self.events = [] 
\ No newline at end of file
+        self.close_stream()
+        self.events = []
@@ -0,0 +1,167 @@
+"""
+history module for civ simulator
+"""
+from bisect import bisect_right
+import numpy as np
+
+class CivilizationHistory:
+    """civ snapshots stored as numpy columns - one row per snapshot, one column per civ"""
+    NUMERIC_FIELDS = ("population", "age", "territory_size", "technology")
+    RESOURCE_FIELDS = ("food", "metal", "gold", "stone")
+    INT_FIELDS = ("population", "age", "territory_size")
+
+    def __init__(self, max_civilizations=7, capacity=64):
+        self.count = 0  # snapshots recorded so far
+        self.years = np.zeros(capacity, dtype=np.int64)
+
+        # nan marks "this civ didn't exist in this snapshot"
+        fields = self.NUMERIC_FIELDS + self.RESOURCE_FIELDS
+        self.columns = {field: np.full((capacity, max_civilizations), np.nan) for field in fields}
+
+        # per-column info about each civ that ever showed up
+        self.column_of = {}  # civ id -> column
+        self.civ_ids = []
+        
+        # name/traits/beliefs rarely change, so they're delta-encoded: per column we only
+        # keep the rows where they changed, plus what they changed to
+        self.info_rows = []
+        self.info_values = []  # (name, traits, (belief name, values, stance))
+        self._info_keys = []  # last thing we compared against, per column
+
+        self._snapshots = None  # rebuilt dict view, dropped on every record
+
+    def __len__(self):
+        return self.count
+
+    def record(self, year, civs):
+        """add a snapshot of the given civs"""
+        self.store(self.capture(year, civs))
+
+    def capture(self, year, civs):
+        """copy what a snapshot needs out of the civs - cheap, and the only part that reads live civ state"""
+        n = len(civs)
+        numbers = {
+            "population": np.fromiter((civ.population for civ in civs), float, n),
+            "age": np.fromiter((civ.age for civ in civs), float, n),
+            "territory_size": np.fromiter((len(civ.territory) for civ in civs), float, n),
+            "technology": np.fromiter((civ.technology for civ in civs), float, n)
+        }
+        for resource in self.RESOURCE_FIELDS:
+            numbers[resource] = np.fromiter((civ.resources.get(resource, 0) for civ in civs), float, n)
+        # copy the belief fields too - the civ keeps mutating its belief system after we return
+        info = [(civ.id, civ.name, list(civ.traits),
+                 (civ.belief_system.name, dict(civ.belief_system.values), civ.belief_system.foreign_stance))
+                for civ in civs]
+        return year, numbers, info
+
+    def store(self, frame):
+        """write a captured snapshot into the columns (safe to run off the main thread)"""
+        year, numbers, info = frame
+        if self.count >= len(self.years):
+            self._grow(rows=len(self.years) * 2)
+
+        row = self.count
+        cols = np.fromiter((self._column_for(civ_id) for civ_id, _, _, _ in info), dtype=np.int64, count=len(info))
+        self.years[row] = year
+        for field, values in numbers.items():
+            self.columns[field][row, cols] = values
+
+        for col, (civ_id, name, traits, belief) in zip(cols.tolist(), info):
+            belief_name, values, stance = belief
+            key = (name, tuple(traits), belief_name, stance, tuple(values.values()))
+            if key != self._info_keys[col]:
+                self._info_keys[col] = key
+                self.info_rows[col].append(row)
+                self.info_values[col].append((name, traits, belief))
+
+        self.count += 1
+        self._snapshots = None
+
+    def _column_for(self, civ_id):
+        """column for a civ, handing out a new one the first time we see it"""
+        col = self.column_of.get(civ_id)
+        if col is None:
+            col = len(self.civ_ids)
+            if col >= self.columns["population"].shape[1]:
+                self._grow(cols=col * 2)
+            self.column_of[civ_id] = col
+            self.civ_ids.append(civ_id)
+            self.info_rows.append([])
+            self.info_values.append([])
+            self._info_keys.append(None)
+        return col
+
+    def _grow(self, rows=None, cols=None):
+        """resize the column arrays, padding new cells with nan"""
+        old_rows, old_cols = self.columns["population"].shape
+        rows = rows or old_rows
+        cols = cols or old_cols
+
+        if rows != old_rows:
+            years = np.zeros(rows, dtype=np.int64)
+            years[:old_rows] = self.years
+            self.years = years
+
+        for field, column in self.columns.items():
+            grown = np.full((rows, cols), np.nan)
+            grown[:old_rows, :old_cols] = column
+            self.columns[field] = grown
+
+    def snapshots(self):
+        """history as a list of {"year", "civilizations": [...]} dicts, like get_status() gives"""
+        if self._snapshots is None:
+            self._snapshots = [self._build_snapshot(row) for row in range(self.count)]
+        return self._snapshots
+
+    def _build_snapshot(self, row):
+        """turn one row of the columns back into a snapshot dict"""
+        civilizations = []
+        for col in np.flatnonzero(~np.isnan(self.columns["population"][row])).tolist():
+            # latest info change at or before this row
+            name, traits, belief = self.info_values[col][bisect_right(self.info_rows[col], row) - 1]
+            status = {"id": self.civ_ids[col], "name": name}
+            for field in self.NUMERIC_FIELDS:
+                value = self.columns[field][row, col]
+                status[field] = int(value) if field in self.INT_FIELDS else float(value)
+            status["traits"] = traits
+            belief_name, values, stance = belief
+            status["belief_system"] = {
+                "name": belief_name,
+                "values": dict(values),
+                "foreign_stance": stance
+            }
+            status["resources"] = {resource: float(self.columns[resource][row, col])
+                                   for resource in self.RESOURCE_FIELDS}
+            civilizations.append(status)
+        return {"year": int(self.years[row]), "civilizations": civilizations}
+
+    @classmethod
+    def from_snapshots(cls, snapshots, max_civilizations=7):
+        """build a store from old list-of-dicts history (older save files)"""
+        history = cls(max_civilizations, capacity=max(64, len(snapshots)))
+        for snapshot in snapshots:
+            civs = [_SavedStatus(status) for status in snapshot["civilizations"]]
+            history.record(snapshot["year"], civs)
+        return history
+
+
+class _SavedStatus:
+    """wraps a get_status() dict so it looks enough like a civ for record()"""
+    def __init__(self, status):
+        self.id = status["id"]
+        self.name = status["name"]
+        self.population = status["population"]
+        self.age = status["age"]
+        self.territory = range(status["territory_size"])
+        self.technology = status["technology"]
+        self.resources = status["resources"]
+        self.traits = status["traits"]
+        self.belief_system = _SavedBelief(status["belief_system"])
+
+
+class _SavedBelief:
+    """belief system dict from an old snapshot"""
+    def __init__(self, belief):
+        self.name = belief["name"]
+        self.values = belief["values"]
+        self.foreign_stance = belief["foreign_stance"]
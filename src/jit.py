@@ -0,0 +1,14 @@
+"""
+optional numba support for the number crunching hot spots
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """stand-in for numba.njit when numba isn't installed - just runs the plain python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
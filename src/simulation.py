@@ -1,27 +1,117 @@
 """
 simulation module for civ simulator
 """
+import os
 import random
-import json
-import pickle
 import time
 import math
-from src.civilization import Civilization, CivilizationTrait
+import re
+import itertools
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.civilization import Civilization, CivilizationTrait, BeliefSystem, ForeignStance
 from src.events import EventLogger
+from src.history import CivilizationHistory
+from src.jit import njit
+
+# a notification-worthy event from this tick (title and message for the popup, civ to highlight)
+MajorEvent = namedtuple("MajorEvent", ["title", "message", "civ"])
+
+# civ events worth a notification (and an auto-pause)
+_MAJOR_KEYWORDS = ("collapsed", "war declared", "conquered", "established", "unified", "first contact")
+_MAJOR_RE = re.compile("|".join(map(re.escape, _MAJOR_KEYWORDS)), re.IGNORECASE)
+
+# "population ... significantly ... increased/decreased" in any order
+_POPULATION_CHANGE_RE = re.compile(r"^(?=.*population)(?=.*significantly).*?(increased|decreased)", re.IGNORECASE)
+
+
+@njit(cache=True)
+def _compute_damage(pop_arr, ratio_arr, base_rate_arr, magnitude):
+    """damage rate and population loss for every civ hit by a god-mode disaster"""
+    n = pop_arr.shape[0]
+    loss_arr = np.empty(n, dtype=np.int64)
+    rate_arr = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        rate = min(base_rate_arr[i] * magnitude * ratio_arr[i], 0.9)  # cap damage at 90%
+        rate_arr[i] = rate
+        loss_arr[i] = int(pop_arr[i] * rate)
+    return loss_arr, rate_arr
+
+
+@njit(cache=True)
+def _battle_outcomes(population, technology, trait_mask, first, second, noise, aggressive_bit, peaceful_bit):
+    """who wins each battle between civ rows first[k] and second[k], and by how much
+    Returns (first_wins, strength_ratio) - the ratio is always winner / loser"""
+    n = first.shape[0]
+    first_wins = np.empty(n, dtype=np.bool_)
+    strength_ratio = np.empty(n, dtype=np.float64)
+    strength = np.empty(2, dtype=np.float64)
+    for k in range(n):
+        for side in range(2):
+            i = first[k] if side == 0 else second[k]
+            # military strength based on population, technology and traits, with some randomness
+            value = population[i] * (1 + technology[i] / 500)
+            if trait_mask[i] & aggressive_bit:
+                value *= 1.3  # 30% bonus for aggressive civs (increased from 20%)
+            if trait_mask[i] & peaceful_bit:
+                value *= 0.7  # 30% penalty for peaceful civs (increased from 20%)
+            strength[side] = value * noise[k, side]
+        
+        first_wins[k] = strength[0] > strength[1]
+        if first_wins[k]:
+            strength_ratio[k] = strength[0] / strength[1]
+        else:
+            strength_ratio[k] = strength[1] / strength[0]
+    return first_wins, strength_ratio
+
 
 class Simulation:
+    # trait pairs that clash when two civs meet
+    _OPPOSED_TRAITS = (
+        (CivilizationTrait.AGGRESSIVE, CivilizationTrait.PEACEFUL),
+        (CivilizationTrait.EXPANSIONIST, CivilizationTrait.ISOLATIONIST),
+    )
+
     def __init__(self, world):
         self.world = world
         self.tick_count = 0
         self.event_logger = EventLogger()
         self.year = 0  # each tick is a year
-        self.history = []  # store world state snapshots for history
+        self._history = CivilizationHistory()  # world state snapshots, see the history property
+        
+        # one background worker for history snapshots and save-file writes (runs them in order)
+        self._snapshot_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_snapshot = None
+        self._pending_save = None
         self.paused = False
         
-        # major event tracking
-        self.major_events = []
+        # major event tracking - bounded, one tick can't pile up more than this
+        self.major_events = deque(maxlen=256)
         self.auto_pause_on_events = True  # can be toggled by the user
         self.max_civilizations = 7 # max number of civs allowed
+        
+        # numpy generator for batched random draws, seeded off random so seeded runs repeat
+        self._rng = np.random.default_rng(random.getrandbits(64))
+
+        # compile the kernels now rather than mid-game (no-op without numba)
+        _compute_damage(np.ones(1), np.ones(1), np.ones(1), 1.0)
+        _battle_outcomes(np.ones(1), np.ones(1), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                         np.zeros(1, dtype=np.int64), np.ones((1, 2)), 1, 2)
+    
+    @property
+    def history(self):
+        """snapshots as a list of {"year", "civilizations"} dicts, rebuilt from the columnar store"""
+        self._wait_for_snapshot()
+        return self._history.snapshots()
+    
+    @history.setter
+    def history(self, snapshots):
+        self._wait_for_snapshot()
+        if isinstance(snapshots, CivilizationHistory):
+            self._history = snapshots
+        else:
+            self._history = CivilizationHistory.from_snapshots(snapshots, self.max_civilizations)
     
     def initialize(self, num_civs=5):
         """initialize the simulation with a number of civilizations"""
@@ -53,8 +143,8 @@ class Simulation:
         self.tick_count += 1
         self.year += 1
         
-        # clear the major events list from previous tick
-        self.major_events = []
+        # clear the major events list from previous tick (reuses the same deque)
+        self.major_events.clear()
         
         # debug info about current civs (but not too frequently)
         if self.tick_count % 50 == 0:
@@ -68,56 +158,60 @@ class Simulation:
         # remove collapsed civs before processing updates
         self._remove_collapsed_civilizations()
         
+        civs = self.world.civilizations
+        
         # performance optimization: process civs in chunks
         # (each civ gets updated every turn, but not all civ tasks run every turn)
-        civs_per_chunk = max(1, len(self.world.civilizations) // 3)
+        # (ceil so every civ lands in one of the three chunks)
+        civs_per_chunk = max(1, math.ceil(len(civs) / 3))
         chunk_start = (self.tick_count % 3) * civs_per_chunk
-        chunk_end = min(chunk_start + civs_per_chunk, len(self.world.civilizations))
+        chunk_end = min(chunk_start + civs_per_chunk, len(civs))
+        full_update_civs = civs[chunk_start:chunk_end]
+        basic_update_civs = civs[:chunk_start] + civs[chunk_end:]
         
         # full civ processing (expensive operations split across turns)
-        for i, civ in enumerate(self.world.civilizations[chunk_start:chunk_end]):
+        for civ in full_update_civs:
             # full update with territory expansion, etc.
             civ.tick(full_update=True)
             
-            # record significant events
-            if len(civ.event_log) > 0:
-                for event in civ.event_log:
-                    if event["tick"] == civ.age:  # only process new events
-                        event_desc = f"{civ.name}: {event['description']}"
-                        self.event_logger.add_event(self.year, event_desc)
-                        
-                        # check if this is a major event that should trigger pause and notification
-                        # only include truly important events to reduce spam
-                        if any(keyword in event['description'].lower() for keyword in 
-                              ["collapsed", "war declared", "conquered", "established", "unified", "first contact"]):
-                            # skip minor population changes to reduce notification spam
-                            if "population" in event['description'].lower() and "significantly" in event['description'].lower():
-                                # only notify for truly large population changes
-                                if "increased" in event['description'].lower():
-                                    if "+5000" not in event['description']:  # only notify for huge increases
-                                        continue
-                                elif "decreased" in event['description'].lower():
-                                    if "-3000" not in event['description']:  # only notify for huge decreases
-                                        continue
-                                        
-                            self.major_events.append({
-                                "title": f"Major Event in {civ.name}",
-                                "message": event['description'],
-                                "civ": civ
-                            })
+            # record significant events (only entries added since we last looked)
+            new_events = civ.event_log[civ._event_log_hwm:]
+            civ._event_log_hwm = len(civ.event_log)
+            for event in new_events:
+                if event["tick"] != civ.age:  # only process events from this tick
+                    continue
+                description = event['description']
+                event_desc = f"{civ.name}: {description}"
+                self.event_logger.add_event(self.year, event_desc)
+                
+                # check if this is a major event that should trigger pause and notification
+                # only include truly important events to reduce spam
+                if _MAJOR_RE.search(description):
+                    # skip minor population changes to reduce notification spam
+                    population_change = _POPULATION_CHANGE_RE.match(description)
+                    if population_change:
+                        # only notify for truly large population changes
+                        if population_change.group(1).lower() == "increased":
+                            if "+5000" not in description:  # only notify for huge increases
+                                continue
+                        elif "-3000" not in description:  # only notify for huge decreases
+                            continue
+                                
+                    self.major_events.append(MajorEvent(
+                        title=f"Major Event in {civ.name}",
+                        message=description,
+                        civ=civ
+                    ))
         
         # basic updates for all civs (always run)
-        for civ in self.world.civilizations:
-            if chunk_start <= self.world.civilizations.index(civ) < chunk_end:
-                # skip civs that got a full update already
-                continue
-            
+        # (civs that got a full update already are left out)
+        for civ in basic_update_civs:
             # basic update (resources, population only)
             civ.tick(full_update=False)
         
         # add protection check here to prevent young civs from dying
         for civ in self.world.civilizations:
-            if hasattr(civ, 'protected_until_tick') and self.tick_count < civ.protected_until_tick:
+            if civ.protected_until_tick is not None and self.tick_count < civ.protected_until_tick:
                 # make sure protected civs have enough resources
                 if civ.resources["food"] < 100:
                     civ.resources["food"] = 100
@@ -141,11 +235,15 @@ class Simulation:
     
     def _save_history_snapshot(self):
         """save a snapshot of the current world state"""
-        snapshot = {
-            "year": self.year,
-            "civilizations": [civ.get_status() for civ in self.world.civilizations]
-        }
-        self.history.append(snapshot)
+        # copy the numbers out now, fill them into the store on the worker thread
+        frame = self._history.capture(self.year, self.world.civilizations)
+        self._pending_snapshot = self._snapshot_pool.submit(self._history.store, frame)
+    
+    def _wait_for_snapshot(self):
+        """block until the last queued history snapshot has been stored"""
+        if self._pending_snapshot is not None:
+            self._pending_snapshot.result()
+            self._pending_snapshot = None
     
     def _check_global_events(self):
         """check for global events that affect multiple civilizations"""
@@ -166,15 +264,16 @@ class Simulation:
         y = random.randint(0, self.world.height - 1)
         radius = random.randint(3, 8)  # affected area radius
         
-        # find affected civilizations
-        affected_civs_initial = []
+        radius_sq = radius * radius
+        
+        # find affected civilizations (and which of their tiles and cities got hit)
+        hit_counts = self.world.count_owned_in_radius(x, y, radius)
+        affected_tiles = {}
         for civ_candidate in self.world.civilizations:
-            for pos in civ_candidate.territory:
-                dx = abs(pos[0] - x)
-                dy = abs(pos[1] - y)
-                if (dx*dx + dy*dy) <= radius*radius:  # within circle
-                    affected_civs_initial.append(civ_candidate)
-                    break
+            hit_count = hit_counts.get(civ_candidate.index)
+            if hit_count:
+                affected_tiles[civ_candidate] = (hit_count, self._cities_in_radius(civ_candidate, x, y, radius_sq))
+        affected_civs_initial = list(affected_tiles)
         
         if not affected_civs_initial:
             return
@@ -183,6 +282,16 @@ class Simulation:
         event_desc = f"Natural Disaster: {disaster_name} in region around ({x}, {y})"
         self.event_logger.add_event(self.year, event_desc)
 
+        # draw the loss rates for every affected civ in one go
+        loss_ranges = {
+            "earthquake": (0.01, 0.05),
+            "volcanic_eruption": (0.01, 0.05),
+            "drought": (0.3, 0.6),
+            "disease": (0.15, 0.45)
+        }
+        low, high = loss_ranges.get(disaster, (0.0, 0.0))
+        loss_rates = self._rng.uniform(low, high, size=len(affected_civs_initial)).tolist()
+
         # Calculate effects and prepare major event message
         processed_affected_civs = []
         total_population_loss_for_single_civ_message = 0
@@ -191,15 +300,7 @@ class Simulation:
         # The actual effects are applied in the main loop below
         if len(affected_civs_initial) == 1:
             civ = affected_civs_initial[0]
-            temp_affected_territory = 0
-            temp_affected_cities_in_radius = []
-            for pos in civ.territory:
-                dx_pos = abs(pos[0] - x)
-                dy_pos = abs(pos[1] - y)
-                if (dx_pos*dx_pos + dy_pos*dy_pos) <= radius*radius:
-                    temp_affected_territory += 1
-                    if pos in civ.cities:
-                        temp_affected_cities_in_radius.append(pos)
+            temp_affected_territory, temp_affected_cities_in_radius = affected_tiles[civ]
             
             if temp_affected_territory > 0: # Civ must have territory in the disaster zone
                 temp_impact_ratio = temp_affected_territory / max(1, len(civ.territory))
@@ -210,11 +311,11 @@ class Simulation:
                         loss = int(city_pop * 0.05)
                         temp_city_pop_loss += loss
                     non_city_population = civ.population - sum(c["population"] for c in civ.cities.values())
-                    temp_general_pop_loss = int(non_city_population * temp_impact_ratio * random.uniform(0.01, 0.05))
+                    temp_general_pop_loss = int(non_city_population * temp_impact_ratio * loss_rates[0])
                     total_population_loss_for_single_civ_message = temp_city_pop_loss + temp_general_pop_loss
                 elif disaster == "disease":
                     tech_factor = max(0.1, 1 - (civ.technology / 150.0))
-                    base_disease_impact = random.uniform(0.15, 0.45)
+                    base_disease_impact = loss_rates[0]
                     final_disease_impact = base_disease_impact * tech_factor
                     total_population_loss_for_single_civ_message = int(civ.population * final_disease_impact * temp_impact_ratio)
                 # Drought doesn't directly cause population loss in this calculation, so message remains generic or indicates 0 loss.
@@ -235,23 +336,15 @@ class Simulation:
         else: # Multiple civs or single civ with no direct population loss reported (e.g. flood if not implemented for pop loss)
             major_event_message = f"A {disaster_name.lower()} has struck near ({x}, {y}), affecting {len(affected_civs_initial)} civilizations."
 
-        self.major_events.append({
-            "title": f"Natural Disaster: {disaster_name}",
-            "message": major_event_message,
-            "civ": affected_civs_initial[0] if affected_civs_initial else None
-        })
+        self.major_events.append(MajorEvent(
+            title=f"Natural Disaster: {disaster_name}",
+            message=major_event_message,
+            civ=affected_civs_initial[0] if affected_civs_initial else None
+        ))
         
         # Apply actual disaster effects
-        for civ in affected_civs_initial: # Iterate over the originally identified list
-            affected_territory = 0
-            affected_cities_in_radius = []
-            for pos in civ.territory:
-                dx = abs(pos[0] - x)
-                dy = abs(pos[1] - y)
-                if (dx*dx + dy*dy) <= radius*radius:
-                    affected_territory += 1
-                    if pos in civ.cities:
-                        affected_cities_in_radius.append(pos)
+        for civ, loss_rate in zip(affected_civs_initial, loss_rates): # Iterate over the originally identified list
+            affected_territory, affected_cities_in_radius = affected_tiles[civ]
             
             impact_ratio = affected_territory / max(1, len(civ.territory))
             total_population_loss_from_disaster = 0 # Reset for each civ
@@ -269,13 +362,14 @@ class Simulation:
                 # Also apply some general territory-based population loss outside of cities
                 # but ensure not to double-count city losses
                 non_city_population = civ.population - sum(c["population"] for c in civ.cities.values())
-                general_pop_loss = int(non_city_population * impact_ratio * random.uniform(0.01, 0.05)) # Smaller impact outside cities
+                general_pop_loss = int(non_city_population * impact_ratio * loss_rate) # Smaller impact outside cities
                 total_population_loss_from_disaster = city_population_loss + general_pop_loss
                 civ.population = max(10, civ.population - total_population_loss_from_disaster)
                 
                 # Resources are also affected, especially in cities
-                for resource in civ.resources:
-                    civ.resources[resource] *= (1 - impact_ratio * random.uniform(0.1, 0.3))
+                factors = 1 - impact_ratio * self._rng.uniform(0.1, 0.3, size=len(civ.resources))
+                civ.resources = {resource: amount * factor
+                                 for (resource, amount), factor in zip(civ.resources.items(), factors.tolist())}
                 
                 self.event_logger.add_event(
                     self.year, 
@@ -284,7 +378,7 @@ class Simulation:
             
             elif disaster == "drought":
                 # mainly affects food
-                food_loss = civ.resources["food"] * impact_ratio * random.uniform(0.3, 0.6)
+                food_loss = civ.resources["food"] * impact_ratio * loss_rate
                 civ.resources["food"] = max(10, civ.resources["food"] - food_loss)
                 
                 self.event_logger.add_event(
@@ -297,7 +391,7 @@ class Simulation:
                 # Higher tech level means better healthcare, sanitation, and response
                 tech_factor = max(0.1, 1 - (civ.technology / 150.0)) # Scale so high tech (e.g. 150+) greatly reduces impact
                 # Base impact of disease, further modified by tech
-                base_disease_impact = random.uniform(0.15, 0.45) 
+                base_disease_impact = loss_rate
                 final_disease_impact = base_disease_impact * tech_factor
                 
                 population_loss = int(civ.population * final_disease_impact * impact_ratio) # impact_ratio for regional effect
@@ -309,13 +403,25 @@ class Simulation:
                     f"{civ.name} lost {total_population_loss_from_disaster} population to {disaster_name}. Tech level {civ.technology:.1f} influenced severity."
                 )
     
+    def _cities_in_radius(self, civ, x, y, radius_sq):
+        """a civ's cities (on its own territory) within sqrt(radius_sq) of (x, y)"""
+        territory = civ.territory
+        hit = []
+        for pos in civ.cities:
+            px, py = pos
+            dx = px - x
+            dy = py - y
+            if dx * dx + dy * dy <= radius_sq and pos in territory:
+                hit.append(pos)
+        return hit
+    
     def _check_civilization_collapse(self):
         """check and handle civilization collapse"""
         collapsed = []
         
         for civ in self.world.civilizations:
             # skip newly created civilizations in their grace period
-            if hasattr(civ, 'protected_until_tick') and self.tick_count < civ.protected_until_tick:
+            if civ.protected_until_tick is not None and self.tick_count < civ.protected_until_tick:
                 # debug output for protected civilizations
                 if self.tick_count % 10 == 0:
                     years_left = civ.protected_until_tick - self.tick_count
@@ -353,15 +459,18 @@ class Simulation:
                 collapsed.append(civ)
                 
                 # add to major events for notification
-                self.major_events.append({
-                    "title": "Civilization Collapsed!",
-                    "message": collapse_event,
-                    "civ": civ # pass the collapsed civ object
-                })
-        
-        # remove collapsed civilizations
-        for civ in collapsed:
-            self.world.civilizations.remove(civ)
+                self.major_events.append(MajorEvent(
+                    title="Civilization Collapsed!",
+                    message=collapse_event,
+                    civ=civ # pass the collapsed civ object
+                ))
+        
+        # remove collapsed civilizations in one pass (keeps the same list object)
+        if collapsed:
+            collapsed = set(collapsed)
+            self.world.civilizations[:] = [civ for civ in self.world.civilizations if civ not in collapsed]
+            for civ in collapsed:
+                self.world.forget_civilization(civ)
     
     def add_civilization(self, position=None):
         """Add a new civilization, respecting the maximum limit."""
@@ -391,15 +500,19 @@ class Simulation:
         print(f"  - {new_civ.name} is protected for 20 years.")
 
         # Add to major events for notification
-        self.major_events.append({
-            "title": "New Civilization Founded!",
-            "message": f"{new_civ.name} has been established by divine intervention.",
-            "civ": new_civ
-        })
+        self.major_events.append(MajorEvent(
+            title="New Civilization Founded!",
+            message=f"{new_civ.name} has been established by divine intervention.",
+            civ=new_civ
+        ))
         return new_civ
     
     def save_state(self, filename=None):
-        """Save the current simulation state"""
+        """Save the current simulation state
+        The file is written on a worker thread, so (True, filename) means the save was queued,
+        not that it's on disk yet - save_result() reports how the write went"""
+        import pickle  # only needed when saving/loading, keeps module import light
+        
         try:
             # Generate filename with simulation name if not provided
             if filename is None:
@@ -410,12 +523,19 @@ class Simulation:
             if not filename.endswith('.pickle'):
                 filename = f"{filename}.pickle"
             
+            # The event log lives in a jsonl file next to the save that grows as events happen,
+            # so saving only has to note how far into it this save goes
+            self.event_logger.open_stream(f"data/events_{filename[:-len('.pickle')]}.jsonl")
+            
+            self._wait_for_snapshot()
+            
             # Create comprehensive save data
             save_data = {
                 "tick_count": self.tick_count,
                 "year": self.year,
-                "event_log": self.event_logger.get_all_events(),
-                "history": self.history,
+                "event_log_path": self.event_logger.stream_path,
+                "event_log_offset": self.event_logger.stream_offset(),
+                "history": self._history,
                 "world_data": {
                     "width": self.world.width,
                     "height": self.world.height,
@@ -433,7 +553,7 @@ class Simulation:
                     "id": civ.id,
                     "name": civ.name,
                     "position": civ.position,
-                    "territory": list(civ.territory),
+                    "territory": civ.territory_xy().astype(np.int16),  # packed (N, 2) x, y
                     "cities": civ.cities,
                     "population": civ.population,
                     "resources": civ.resources,
@@ -446,29 +566,22 @@ class Simulation:
                         "values": civ.belief_system.values,
                         "foreign_stance": civ.belief_system.foreign_stance
                     },
-                    "relations": civ.relations
+                    "relations": dict(civ.relations)
                 }
                 
                 # Check for war state
-                if hasattr(civ, 'at_war_with'):
-                    civ_data["at_war_with"] = civ.at_war_with
+                civ_data["at_war_with"] = civ.at_war_with
                 
                 # Check for protection status
-                if hasattr(civ, 'protected_until_tick'):
+                if civ.protected_until_tick is not None:
                     civ_data["protected_until_tick"] = civ.protected_until_tick
                 
                 save_data["civilizations"].append(civ_data)
             
-            # Save the data to file
-            with open(f"data/{filename}", "wb") as f:
-                pickle.dump(save_data, f)
-                
-            # Also save a readable event log as JSON
-            log_filename = f"data/event_log_{self.name if hasattr(self, 'name') else 'simulation'}_{int(time.time())}.json"
-            with open(log_filename, "w") as f:
-                json.dump(self.event_logger.get_all_events(), f, indent=2)
-                
-            print(f"Game saved successfully as '{filename}'")
+            # Pickle here while the state can't change under us, then compress and
+            # write it to disk on the worker so the game doesn't hitch
+            payload = pickle.dumps(save_data, protocol=pickle.HIGHEST_PROTOCOL)
+            self._pending_save = self._snapshot_pool.submit(self._write_save, f"data/{filename}", payload)
             return True, filename
             
         except Exception as e:
@@ -476,21 +589,55 @@ class Simulation:
             print(error_msg)
             return False, error_msg
     
+    def _write_save(self, path, payload):
+        """compress and write a pickled save (runs on the worker thread) - returns (success, message)"""
+        import gzip
+        
+        try:
+            # gzip level 1 is nearly free and shrinks saves a lot
+            with open(path, "wb") as f:
+                f.write(gzip.compress(payload, compresslevel=1))
+            print(f"Game saved successfully as '{os.path.basename(path)}'")
+            return True, os.path.basename(path)
+        except Exception as e:
+            print(f"Error saving game: {str(e)}")
+            return False, str(e)
+    
+    def save_result(self):
+        """(success, message) for the last queued save once it has been written, or None while
+        it's still being written (or there's nothing new to report) - each save is reported once"""
+        if self._pending_save is None or not self._pending_save.done():
+            return None
+        future, self._pending_save = self._pending_save, None
+        return future.result()
+    
     def load_state(self, filename):
         """Load a simulation state"""
+        import gzip, pickle
+        
+        # make sure a save we just queued has actually hit the disk
+        if self._pending_save is not None:
+            self._pending_save.result()
+            self._pending_save = None
+        
         try:
             # Ensure filename has .pickle extension
             if not filename.endswith('.pickle'):
                 filename = f"{filename}.pickle"
                 
-            # Load the save data
+            # Load the save data (older saves were written without gzip)
             with open(f"data/{filename}", "rb") as f:
+                compressed = f.read(2) == b"\x1f\x8b"
+            with (gzip.open if compressed else open)(f"data/{filename}", "rb") as f:
                 save_data = pickle.load(f)
             
             # Restore simulation state
             self.tick_count = save_data["tick_count"]
             self.year = save_data["year"]
-            self.event_logger.set_events(save_data["event_log"])
+            if "event_log_path" in save_data:
+                self.event_logger.load_stream(save_data["event_log_path"], save_data["event_log_offset"])
+            else:
+                self.event_logger.set_events(save_data["event_log"])  # older saves kept the whole log
             self.history = save_data["history"]
             
             # Restore auto-pause setting if available
@@ -511,11 +658,9 @@ class Simulation:
                     print("Warning: World dimensions in save file do not match current world. Using current terrain.")
             
             # Clear current civilizations
-            self.world.civilizations = []
+            self.world.clear_civilizations()
             
             # Restore civilizations
-            from src.civilization import Civilization, BeliefSystem
-            
             for civ_data in save_data["civilizations"]:
                 # Create a new civilization object
                 civ = Civilization(self.world, skip_init=True)
@@ -524,7 +669,11 @@ class Simulation:
                 civ.id = civ_data["id"]
                 civ.name = civ_data["name"]
                 civ.position = civ_data["position"]
-                civ.territory = set(civ_data["territory"])
+                territory = civ_data["territory"]
+                if isinstance(territory, np.ndarray):
+                    # two bulk tolist() calls instead of converting each row separately
+                    territory = zip(territory[:, 0].tolist(), territory[:, 1].tolist())
+                civ.territory = set(territory)
                 civ.cities = civ_data["cities"]
                 civ.population = civ_data["population"]
                 civ.resources = civ_data["resources"]
@@ -532,6 +681,7 @@ class Simulation:
                 civ.traits = civ_data["traits"]
                 civ.age = civ_data["age"]
                 civ.event_log = civ_data["event_log"]
+                civ._event_log_hwm = len(civ.event_log)  # saved events were already processed
                 
                 # Restore belief system
                 belief_data = civ_data["belief_system"]
@@ -539,9 +689,6 @@ class Simulation:
                 civ.belief_system.values = belief_data["values"]
                 civ.belief_system.foreign_stance = belief_data["foreign_stance"]
                 
-                # Restore relations
-                civ.relations = civ_data["relations"]
-                
                 # Restore war state if present
                 if "at_war_with" in civ_data:
                     civ.at_war_with = civ_data["at_war_with"]
@@ -551,7 +698,10 @@ class Simulation:
                     civ.protected_until_tick = civ_data["protected_until_tick"]
                 
                 # Add the civilization to the world
-                self.world.civilizations.append(civ)
+                self.world.add_civilization(civ)
+                
+                # Restore relations (needs the civ's index, so after it joins the world)
+                civ.relations = civ_data["relations"]
             
             print(f"Game loaded successfully from '{filename}'")
             print(f"Year: {self.year}, Civilizations: {len(self.world.civilizations)}")
@@ -577,10 +727,10 @@ class Simulation:
             # Get a position if not specified
             if position is None:
                 if target_civ:
-                    # Use civ's territory center
-                    territory_positions = list(target_civ.territory)
-                    if territory_positions:
-                        position = random.choice(territory_positions)
+                    # Use a random tile of the civ's territory (picked from the cached array, no list copy)
+                    territory_xy = target_civ.territory_xy()
+                    if len(territory_xy):
+                        position = tuple(territory_xy[random.randrange(len(territory_xy))].tolist())
                     else:
                         position = target_civ.position
                 else:
@@ -601,48 +751,48 @@ class Simulation:
             affected_civs_for_notification = []
             total_pop_loss_for_notification = 0
 
-            # Apply effects to civilizations in the radius
-            for civ in list(self.world.civilizations): # Iterate over a copy in case a civ collapses
-                # Calculate distance from civ's core to disaster center
-                # Or check overlap with territory for more accuracy
-                affected_territory_count = 0
-                if not civ.territory: # Skip if civ has no territory (e.g. just created)
-                    continue
+            affected_ratios = []
+
+            # Find civilizations with territory in the radius
+            hit_counts = self.world.count_owned_in_radius(x, y, radius)
+            for civ in self.world.civilizations:
+                affected_territory_count = hit_counts.get(civ.index, 0)
+                if affected_territory_count > 0:
+                    affected_civs_for_notification.append(civ)
+                    affected_ratios.append(affected_territory_count / max(1, len(civ.territory)))
+            
+            if affected_civs_for_notification:
+                # Work out the damage for every affected civ in one go
+                affected = affected_civs_for_notification
+                populations = [civ.population for civ in affected]
+                pop_arr = np.array(populations, dtype=np.float64)
+                ratio_arr = np.array(affected_ratios)
+                base_rate_arr = self._rng.uniform(0.1, 0.3, size=len(affected))
+                loss_arr, rate_arr = _compute_damage(pop_arr, ratio_arr, base_rate_arr, float(magnitude))
+                resource_damage_arr = rate_arr * self._rng.uniform(0.3, 0.7, size=len(affected))
                 
-                for tile_pos in civ.territory:
-                    dist_sq = (tile_pos[0] - x)**2 + (tile_pos[1] - y)**2
-                    if dist_sq <= radius**2:
-                        affected_territory_count += 1
+                # loop-invariant bits pulled out as locals
+                add_event = self.event_logger.add_event
+                year = self.year
+                disaster_label = specific_disaster.replace('_', ' ')
                 
-                if affected_territory_count > 0:
-                    # This civ is affected
-                    if civ not in affected_civs_for_notification:
-                        affected_civs_for_notification.append(civ)
-
-                    damage_rate = random.uniform(0.1, 0.3) * magnitude * (affected_territory_count / max(1,len(civ.territory)))
-                    damage_rate = min(damage_rate, 0.9) # Cap damage at 90%
-                    
-                    population_loss = int(civ.population * damage_rate)
-                    civ.population = max(1, civ.population - population_loss)
+                for civ, population, population_loss, resource_damage in zip(
+                        affected, populations, loss_arr.tolist(), resource_damage_arr.tolist()):
+                    civ.population = max(1, population - population_loss)
                     total_pop_loss_for_notification += population_loss
                     
-                    resource_damage = damage_rate * random.uniform(0.3, 0.7)
-                    for resource in civ.resources:
-                        civ.resources[resource] *= (1 - resource_damage)
-                        civ.resources[resource] = max(0, civ.resources[resource])
+                    keep = 1 - resource_damage
+                    civ.resources = {resource: max(0, amount * keep) for resource, amount in civ.resources.items()}
                     
-                    self.event_logger.add_event(
-                        self.year, 
-                        f"{civ.name} lost {population_loss} people and resources to divine {specific_disaster.replace('_', ' ')}."
-                    )
+                    add_event(year, f"{civ.name} lost {population_loss} people and resources to divine {disaster_label}.")
             
             # Always add to major events for God Mode triggered disasters
             affected_civ_names = ", ".join([c.name for c in affected_civs_for_notification]) if affected_civs_for_notification else "No civilizations"
-            self.major_events.append({
-                "title": f"Divine Disaster: {disaster_name_formatted}",
-                "message": f"A divinely invoked {specific_disaster.lower()} struck near ({x},{y}). {affected_civ_names} affected. Total population lost: {total_pop_loss_for_notification}.",
-                "civ": affected_civs_for_notification[0] if affected_civs_for_notification else None # Primary civ for highlight
-            })
+            self.major_events.append(MajorEvent(
+                title=f"Divine Disaster: {disaster_name_formatted}",
+                message=f"A divinely invoked {specific_disaster.lower()} struck near ({x},{y}). {affected_civ_names} affected. Total population lost: {total_pop_loss_for_notification}.",
+                civ=affected_civs_for_notification[0] if affected_civs_for_notification else None # Primary civ for highlight
+            ))
         
         elif event_type == "blessing":
             if target_civ:
@@ -650,12 +800,13 @@ class Simulation:
                 boost = magnitude * random.uniform(0.2, 0.5)
                 
                 # Population boost
-                population_increase = int(target_civ.population * boost)
-                target_civ.population += population_increase
+                population = target_civ.population
+                population_increase = int(population * boost)
+                target_civ.population = population + population_increase
                 
                 # Resource boost
-                for resource in target_civ.resources:
-                    target_civ.resources[resource] *= (1 + boost)
+                target_civ.resources = {resource: amount * (1 + boost)
+                                        for resource, amount in target_civ.resources.items()}
                 
                 self.event_logger.add_event(
                     self.year, 
@@ -679,9 +830,6 @@ class Simulation:
         
         elif event_type == "shift_ideology":
             if target_civ:
-                from src.civilization import BeliefSystem # Assuming BeliefSystem() is the random generator
-                from src.civilization import CivilizationTrait # Import for re-rolling traits
-                
                 old_belief_name = target_civ.belief_system.name
                 old_traits = list(target_civ.traits) # Save for the message
 
@@ -693,11 +841,13 @@ class Simulation:
 
                 # 3. Reset relations with all other civilizations to neutral or slightly random
                 for other_civ_id in list(target_civ.relations.keys()): # Iterate over a copy of keys
-                    target_civ.relations[other_civ_id] = random.uniform(-0.1, 0.1) # Reset to near neutral
+                    relation = random.uniform(-0.1, 0.1) # Reset to near neutral
                     # Also update the other civ's relation towards this civ
-                    other_civ_obj = next((c for c in self.world.civilizations if c.id == other_civ_id), None)
+                    other_civ_obj = self.world.civs_by_id.get(other_civ_id)
                     if other_civ_obj:
-                        other_civ_obj.relations[target_civ.id] = target_civ.relations[other_civ_id]
+                        self.world.set_relation(target_civ.index, other_civ_obj.index, relation)
+                    else:
+                        target_civ.relations[other_civ_id] = relation
                 
                 # Log the event
                 self.event_logger.add_event(
@@ -706,31 +856,32 @@ class Simulation:
                 )
                 
                 # Add a notification for the user
-                self.major_events.append({
-                    "title": f"Total Metamorphosis in {target_civ.name}",
-                    "message": f"{target_civ.name} has been entirely reshaped: New Belief is '{target_civ.belief_system.name}', new traits: {', '.join(target_civ.traits)}. All diplomatic ties reset.",
-                    "civ": target_civ
-                })
+                self.major_events.append(MajorEvent(
+                    title=f"Total Metamorphosis in {target_civ.name}",
+                    message=f"{target_civ.name} has been entirely reshaped: New Belief is '{target_civ.belief_system.name}', new traits: {', '.join(target_civ.traits)}. All diplomatic ties reset.",
+                    civ=target_civ
+                ))
         
         elif event_type == "war_influence":
             if target_civ:
                 target_civ.permanently_hostile_to_all = True
                 # Also make their current relations very poor to kickstart conflicts
-                for other_civ_id in list(target_civ.relations.keys()):
-                    target_civ.relations[other_civ_id] = -0.9
-                    other_civ_obj = next((c for c in self.world.civilizations if c.id == other_civ_id), None)
-                    if other_civ_obj:
-                        other_civ_obj.relations[target_civ.id] = -0.9
+                # (whole row of the relation matrix at once, plus the column for civs still around)
+                matrix = self.world.relation_matrix
+                met = np.flatnonzero(~np.isnan(matrix[target_civ.index]))
+                matrix[target_civ.index, met] = -0.9
+                alive = [index for index in met.tolist() if index in self.world.civs_by_index]
+                matrix[alive, target_civ.index] = -0.9
                 
                 self.event_logger.add_event(
                     self.year, 
                     f"GOD EVENT: {target_civ.name} has been divinely influenced to be permanently hostile and seek war with all other civilizations!"
                 )
-                self.major_events.append({
-                    "title": f"{target_civ.name} Doomed to Eternal War!",
-                    "message": f"{target_civ.name} is now compelled by divine will to wage war on any civilization it encounters.",
-                    "civ": target_civ
-                })
+                self.major_events.append(MajorEvent(
+                    title=f"{target_civ.name} Doomed to Eternal War!",
+                    message=f"{target_civ.name} is now compelled by divine will to wage war on any civilization it encounters.",
+                    civ=target_civ
+                ))
             else:
                  # If no target_civ, this event might not make sense or could pick a random one.
                  # For now, we'll assume it requires a target.
@@ -759,51 +910,49 @@ class Simulation:
     
     def _process_wars_and_battles(self):
         """Process ongoing wars and resolve battles between civilizations"""
-        # Track civilizations that should be marked as collapsed after all processing
-        civilizations_to_collapse = []
+        civs_by_id = self.world.civs_by_id
+        battles = []  # (civ1, civ2) pairs fighting this tick, resolved together at the end
+        ended_wars = defaultdict(set)  # civ -> enemy ids to drop, applied after the loop
+        
+        # who borders whom - one lookup for the whole pass (battles only happen after the loop,
+        # so the borders can't move under us)
+        neighbours = self.world.neighbour_indices()
         
         # Process each civilization
         for civ in self.world.civilizations:
             # Skip civilizations that are already marked for collapse
-            if hasattr(civ, 'has_collapsed') and civ.has_collapsed:
+            if civ.has_collapsed:
                 continue
                 
             # Skip civilizations that aren't at war
-            if not hasattr(civ, 'at_war_with') or not civ.at_war_with:
+            if not civ.at_war_with:
                 continue
             
             # Process each war this civilization is involved in
-            wars_to_remove = set()
             for enemy_id in civ.at_war_with:
                 # Find the enemy civilization
-                enemy_civ = None
-                for other_civ in self.world.civilizations:
-                    if other_civ.id == enemy_id:
-                        enemy_civ = other_civ
-                        break
+                enemy_civ = civs_by_id.get(enemy_id)
                 
-                if not enemy_civ or hasattr(enemy_civ, 'has_collapsed') and enemy_civ.has_collapsed:
+                if not enemy_civ or enemy_civ.has_collapsed:
                     # Enemy no longer exists or has collapsed, remove from war list
-                    wars_to_remove.add(enemy_id)
+                    ended_wars[civ].add(enemy_id)
                     continue
                 
                 # Only process the battle from one side to avoid duplicates
                 if civ.id < enemy_id:
                     # Check if territories are adjacent (battles only occur at borders)
-                    if civ._territories_adjacent(enemy_civ):
-                        self._resolve_battle(civ, enemy_civ)
+                    if enemy_civ.index in neighbours.get(civ.index, ()):
+                        battles.append((civ, enemy_civ))
                     
                     # Random chance for peace treaty or continued conflict
                     if random.random() < 0.05:  # 5% chance per tick to end war
                         # End the war from both sides
-                        wars_to_remove.add(enemy_id)
-                        if hasattr(enemy_civ, 'at_war_with'):
-                            enemy_civ.at_war_with.discard(civ.id)
+                        ended_wars[civ].add(enemy_id)
+                        ended_wars[enemy_civ].add(civ.id)
                         
                         # Improve relations slightly when peace is made
                         peace_relation = -0.5 + random.random() * 0.3  # -0.5 to -0.2
-                        civ.relations[enemy_id] = peace_relation
-                        enemy_civ.relations[civ.id] = peace_relation
+                        self.world.set_relation(civ.index, enemy_civ.index, peace_relation)
                         
                         # Log peace event
                         peace_message = f"Peace treaty signed between {civ.name} and {enemy_civ.name}"
@@ -811,96 +960,92 @@ class Simulation:
                         enemy_civ._add_event(peace_message)
                         
                         # Add to major events
-                        self.major_events.append({
-                            "title": "Peace Treaty",
-                            "message": peace_message,
-                            "civ": civ
-                        })
-            
-            # Remove wars that have ended
-            if hasattr(civ, 'at_war_with'):
-                civ.at_war_with -= wars_to_remove
+                        self.major_events.append(MajorEvent(
+                            title="Peace Treaty",
+                            message=peace_message,
+                            civ=civ
+                        ))
         
-        # Remove civilizations marked for collapse
-        for civ in civilizations_to_collapse:
-            civ.has_collapsed = True
+        # Remove wars that have ended, one bulk update per civ
+        for civ, enemy_ids in ended_wars.items():
+            civ.at_war_with.difference_update(enemy_ids)
+        
+        if battles:
+            self._resolve_battles(battles)
     
-    def _resolve_battle(self, civ1, civ2):
-        """Resolve a battle between two civilizations"""
-        # Calculate military strength based on population, technology and traits
-        strength1 = civ1.population * (1 + civ1.technology / 500)
-        strength2 = civ2.population * (1 + civ2.technology / 500)
-        
-        # Adjust for traits
-        if civ1._has_trait(CivilizationTrait.AGGRESSIVE):
-            strength1 *= 1.3  # 30% bonus for aggressive civs (increased from 20%)
-        if civ2._has_trait(CivilizationTrait.AGGRESSIVE):
-            strength2 *= 1.3
-            
-        if civ1._has_trait(CivilizationTrait.PEACEFUL):
-            strength1 *= 0.7  # 30% penalty for peaceful civs (increased from 20%)
-        if civ2._has_trait(CivilizationTrait.PEACEFUL):
-            strength2 *= 0.7
-        
-        # Add some randomness
-        strength1 *= random.uniform(0.8, 1.2)
-        strength2 *= random.uniform(0.8, 1.2)
-        
-        # Determine winner
-        if strength1 > strength2:
-            winner = civ1
-            loser = civ2
-            strength_ratio = strength1 / strength2
-        else:
-            winner = civ2
-            loser = civ1
-            strength_ratio = strength2 / strength1
+    def _resolve_battles(self, battles):
+        """Resolve this tick's battles - the strength math for all of them is done in one go"""
+        n = len(battles)
+        
+        # pack everyone fighting this tick into rows (a civ can be in several battles)
+        fighters = list(dict.fromkeys(civ for battle in battles for civ in battle))
+        row = {civ: i for i, civ in enumerate(fighters)}
+        count = len(fighters)
+        population = np.fromiter((civ.population for civ in fighters), np.float64, count)
+        technology = np.fromiter((civ.technology for civ in fighters), np.float64, count)
+        trait_mask = np.fromiter((civ.trait_mask for civ in fighters), np.int64, count)
+        first = np.fromiter((row[civ1] for civ1, _ in battles), np.int64, n)
+        second = np.fromiter((row[civ2] for _, civ2 in battles), np.int64, n)
+        
+        # Determine winners
+        first_wins, strength_ratio = _battle_outcomes(
+            population, technology, trait_mask, first, second, self._rng.uniform(0.8, 1.2, (n, 2)),
+            CivilizationTrait.BITS[CivilizationTrait.AGGRESSIVE], CivilizationTrait.BITS[CivilizationTrait.PEACEFUL]
+        )
         
         # Battle casualties - SIGNIFICANTLY INCREASED
         # War is much more devastating now
-        winner_casualties = int(winner.population * random.uniform(0.03, 0.07))  # 3-7% casualties (increased)
-        loser_casualties = int(loser.population * random.uniform(0.08, 0.15))   # 8-15% casualties (increased)
+        winner_rates = self._rng.uniform(0.03, 0.07, n)  # 3-7% casualties (increased)
+        loser_rates = self._rng.uniform(0.08, 0.15, n)   # 8-15% casualties (increased)
+        
+        # applying results touches territory sets, so that part stays a plain loop
+        for i, (civ1, civ2) in enumerate(battles):
+            # an earlier battle this tick may already have finished one of them off
+            if civ1.has_collapsed or civ2.has_collapsed:
+                continue
+            if first_wins[i]:
+                winner, loser = civ1, civ2
+            else:
+                winner, loser = civ2, civ1
+            self._resolve_battle(winner, loser, float(strength_ratio[i]), winner_rates[i], loser_rates[i])
+    
+    def _resolve_battle(self, winner, loser, strength_ratio, winner_rate, loser_rate):
+        """Apply the outcome of one battle between two civilizations"""
+        winner_population, loser_population = winner.population, loser.population
+        winner_casualties = int(winner_population * winner_rate)
+        loser_casualties = int(loser_population * loser_rate)
         
         # Apply casualties
-        winner.population = max(50, winner.population - winner_casualties)
-        loser.population = max(50, loser.population - loser_casualties)
+        winner.population = max(50, winner_population - winner_casualties)
+        loser.population = max(50, loser_population - loser_casualties)
         
         # Territory changes - more territory changes hands in decisive victories
         territory_gain_count = int(min(10, len(loser.territory) * 0.1 * (strength_ratio - 1)))
         
         if territory_gain_count > 0:
-            # Find territories near the border that can be conquered
-            border_territories = []
-            for pos in loser.territory:
-                x, y = pos
-                # Check if this territory is on the border with the winner
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)]:
-                    neighbor_pos = (x + dx, y + dy)
-                    if neighbor_pos in winner.territory:
-                        border_territories.append(pos)
-                        break
+            # Find territories near the border that can be conquered - only the loser's edge
+            # tiles can touch the winner, so check those against the ownership map
+            border_xy = loser.border_xy()
+            border_territories = list(map(tuple, border_xy[self.world.tiles_touching(border_xy, winner)].tolist()))
             
-            # Take border territories
+            # Take border territories (sample picks them without replacement in one go)
+            # locals for everything the loop touches per tile
             territories_taken = []
-            for _ in range(min(territory_gain_count, len(border_territories))):
-                if border_territories:
-                    pos = random.choice(border_territories)
-                    border_territories.remove(pos)
+            loser_territory, loser_cities, winner_cities = loser.territory, loser.cities, winner.cities
+            remove_tile, add_tile = loser.remove_tile, winner.add_tile
+            count = min(territory_gain_count, len(border_territories))
+            for pos in random.sample(border_territories, count):
+                if pos in loser_territory:
+                    remove_tile(pos)
+                    add_tile(pos)
+                    territories_taken.append(pos)
                     
-                    if pos in loser.territory:
-                        loser.territory.remove(pos)
-                        winner.territory.add(pos)
-                        territories_taken.append(pos)
-                        
-                        # If the position had a city, capture it
-                        if pos in loser.cities:
-                            city_name = loser.cities[pos]["name"]
-                            city_pop = loser.cities[pos]["population"]
-                            
-                            # Reduce population in captured city
-                            reduced_pop = int(city_pop * 0.6)  # 40% population loss in captured city (increased from 30%)
-                            winner.cities[pos] = {"name": city_name, "population": reduced_pop}
-                            del loser.cities[pos]
+                    # If the position had a city, capture it
+                    city = loser_cities.pop(pos, None)
+                    if city is not None:
+                        # Reduce population in captured city
+                        reduced_pop = int(city["population"] * 0.6)  # 40% population loss in captured city (increased from 30%)
+                        winner_cities[pos] = {"name": city["name"], "population": reduced_pop}
             
             # Log battle result
             if territories_taken:
@@ -914,11 +1059,11 @@ class Simulation:
                 loser._add_event(f"Lost battle to {winner.name}, lost {len(territories_taken)} territories")
                 
                 # Add to major events list
-                self.major_events.append({
-                    "title": "Major Battle",
-                    "message": battle_result,
-                    "civ": winner
-                })
+                self.major_events.append(MajorEvent(
+                    title="Major Battle",
+                    message=battle_result,
+                    civ=winner
+                ))
                 
                 # If the loser lost all their cities, they're conquered
                 if not loser.cities:
@@ -930,7 +1075,7 @@ class Simulation:
                     loser.has_collapsed = True
                     
                     # Transfer all remaining territory to the winner
-                    winner.territory = winner.territory.union(loser.territory)
+                    winner.add_tiles(loser.territory)
                     loser.territory = set()
                     
                     # Transfer some population to winner
@@ -939,22 +1084,23 @@ class Simulation:
                     loser.population = 0
                     
                     # Add to major events
-                    self.major_events.append({
-                        "title": "Civilization Conquered",
-                        "message": conquest_message,
-                        "civ": winner
-                    })
+                    self.major_events.append(MajorEvent(
+                        title="Civilization Conquered",
+                        message=conquest_message,
+                        civ=winner
+                    ))
     
     def _remove_collapsed_civilizations(self):
         """Remove collapsed civilizations from the active list"""
         active_civs = []
         
         for civ in self.world.civilizations:
-            if not hasattr(civ, 'has_collapsed') or not civ.has_collapsed:
+            if not civ.has_collapsed:
                 active_civs.append(civ)
             else:
+                self.world.forget_civilization(civ)
                 # Log the collapse if it's new
-                if not hasattr(civ, 'collapse_logged') or not civ.collapse_logged:
+                if not civ.collapse_logged:
                     self.event_logger.add_event(
                         self.year, 
                         f"Civilization {civ.name} has collapsed"
@@ -962,129 +1108,130 @@ class Simulation:
                     civ.collapse_logged = True
         
         # Update world's civilization list
-        self.world.civilizations = active_civs 
+        if len(active_civs) != len(self.world.civilizations):
+            self.world.civilizations = active_civs
 
     def _check_civilization_interactions(self):
         """Check for interactions between civilizations, including wars and potential unifications"""
         # Check every pair of civilizations
-        for i, civ1 in enumerate(self.world.civilizations):
-            for j, civ2 in enumerate(self.world.civilizations[i+1:]):
-                # Skip if either civilization has collapsed
-                if hasattr(civ1, 'has_collapsed') and civ1.has_collapsed:
-                    continue
-                if hasattr(civ2, 'has_collapsed') and civ2.has_collapsed:
-                    continue
+        for civ1, civ2 in itertools.combinations(self.world.civilizations, 2):
+            # Skip if either civilization has collapsed
+            if civ1.has_collapsed:
+                continue
+            if civ2.has_collapsed:
+                continue
+            
+            # Skip if they're already at war
+            if civ2.id in civ1.at_war_with:
+                continue
+            
+            # Only civs whose territories touch can interact
+            if not civ1._territories_adjacent(civ2):
+                continue
+            
+            # First contact - initialize relations if they don't exist
+            if civ2.id not in civ1.relations:
+                # Determine initial relations based on belief systems and traits
+                belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
+                trait_compatibility = self._calculate_trait_compatibility(civ1, civ2)
                 
-                # Skip if they're already at war
-                if hasattr(civ1, 'at_war_with') and civ2.id in civ1.at_war_with:
-                    continue
+                # Calculate base initial relation
+                base_relation = (belief_compatibility * 0.7) + (trait_compatibility * 0.3)
                 
-                # Check if territories are adjacent, indicating potential first contact
-                if civ1._territories_adjacent(civ2):
-                    # First contact - initialize relations if they don't exist
-                    if civ2.id not in civ1.relations:
-                        # Determine initial relations based on belief systems and traits
-                        belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
-                        trait_compatibility = self._calculate_trait_compatibility(civ1, civ2)
-                        
-                        # Calculate base initial relation
-                        base_relation = (belief_compatibility * 0.7) + (trait_compatibility * 0.3)
-                        
-                        # Add randomness
-                        initial_relation = base_relation + random.uniform(-0.2, 0.2)
-                        
-                        # Clamp to valid range
-                        initial_relation = max(-1.0, min(1.0, initial_relation))
-                        
-                        # Set mutual relations
-                        civ1.relations[civ2.id] = initial_relation
-                        civ2.relations[civ1.id] = initial_relation
-                        
-                        # Track first contact
-                        first_contact_message = f"{civ1.name} made first contact with {civ2.name}"
-                        civ1._add_event(f"Made first contact with {civ2.name}")
-                        civ2._add_event(f"Made first contact with {civ1.name}")
-                        
-                        # Add to major events
-                        self.major_events.append({
-                            "title": "First Contact",
-                            "message": first_contact_message,
-                            "civ": civ1
-                        })
-                        
-                        # Determine war likelihood on first contact
-                        # Hostile stance and opposing belief systems greatly increase war chance
-                        war_chance = 0.1  # Base war chance on contact
-                        
-                        # Belief system stance dramatically affects war chance
-                        if civ1.belief_system.foreign_stance == "hostile" or civ2.belief_system.foreign_stance == "hostile":
-                            war_chance += 0.3  # 30% more likely with hostile stance
-                        
-                        # Opposing belief values increase war chance
-                        if belief_compatibility < -0.5:  # Very incompatible beliefs
-                            war_chance += 0.4  # 40% more likely with opposing beliefs
-                            
-                        # Aggressive trait increases war chance
-                        if civ1._has_trait(CivilizationTrait.AGGRESSIVE):
-                            war_chance += 0.15
-                        if civ2._has_trait(CivilizationTrait.AGGRESSIVE):
-                            war_chance += 0.15
-                        
-                        # Peaceful trait reduces war chance
-                        if civ1._has_trait(CivilizationTrait.PEACEFUL):
-                            war_chance -= 0.15
-                        if civ2._has_trait(CivilizationTrait.PEACEFUL):
-                            war_chance -= 0.15
-                        
-                        # Declare war if the chance threshold is met
-                        if random.random() < war_chance:
-                            self._start_war(civ1, civ2, "ideological differences")
+                # Add randomness
+                initial_relation = base_relation + random.uniform(-0.2, 0.2)
+                
+                # Clamp to valid range
+                initial_relation = max(-1.0, min(1.0, initial_relation))
+                
+                # Set mutual relations
+                self.world.set_relation(civ1.index, civ2.index, initial_relation)
+                
+                # Track first contact
+                first_contact_message = f"{civ1.name} made first contact with {civ2.name}"
+                civ1._add_event(f"Made first contact with {civ2.name}")
+                civ2._add_event(f"Made first contact with {civ1.name}")
+                
+                # Add to major events
+                self.major_events.append(MajorEvent(
+                    title="First Contact",
+                    message=first_contact_message,
+                    civ=civ1
+                ))
+                
+                # Determine war likelihood on first contact
+                # Hostile stance and opposing belief systems greatly increase war chance
+                war_chance = 0.1  # Base war chance on contact
+                
+                # Belief system stance dramatically affects war chance
+                if civ1.belief_system.stance == ForeignStance.HOSTILE or civ2.belief_system.stance == ForeignStance.HOSTILE:
+                    war_chance += 0.3  # 30% more likely with hostile stance
+                
+                # Opposing belief values increase war chance
+                if belief_compatibility < -0.5:  # Very incompatible beliefs
+                    war_chance += 0.4  # 40% more likely with opposing beliefs
                     
-                    # Otherwise, update relations between existing contacts
-                    else:
-                        current_relation = civ1.relations[civ2.id]
+                # Aggressive trait increases war chance
+                if civ1._has_trait(CivilizationTrait.AGGRESSIVE):
+                    war_chance += 0.15
+                if civ2._has_trait(CivilizationTrait.AGGRESSIVE):
+                    war_chance += 0.15
+                
+                # Peaceful trait reduces war chance
+                if civ1._has_trait(CivilizationTrait.PEACEFUL):
+                    war_chance -= 0.15
+                if civ2._has_trait(CivilizationTrait.PEACEFUL):
+                    war_chance -= 0.15
+                
+                # Declare war if the chance threshold is met
+                if random.random() < war_chance:
+                    self._start_war(civ1, civ2, "ideological differences")
+            
+            # Otherwise, update relations between existing contacts
+            else:
+                current_relation = civ1.relations[civ2.id]
+                
+                # Check for potential unification of friendly civilizations
+                if current_relation > 0.8:  # Very friendly relations
+                    # Unification is more likely with compatible beliefs and traits
+                    belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
+                    trait_compatibility = self._calculate_trait_compatibility(civ1, civ2)
+                    
+                    # Calculate unification chance
+                    unification_chance = (belief_compatibility + trait_compatibility) / 4  # Base chance
+                    
+                    # Both civs must have compatible foreign stances for easy unification
+                    if (civ1.belief_system.stance == ForeignStance.OPEN and 
+                        civ2.belief_system.stance == ForeignStance.OPEN):
+                        unification_chance += 0.2
                         
-                        # Check for potential unification of friendly civilizations
-                        if current_relation > 0.8:  # Very friendly relations
-                            # Unification is more likely with compatible beliefs and traits
-                            belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
-                            trait_compatibility = self._calculate_trait_compatibility(civ1, civ2)
-                            
-                            # Calculate unification chance
-                            unification_chance = (belief_compatibility + trait_compatibility) / 4  # Base chance
-                            
-                            # Both civs must have compatible foreign stances for easy unification
-                            if (civ1.belief_system.foreign_stance == "open" and 
-                                civ2.belief_system.foreign_stance == "open"):
-                                unification_chance += 0.2
-                                
-                            # If both have the same belief system name, even more likely
-                            if civ1.belief_system.name == civ2.belief_system.name:
-                                unification_chance += 0.3
-                            
-                            # Execute unification if chance threshold is met
-                            if random.random() < unification_chance:
-                                self._unify_civilizations(civ1, civ2)
-                                return  # End processing as one civ no longer exists
+                    # If both have the same belief system name, even more likely
+                    if civ1.belief_system.name == civ2.belief_system.name:
+                        unification_chance += 0.3
+                    
+                    # Execute unification if chance threshold is met
+                    if random.random() < unification_chance:
+                        self._unify_civilizations(civ1, civ2)
+                        return  # End processing as one civ no longer exists
+                
+                # Check for war declaration between existing contacts
+                elif current_relation < -0.7:  # Very negative relations
+                    war_chance = 0.15  # Base war chance for hostile relations
+                    
+                    # Increase war chance for opposing belief systems
+                    belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
+                    if belief_compatibility < -0.5:  # Very incompatible beliefs
+                        war_chance += 0.2
                         
-                        # Check for war declaration between existing contacts
-                        elif current_relation < -0.7:  # Very negative relations
-                            war_chance = 0.15  # Base war chance for hostile relations
-                            
-                            # Increase war chance for opposing belief systems
-                            belief_compatibility = self._calculate_belief_compatibility(civ1, civ2)
-                            if belief_compatibility < -0.5:  # Very incompatible beliefs
-                                war_chance += 0.2
-                                
-                            # Aggressive trait increases war chance
-                            if civ1._has_trait(CivilizationTrait.AGGRESSIVE):
-                                war_chance += 0.1
-                            if civ2._has_trait(CivilizationTrait.AGGRESSIVE):
-                                war_chance += 0.1
-                            
-                            # Declare war if the chance threshold is met
-                            if random.random() < war_chance:
-                                self._start_war(civ1, civ2, "long-standing hostility")
+                    # Aggressive trait increases war chance
+                    if civ1._has_trait(CivilizationTrait.AGGRESSIVE):
+                        war_chance += 0.1
+                    if civ2._has_trait(CivilizationTrait.AGGRESSIVE):
+                        war_chance += 0.1
+                    
+                    # Declare war if the chance threshold is met
+                    if random.random() < war_chance:
+                        self._start_war(civ1, civ2, "long-standing hostility")
 
     def _unify_civilizations(self, civ1, civ2):
         """Unify two compatible civilizations into one stronger civilization"""
@@ -1104,26 +1251,27 @@ class Simulation:
         secondary_civ._add_event(f"Unified with {primary_civ.name}, becoming part of their civilization")
         
         # Transfer territory and cities
-        primary_civ.territory = primary_civ.territory.union(secondary_civ.territory)
-        for pos, city in secondary_civ.cities.items():
-            primary_civ.cities[pos] = city
+        primary_civ.add_tiles(secondary_civ.territory)
+        primary_civ.cities.update(secondary_civ.cities)
         
         # Transfer population (80% survival rate during integration)
         transferred_population = int(secondary_civ.population * 0.8)
         primary_civ.population += transferred_population
         
         # Transfer some resources (80% efficiency)
-        for resource in secondary_civ.resources:
-            primary_civ.resources[resource] += secondary_civ.resources[resource] * 0.8
+        for resource, amount in secondary_civ.resources.items():
+            primary_civ.resources[resource] = primary_civ.resources.get(resource, 0) + amount * 0.8
         
         # Blend traits and belief systems
         # Each trait from the secondary civ has a chance to be added if not already present
+        traits = list(primary_civ.traits)
         for trait in secondary_civ.traits:
-            if trait not in primary_civ.traits and random.random() < 0.5:
-                primary_civ.traits.append(trait)
+            if trait not in traits and random.random() < 0.5:
+                traits.append(trait)
                 # Keep max 5 traits
-                if len(primary_civ.traits) > 5:
-                    primary_civ.traits.pop(0)
+                if len(traits) > 5:
+                    traits.pop(0)
+        primary_civ.traits = traits
         
         # Add the event to the secondary civ's history
         self.event_logger.add_event(
@@ -1135,11 +1283,11 @@ class Simulation:
         secondary_civ.has_collapsed = True
         
         # Add to major events
-        self.major_events.append({
-            "title": "Civilizations United",
-            "message": unification_message,
-            "civ": primary_civ
-        })
+        self.major_events.append(MajorEvent(
+            title="Civilizations United",
+            message=unification_message,
+            civ=primary_civ
+        ))
 
     def _calculate_belief_compatibility(self, civ1, civ2):
         """Calculate compatibility between two civilizations' belief systems
@@ -1148,19 +1296,19 @@ class Simulation:
         compatibility = 0.0
         
         # Foreign stance heavily impacts compatibility
-        stance1 = civ1.belief_system.foreign_stance
-        stance2 = civ2.belief_system.foreign_stance
+        stance1 = civ1.belief_system.stance
+        stance2 = civ2.belief_system.stance
         
         # Hostile stance dramatically reduces compatibility
-        if stance1 == "hostile" and stance2 == "hostile":
+        if stance1 == ForeignStance.HOSTILE and stance2 == ForeignStance.HOSTILE:
             compatibility -= 0.6  # Both hostile to others
-        elif stance1 == "hostile" or stance2 == "hostile":
+        elif stance1 == ForeignStance.HOSTILE or stance2 == ForeignStance.HOSTILE:
             compatibility -= 0.4  # One hostile stance
         
         # Open stance improves compatibility
-        if stance1 == "open" and stance2 == "open":
+        if stance1 == ForeignStance.OPEN and stance2 == ForeignStance.OPEN:
             compatibility += 0.6  # Both open to others
-        elif stance1 == "open" or stance2 == "open":
+        elif stance1 == ForeignStance.OPEN or stance2 == ForeignStance.OPEN:
             compatibility += 0.3  # One open stance
         
         # Compare belief values - opposing values reduce compatibility
@@ -1192,14 +1340,10 @@ class Simulation:
         # Start with neutral compatibility
         compatibility = 0.0
         
-        # Some traits are directly opposed
-        opposed_pairs = [
-            (CivilizationTrait.AGGRESSIVE, CivilizationTrait.PEACEFUL),
-            (CivilizationTrait.EXPANSIONIST, CivilizationTrait.ISOLATIONIST),
-            # Add more opposed traits if needed
-        ]
-        
         # Check for direct conflicts in traits
-        for trait1, trait2 in opposed_pairs:
+        for trait1, trait2 in self._OPPOSED_TRAITS:
             if civ1._has_trait(trait1) and civ2._has_trait(trait2):
-                compatibility -= 0.4  # Major conflict in traits
\ No newline at end of file
+                compatibility -= 0.4  # Major conflict in traits
+        
+        # Ensure final value is in range [-1, 1]
+        return max(-1.0, min(1.0, compatibility))
@@ -6,62 +6,188 @@ ui controls module for civ simulator
 import pygame
 import pygame.freetype
 import random
+import numpy as np
+
+# pre-drawn button bodies, keyed by (width, height, color, hovered) - shared by every button
+_BG_CACHE = {}
+
+def _display_format(surface):
+    """convert_alpha the surface to the display's pixel format so blits take SDL's fast (SIMD)
+    path. returns (surface, converted) - before set_mode there's nothing to convert to"""
+    if pygame.display.get_surface() is None:
+        return surface, False
+    return surface.convert_alpha(), True
+
+# hover glow lookup tables, keyed by (rgba color, rgba hover color) - see Button._get_glow_lut
+_GLOW_LUTS = {}
 
 class Button:
+    _FONT = None  # one font for every button, opened the first time a button is made
+    _BASE_ALPHA = 180  # buttons are semi-transparent
+    _GRADIENT_CACHE = {}  # rows -> alpha ramp for the highlight at the top of a button
+    
+    @classmethod
+    def _get_font(cls):
+        if cls._FONT is None:
+            cls._FONT = pygame.freetype.SysFont("Segoe UI", 14)
+        return cls._FONT
+    
     def __init__(self, rect, text, action=None, color=(40, 60, 100), hover_color=(60, 100, 160)):
         self.rect = pygame.Rect(rect)
+        self._text_cache = {}  # (text, color) -> rendered surface
+        self._text = None
         self.text = text
         self.action = action
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.freetype.SysFont("Segoe UI", 14)
+        self.font = self._get_font()
         
         # Animation state for glow effect
         self.animation_state = 0  # 0-100 for glow effect
         self.animation_direction = 1  # 1 = increasing, -1 = decreasing
+        self._external_glow = None  # glow phase pushed in by Controls - used instead of our own
+    
+    @property
+    def color(self):
+        return self._color
+    
+    @color.setter
+    def color(self, color):
+        self._color = color
+        self._color_a = (*color, self._BASE_ALPHA)  # with alpha, so drawing doesn't build the tuple
+        self._glow_lut = None
+    
+    @property
+    def hover_color(self):
+        return self._hover_color
+    
+    @hover_color.setter
+    def hover_color(self, hover_color):
+        self._hover_color = hover_color
+        self._hover_a = (*hover_color, self._BASE_ALPHA)
+        self._glow_lut = None
+    
+    @staticmethod
+    def _get_glow_lut(base_color, glow_color):
+        """hover glow color for every animation_state 0-100, shared between buttons with the same colors.
+        both colors are rgba with the same alpha"""
+        key = (base_color, glow_color)
+        lut = _GLOW_LUTS.get(key)
+        if lut is None:
+            alpha = base_color[3]
+            lut = []
+            for i in range(101):
+                glow_strength = i / 100
+                r = int(base_color[0] + (glow_color[0] - base_color[0]) * glow_strength)
+                g = int(base_color[1] + (glow_color[1] - base_color[1]) * glow_strength)
+                b = int(base_color[2] + (glow_color[2] - base_color[2]) * glow_strength)
+                lut.append((r, g, b, alpha))
+            _GLOW_LUTS[key] = lut
+        return lut
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, text):
+        # same string assigned again (label refreshes) - keep what's already rendered
+        if text == self._text:
+            return
+        self._text = text
+        self._text_cache.clear()  # old renders are no use any more
+    
+    def _get_text_surf(self, text, color):
+        """rendered text, cached until the button's text changes"""
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf, _ = self.font.render(text, color)
+            surf, converted = _display_format(surf)
+            if converted:  # unconverted ones are rebuilt until the display exists
+                self._text_cache[key] = surf
+        return surf
     
     def draw(self, screen):
-        # Create a surface with per-pixel alpha for better transparency effects
-        button_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        
+        # nothing to do if we're outside the area being drawn
+        if not screen.get_clip().colliderect(self.rect):
+            return
+        screen.blits(self.get_blit_pairs(), doreturn=False)
+    
+    def get_blit_pairs(self):
+        """advance the hover animation and return the (surface, position) pairs that draw
+        this button - body, text shadow, text - so callers can blit many buttons in one call"""
         # Calculate color with animation
-        base_alpha = 180  # Semi-transparent
         if self.is_hovered:
-            # Update animation state
-            self.animation_state += self.animation_direction * 5
-            if self.animation_state > 100:
-                self.animation_state = 100
-                self.animation_direction = -1
-            elif self.animation_state < 0:
-                self.animation_state = 0
-                self.animation_direction = 1
+            if self._external_glow is not None:
+                # Controls runs one shared glow animation for all its buttons
+                self.animation_state = self._external_glow
+            else:
+                # Update animation state
+                self.animation_state += self.animation_direction * 5
+                if self.animation_state > 100:
+                    self.animation_state = 100
+                    self.animation_direction = -1
+                elif self.animation_state < 0:
+                    self.animation_state = 0
+                    self.animation_direction = 1
                 
-            # Enhanced glow when hovered
-            glow_strength = self.animation_state / 100
-            base_color = self.color + (base_alpha,)
-            glow_color = self.hover_color + (base_alpha,)
-            r = int(base_color[0] + (glow_color[0] - base_color[0]) * glow_strength)
-            g = int(base_color[1] + (glow_color[1] - base_color[1]) * glow_strength)
-            b = int(base_color[2] + (glow_color[2] - base_color[2]) * glow_strength)
-            color = (r, g, b, base_alpha)
+            # Enhanced glow when hovered - looked up, animation_state is always a whole 0-100
+            lut = self._glow_lut
+            if lut is None:
+                lut = self._get_glow_lut(self._color_a, self._hover_a)
+                self._glow_lut = lut
+            color = lut[self.animation_state]
         else:
             # Reset animation when not hovered
             self.animation_state = 0
-            color = self.color + (base_alpha,)
+            color = self._color_a
+        
+        # background + gradient + border only depend on size, color and hover, so they're
+        # drawn once per combination and reused (the glow steps in 5s, so there's only a few)
+        key = (self.rect.width, self.rect.height, color, self.is_hovered)
+        button_surface = _BG_CACHE.get(key)
+        if button_surface is None:
+            button_surface, converted = _display_format(self._render_background(color))
+            if converted:  # unconverted ones are rebuilt until the display exists
+                _BG_CACHE[key] = button_surface
+        
+        # Draw text with shadow for better visibility
+        text_color = (240, 240, 255)
+        shadow_color = (0, 0, 0, 100)
+        shadow_surf = self._get_text_surf(self.text, shadow_color)
+        text_surf = self._get_text_surf(self.text, text_color)
+        
+        return [
+            (button_surface, self.rect),
+            (shadow_surf, shadow_surf.get_rect(center=(self.rect.centerx + 1, self.rect.centery + 1))),
+            (text_surf, text_surf.get_rect(center=self.rect.center))
+        ]
+    
+    def _render_background(self, color):
+        """draw the button body (no text) onto a new surface"""
+        # Create a surface with per-pixel alpha for better transparency effects
+        button_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
         
         # Draw button background with rounded corners
         pygame.draw.rect(button_surface, color, (0, 0, self.rect.width, self.rect.height), 
                         border_radius=8)
         
-        # Add subtle gradient effect
-        for y in range(0, self.rect.height//3):
-            highlight_alpha = 30 - y
-            if highlight_alpha > 0:
-                highlight_color = (255, 255, 255, highlight_alpha)
-                pygame.draw.rect(button_surface, highlight_color, 
-                                (2, 2 + y, self.rect.width - 4, 1), 
-                                border_radius=6)
+        # Add subtle gradient effect - white rows fading out from alpha 30, written straight
+        # into the pixels (same as drawing them one row at a time, which overwrote the body)
+        rows = min(self.rect.height // 3, 30)
+        if rows > 0 and self.rect.width > 4:
+            ramp = self._GRADIENT_CACHE.get(rows)
+            if ramp is None:
+                ramp = (30 - np.arange(rows)).astype(np.uint8)
+                self._GRADIENT_CACHE[rows] = ramp
+            rgb = pygame.surfarray.pixels3d(button_surface)
+            rgb[2:self.rect.width - 2, 2:2 + rows] = 255
+            del rgb  # unlock the surface
+            alpha = pygame.surfarray.pixels_alpha(button_surface)
+            alpha[2:self.rect.width - 2, 2:2 + rows] = ramp
+            del alpha
         
         # Add button border with subtle glow
         if self.is_hovered:
@@ -76,28 +202,31 @@ class Button:
             pygame.draw.rect(button_surface, border_color, 
                             (0, 0, self.rect.width, self.rect.height), 
                             1, border_radius=8)
-        
-        # Draw text with shadow for better visibility
-        text_color = (240, 240, 255)
-        shadow_color = (0, 0, 0, 100)
-        
-        # Draw text shadow
-        text_surf, text_rect = self.font.render(self.text, shadow_color)
-        text_rect.center = (self.rect.width // 2 + 1, self.rect.height // 2 + 1)
-        button_surface.blit(text_surf, text_rect)
-        
-        # Draw main text
-        text_surf, text_rect = self.font.render(self.text, text_color)
-        text_rect.center = (self.rect.width // 2, self.rect.height // 2)
-        button_surface.blit(text_surf, text_rect)
-        
-        # Draw the button surface to the screen
-        screen.blit(button_surface, self.rect)
+        return button_surface
     
     def is_over(self, pos):
         return self.rect.collidepoint(pos)
 
 class Controls:
+    _FEEDBACK_FONT = None  # shared, loaded on first use
+    _WORD_WIDTH_CACHE = {}  # word -> rendered width in the feedback font
+    _SPACE_WIDTH = None
+    _FEEDBACK_HIGHLIGHT = np.array([20 - i * 2 for i in range(8)], dtype=np.uint8)  # top-row alpha ramp
+    
+    @classmethod
+    def _get_feedback_font(cls):
+        if cls._FEEDBACK_FONT is None:
+            cls._FEEDBACK_FONT = pygame.freetype.SysFont("Segoe UI", 13)
+        return cls._FEEDBACK_FONT
+    
+    @classmethod
+    def _get_space_width(cls):
+        # a lone space has no ink so get_rect(" ") is empty - measure what it adds between two letters
+        if cls._SPACE_WIDTH is None:
+            font = cls._get_feedback_font()
+            cls._SPACE_WIDTH = font.get_rect("x x").width - font.get_rect("xx").width
+        return cls._SPACE_WIDTH
+    
     def __init__(self, simulation):
         self.simulation = simulation
         self.world = simulation.world
@@ -114,10 +243,29 @@ class Controls:
         self._create_ui_elements()
         
         # add "more info" button when civilization is selected
-        # positioned dynamically in draw() method, within the bottom panel
-        self.more_info_button = Button((0,0,0,0), "More Info", self._show_civ_details) 
+        # positioned by _layout_more_info() at the bottom of the right-side panel
+        # Use a more noticeable blue color for this important button
+        self.more_info_button = Button((0,0,0,0), "More Info", self._show_civ_details,
+                                       color=(40, 80, 130), hover_color=(60, 120, 200)) 
         self.more_info_button_active = False
         
+        # hover hit-test lists, rebuilt when the set of visible buttons changes
+        self._all_buttons_cache = []
+        self._all_rects_cache = []
+        self._hover_key = None
+        self._last_mouse_pos = None  # latest motion position, applied once per frame in draw()
+        self._hovered = []  # buttons under the mouse as of the last hover update
+        self._glow_phase = 0  # shared hover glow, 0-100 in steps of 5
+        self._glow_dir = 1
+        
+        # nothing in the ui reads joystick, controller or touch input - drop it before it's queued
+        pygame.event.set_blocked([
+            pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+            pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+            pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+            pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP,
+        ])
+        
     def _create_ui_elements(self):
         """create ui buttons and elements"""
         # main buttons - moved to left panel in vertical layout
@@ -161,6 +309,7 @@ class Controls:
         self.show_feedback = False
         self.feedback_message = ""
         self.feedback_timer = 0
+        self._feedback_surface = None  # message panel, built once per message
     
     def handle_event(self, event):
         """handle a pygame event"""
@@ -169,145 +318,122 @@ class Controls:
                 self._handle_mouse_click(event.pos)
         
         elif event.type == pygame.MOUSEMOTION:
-            # update button hover states
-            for button in self.buttons:
-                button.is_hovered = button.is_over(event.pos)
-            
+            # just remember where the mouse is, hover states are worked out once per frame in draw()
+            self._last_mouse_pos = event.pos
+    
+    def _update_hover(self):
+        """update button hover states - one collidelistall over every visible button"""
+        if self._last_mouse_pos is not None:
+            buttons, rects = self._hover_targets()
+            hit = pygame.Rect(self._last_mouse_pos, (1, 1)).collidelistall(rects)
+            for button in buttons:
+                button.is_hovered = False
+            for i in hit:
+                buttons[i].is_hovered = True
+            hovered = [buttons[i] for i in hit]
+            if hovered != self._hovered:
+                # a newly hovered button starts its glow from the beginning
+                self._glow_phase = 0
+                self._glow_dir = 1
+            self._hovered = hovered
+            self._last_mouse_pos = None
+    
+    def _advance_glow(self):
+        """step the hover glow once per frame and hand it to the hovered buttons,
+        instead of every button running its own copy of the animation"""
+        if not self._hovered:
+            # Reset animation when nothing is hovered
+            self._glow_phase = 0
+            self._glow_dir = 1
+            return
+        self._glow_phase += self._glow_dir * 5
+        if self._glow_phase > 100:
+            self._glow_phase = 100
+            self._glow_dir = -1
+        elif self._glow_phase < 0:
+            self._glow_phase = 0
+            self._glow_dir = 1
+        for button in self._hovered:
+            button._external_glow = self._glow_phase
+    
+    def _hover_targets(self):
+        """visible buttons (hover and click targets), with their rects in a parallel list.
+        main.py appends to self.buttons and the more info button moves, so the key covers those"""
+        key = (id(self.buttons), len(self.buttons), self.showing_god_mode,
+               self.more_info_button_active, tuple(self.more_info_button.rect))
+        if key != self._hover_key:
+            buttons = list(self.buttons)
             if self.showing_god_mode:
-                for button in self.god_mode_buttons:
-                    button.is_hovered = button.is_over(event.pos)
-            
-            # update hover state for more info button
+                buttons.extend(self.god_mode_buttons)
             if self.more_info_button_active:
-                self.more_info_button.is_hovered = self.more_info_button.is_over(event.pos)
+                buttons.append(self.more_info_button)
+            self._all_buttons_cache = buttons
+            self._all_rects_cache = [button.rect for button in buttons]
+            self._hover_key = key
+        return self._all_buttons_cache, self._all_rects_cache
     
-    def draw(self, screen):
-        """draw ui controls"""
-        for button in self.buttons:
-            button.draw(screen)
+    def draw(self, screen, dirty_rect=None):
+        """draw ui controls
+        dirty_rect limits the button drawing to that area (only buttons touching it are drawn)"""
+        self._update_hover()
+        self._advance_glow()
+        self._check_save()
         
-        if self.showing_god_mode:
-            for button in self.god_mode_buttons:
-                button.draw(screen)
+        if dirty_rect is not None:
+            screen.set_clip(dirty_rect)
+        
+        # every button in one blits() call, skipping any outside the clip area
+        clip = screen.get_clip()
+        buttons = self.buttons + self.god_mode_buttons if self.showing_god_mode else self.buttons
+        screen.blits([pair for button in buttons if clip.colliderect(button.rect)
+                      for pair in button.get_blit_pairs()], doreturn=False)
+        
+        if dirty_rect is not None:
+            screen.set_clip(None)
         
         if self.show_feedback and self.feedback_timer > 0:
-            # Match the width of the standard buttons on the left panel (e.g., 180px)
-            panel_width = 180 
-            feedback_font = pygame.freetype.SysFont("Segoe UI", 13) # Slightly smaller font for feedback
-            
-            # Word wrap the feedback message
-            words = self.feedback_message.split(' ')
-            lines = []
-            current_line = ""
-            if words:
-                current_line = words[0]
-                for word in words[1:]:
-                    test_line = current_line + " " + word
-                    text_width, _ = feedback_font.get_rect(test_line)[2:4]
-                    if text_width < panel_width - 20: # 10px padding on each side
-                        current_line = test_line
-                    else:
-                        lines.append(current_line)
-                        current_line = word
-                lines.append(current_line)
-            else:
-                lines.append("") # Handle empty message
-            
-            # Calculate panel dimensions based on text content
-            line_height = feedback_font.get_sized_height() + 2 # Small spacing between lines
-            text_block_height = len(lines) * line_height
-            panel_height = text_block_height + 20  # 10px padding top and bottom
-            
-            # Create a stylish panel with rounded corners
-            msg_background_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-            
-            # Main background - semi-transparent dark blue
-            pygame.draw.rect(msg_background_surface, (30, 50, 90, 230), 
-                           (0, 0, panel_width, panel_height), 
-                           border_radius=8)
-            
-            # Add subtle highlight at the top
-            for y_offset in range(8):
-                highlight_alpha = 20 - y_offset * 2
-                if highlight_alpha > 0:
-                    pygame.draw.rect(msg_background_surface, (100, 150, 250, highlight_alpha), 
-                                   (2, 2 + y_offset, panel_width - 4, 1), 
-                                   border_radius=6)
-            
-            # Add border
-            pygame.draw.rect(msg_background_surface, (80, 120, 200, 190), 
-                           (0, 0, panel_width, panel_height), 
-                           1, border_radius=8)
+            # the panel only depends on the message, so it's laid out once and reused every frame
+            if self._feedback_surface is None:
+                self._feedback_surface, _ = _display_format(self._render_feedback(self.feedback_message))
             
             # Position the panel like other buttons in the left column
             panel_x = 10 # Same x as other buttons
             panel_y = self.buttons[-1].rect.bottom + 10 if self.buttons else 10 # Below the last button or at top
-            screen.blit(msg_background_surface, (panel_x, panel_y))
-            
-            # Display text with shadow for better visibility, centered or nicely padded
-            text_start_y = panel_y + 10 # 10px top padding for text
-            for i, line in enumerate(lines):
-                line_surface_shadow, line_rect_shadow = feedback_font.render(line, (0, 0, 0, 100))
-                line_surface, line_rect = feedback_font.render(line, (220, 255, 180))
-                
-                # Center text horizontally within the panel
-                line_x_shadow = panel_x + (panel_width - line_rect_shadow.width) // 2 +1
-                line_x = panel_x + (panel_width - line_rect.width) // 2
-                current_text_y = text_start_y + i * line_height
-                
-                screen.blit(line_surface_shadow, (line_x_shadow, current_text_y + 1))
-                screen.blit(line_surface, (line_x, current_text_y))
+            screen.blit(self._feedback_surface, (panel_x, panel_y))
             
             self.feedback_timer -= 1
             if self.feedback_timer <= 0:
                 self.show_feedback = False
         
         # draw "more info" button in the right-side panel if a civ is selected and renderer is available
+        # (laid out once by _layout_more_info, not every frame)
         if self.selected_civ and self.more_info_button_active and self.renderer:
-            # position at the bottom of the right-side panel
-            right_panel_x = screen.get_width() - self.renderer.side_panel_width
-            button_x_pos = right_panel_x + (self.renderer.side_panel_width - 120) // 2 # centered in side panel
-            button_y_pos = screen.get_height() - 40 # 40px from the bottom of the screen
-            
-            # Use a special highlight color for the More Info button
-            self.more_info_button.rect = pygame.Rect(button_x_pos, button_y_pos, 120, 30)
-            
-            # Customize More Info button to stand out
-            original_color = self.more_info_button.color
-            original_hover = self.more_info_button.hover_color
-            
-            # Use a more noticeable blue color for this important button
-            self.more_info_button.color = (40, 80, 130)
-            self.more_info_button.hover_color = (60, 120, 200)
-            
             self.more_info_button.draw(screen)
-            
-            # Restore original colors
-            self.more_info_button.color = original_color
-            self.more_info_button.hover_color = original_hover
+    
+    def _layout_more_info(self):
+        """place the more info button at the bottom of the right-side panel"""
+        if not self.renderer:
+            return
+        screen_width, screen_height = self.renderer.screen.get_size()
+        right_panel_x = screen_width - self.renderer.side_panel_width
+        button_x_pos = right_panel_x + (self.renderer.side_panel_width - 120) // 2 # centered in side panel
+        button_y_pos = screen_height - 40 # 40px from the bottom of the screen
+        self.more_info_button.rect = pygame.Rect(button_x_pos, button_y_pos, 120, 30)
     
     def _handle_mouse_click(self, pos):
         """handle mouse click at position. returns true if a button was actioned, or a string for special actions."""
-        # check main buttons first (includes auto-pause button)
-        for button in self.buttons:
-            if button.is_over(pos) and button.action:
-                action_result = button.action()
-                if action_result == "return_to_menu":
-                    return "return_to_menu"
-                return True # a button was clicked and actioned
-        
-        # check god mode buttons if they're visible
-        if self.showing_god_mode:
-            for button in self.god_mode_buttons:
-                if button.is_over(pos) and button.action:
-                    button.action()  # call the god mode button action
-                    return True  # god mode button was clicked and actioned
-        
-        # handle clicks on the more info button if active and not handled above
-        if self.selected_civ and self.more_info_button_active and self.more_info_button.is_over(pos):
-            if self.more_info_button.action:
-                 self.more_info_button.action()
-                 return True # more info button was clicked
+        # the visible buttons are in priority order (main, god mode, more info) - one C-side
+        # collidelistall finds every hit, the first one with an action handles the click
+        buttons, rects = self._hover_targets()
+        for i in pygame.Rect(pos, (1, 1)).collidelistall(rects):
+            button = buttons[i]
+            if not button.action:
+                continue
+            if button is self.more_info_button and not self.selected_civ:
+                continue
+            if button.action() == "return_to_menu":
+                return "return_to_menu"
+            return True # a button was clicked and actioned
         
         return False # no button handled the click
     
@@ -336,7 +462,8 @@ class Controls:
         try:
             success, message = self.simulation.save_state()
             if success:
-                self._show_feedback(f"Game saved successfully as '{message}'")
+                # written in the background - draw() reports how it went (see _check_save)
+                self._show_feedback(f"Saving game as '{message}'...")
             else:
                 self._show_feedback(f"Error saving game: {message}")
         except Exception as e:
@@ -451,9 +578,8 @@ class Controls:
             
         # If a civilization is selected, use it as the primary target
         if self.selected_civ:
-            # Find all other civilizations to pick an enemy
-            other_civs = [civ for civ in self.world.civilizations if civ.id != self.selected_civ.id]
-            if other_civs:
+            # Make sure there's someone else to fight (no need to build the whole list)
+            if any(civ.id != self.selected_civ.id for civ in self.world.civilizations):
                 self.simulation.trigger_god_event("war_influence", self.selected_civ)
                 self._show_feedback(f"War influence applied to {self.selected_civ.name}!")
             else:
@@ -471,6 +597,7 @@ class Controls:
         """Set the selected civilization"""
         self.selected_civ = civ
         self.more_info_button_active = (civ is not None)
+        self._layout_more_info()
         if civ:
             self._show_feedback(f"Selected {civ.name}")
     
@@ -478,11 +605,97 @@ class Controls:
         """Set the selected position"""
         self.selected_position = position
     
+    def _check_save(self):
+        """show the outcome of a save once the worker has finished writing it"""
+        result = self.simulation.save_result()
+        if result is not None:
+            success, message = result
+            if success:
+                self._show_feedback(f"Game saved successfully as '{message}'")
+            else:
+                self._show_feedback(f"Error saving game: {message}")
+    
     def _show_feedback(self, message):
         """Show a feedback message"""
         self.show_feedback = True
         self.feedback_message = message
         self.feedback_timer = 180  # Show for 3 seconds at 60 fps 
+        self._feedback_surface = None  # rebuilt on the next draw
+    
+    def _render_feedback(self, message):
+        """word wrap a feedback message and draw it onto its panel"""
+        # Match the width of the standard buttons on the left panel (e.g., 180px)
+        panel_width = 180 
+        feedback_font = self._get_feedback_font() # Slightly smaller font for feedback
+        
+        # Word wrap the feedback message - line widths are summed from cached per-word widths,
+        # so freetype only measures a word the first time it shows up
+        words = message.split(' ')
+        widths = self._WORD_WIDTH_CACHE
+        for word in words:
+            if word not in widths:
+                widths[word] = feedback_font.get_rect(word).width
+        space_width = self._get_space_width()
+        lines = []
+        current_line = ""
+        if words:
+            current_line = words[0]
+            current_width = widths[current_line]
+            for word in words[1:]:
+                test_width = current_width + space_width + widths[word]
+                if test_width < panel_width - 20: # 10px padding on each side
+                    current_line = current_line + " " + word
+                    current_width = test_width
+                else:
+                    lines.append(current_line)
+                    current_line = word
+                    current_width = widths[word]
+            lines.append(current_line)
+        else:
+            lines.append("") # Handle empty message
+        
+        # Calculate panel dimensions based on text content
+        line_height = feedback_font.get_sized_height() + 2 # Small spacing between lines
+        text_block_height = len(lines) * line_height
+        panel_height = text_block_height + 20  # 10px padding top and bottom
+        
+        # Create a stylish panel with rounded corners
+        msg_background_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        
+        # Main background - semi-transparent dark blue
+        pygame.draw.rect(msg_background_surface, (30, 50, 90, 230), 
+                       (0, 0, panel_width, panel_height), 
+                       border_radius=8)
+        
+        # Add subtle highlight at the top - 8 rows fading from alpha 20, written straight into
+        # the pixels like the button gradient
+        rows = min(8, panel_height - 2)
+        rgb = pygame.surfarray.pixels3d(msg_background_surface)
+        rgb[2:panel_width - 2, 2:2 + rows] = (100, 150, 250)
+        del rgb  # unlock the surface
+        alpha = pygame.surfarray.pixels_alpha(msg_background_surface)
+        alpha[2:panel_width - 2, 2:2 + rows] = self._FEEDBACK_HIGHLIGHT[:rows]
+        del alpha
+        
+        # Add border
+        pygame.draw.rect(msg_background_surface, (80, 120, 200, 190), 
+                       (0, 0, panel_width, panel_height), 
+                       1, border_radius=8)
+        
+        # Display text with shadow for better visibility, centered or nicely padded
+        text_start_y = 10 # 10px top padding for text
+        for i, line in enumerate(lines):
+            line_surface_shadow, line_rect_shadow = feedback_font.render(line, (0, 0, 0, 100))
+            line_surface, line_rect = feedback_font.render(line, (220, 255, 180))
+            
+            # Center text horizontally within the panel
+            line_x_shadow = (panel_width - line_rect_shadow.width) // 2 +1
+            line_x = (panel_width - line_rect.width) // 2
+            current_text_y = text_start_y + i * line_height
+            
+            msg_background_surface.blit(line_surface_shadow, (line_x_shadow, current_text_y + 1))
+            msg_background_surface.blit(line_surface, (line_x, current_text_y))
+        return msg_background_surface
 
     def _show_detailed_info(self):
         """Show detailed civilization information if a civ is selected."""
@@ -508,6 +721,7 @@ class Controls:
 
     def set_renderer(self, renderer):
         self.renderer = renderer 
+        self._layout_more_info()
         
     def _toggle_bottom_panel(self):
         """Toggle the visibility of the bottom information panel"""
@@ -6,10 +6,96 @@ ui renderer module for civ simulator
 import pygame
 import pygame.freetype
 import math
+import functools
+from collections import OrderedDict
 from src.world import TerrainType
+from src.jit import njit, NUMBA_AVAILABLE
 import random
+import numpy as np
+
+@functools.lru_cache(maxsize=32)
+def _get_font(name, size, bold=False):
+    """SysFont, opened once per (name, size, bold) - the map symbols ask for theirs by
+    size every frame. the fonts are shared, so don't change their style attributes"""
+    return pygame.freetype.SysFont(name, size, bold=bold)
+
+def _format_population(pop):
+    """population as (short, long) display text - "1.2M" and "1.2 million" """
+    if pop > 1000000000:
+        return f"{pop/1000000000:.1f}B", f"{pop/1000000000:.1f} billion"
+    elif pop > 1000000:
+        return f"{pop/1000000:.1f}M", f"{pop/1000000:.1f} million"
+    elif pop > 1000:
+        return f"{pop/1000:.1f}K", f"{pop/1000:.1f} thousand"
+    else:
+        return f"{pop}", f"{pop}"
+
+@njit(cache=True)
+def _step_stars(x, y, dx, dy, phase, speed, brightness, size, width, height, mask):
+    """move and twinkle every star in place, in one pass. returns per-star int x, y, color value,
+    radius (0 = single pixel) and whether it's over the background. only used with numba -
+    without it Renderer._update_and_draw_stars does the same with numpy"""
+    n = len(x)
+    star_x = np.empty(n, dtype=np.int64)
+    star_y = np.empty(n, dtype=np.int64)
+    color_val = np.empty(n, dtype=np.int64)
+    radius = np.empty(n, dtype=np.int64)
+    visible = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        x[i] += dx[i]
+        y[i] += dy[i]
+        if x[i] < 0:
+            x[i] = width
+        if x[i] > width:
+            x[i] = 0
+        if y[i] < 0:
+            y[i] = height
+        if y[i] > height:
+            y[i] = 0
+        
+        phase[i] += speed[i]
+        if phase[i] > 2 * math.pi:
+            phase[i] -= 2 * math.pi
+        factor = (math.sin(phase[i]) + 1) / 2
+        final_brightness = brightness[i] * (0.5 + factor * 0.5)
+        
+        star_x[i] = int(x[i])
+        star_y[i] = int(y[i])
+        visible[i] = mask[star_x[i], star_y[i]]
+        color_val[i] = int(final_brightness * 200) + 55
+        current_size = size[i] * (0.7 + factor * 0.3)
+        radius[i] = int(current_size) if current_size >= 1 else 0
+    return star_x, star_y, color_val, radius, visible
+
+class _SurfacePool:
+    """scratch surfaces kept between frames, keyed by (size, flags), for things that are drawn
+    fresh every frame. get() one, draw and blit it, then release() it - contents aren't kept"""
+    def __init__(self, max_per_key=4, max_keys=32):
+        self.max_per_key = max_per_key
+        self.max_keys = max_keys
+        self._free = {}
+    
+    def get(self, size, flags=0):
+        free = self._free.get((size, flags))
+        if free:
+            return free.pop()
+        return pygame.Surface(size, flags)
+    
+    def release(self, surface):
+        key = (surface.get_size(), surface.get_flags() & pygame.SRCALPHA)
+        free = self._free.get(key)
+        if free is None:
+            if len(self._free) >= self.max_keys:
+                return  # too many sizes already, let this one go
+            free = self._free[key] = []
+        if len(free) < self.max_per_key:
+            free.append(surface)
 
 class Renderer:
+    TERRITORY_SECTION = 64  # tiles per side of a world cache panel, see _update_world_cache
+    HIGHLIGHT_PERIOD_MS = 500  # one full up-and-down of the highlight pulse
+    TEXT_CACHE_SIZE = 2048  # rendered strings kept by _get_text
+    
     def __init__(self, screen, world):
         self.screen = screen
         self.world = world
@@ -29,11 +115,21 @@ class Renderer:
         map_width = self.width - self.left_panel_width - self.side_panel_width
         self.offset_x = self.left_panel_width + (map_width - self.world.width * self.grid_cell_size) // 2
         self.offset_y = 10  # move map to the top to make room for ui at bottom
+        # map area on screen as plain ints (left, top, right, bottom) for quick point checks
+        self._map_bounds = (self.offset_x, self.offset_y,
+                            self.offset_x + self.world.width * self.grid_cell_size,
+                            self.offset_y + self.world.height * self.grid_cell_size)
         
         # ui elements
         self.font = pygame.freetype.SysFont("Arial", 14)
         self.font_small = pygame.freetype.SysFont("Arial", 12)
         self.font_large = pygame.freetype.SysFont("Arial", 16)
+        self._notif_title_font = _get_font("Arial", 24)
+        self._notif_msg_font = _get_font("Arial", 18)
+        self._notif_dismiss_font = _get_font("Arial", 14)
+        self._detail_title_font = _get_font("Segoe UI", 32, bold=True)
+        self._detail_header_font = _get_font("Segoe UI", 22, bold=True)
+        self._detail_text_font = _get_font("Segoe UI", 16)
         self.selected_position = None
         self.selected_civilization = None
         self.showing_civ_list = False
@@ -41,7 +137,25 @@ class Renderer:
         # performance optimization - caching
         self.terrain_surface = None
         self.last_render_tick = -1
-        self.territory_surfaces = {}  # caches territory rendering per civ
+        self._territory_surfaces = {}  # civ id -> (key, surface, position) - see _get_territory_surface
+        self._world_cache = None  # terrain + territories composite, see _update_world_cache
+        self._world_cache_key = None
+        self._world_cache_civs = {}  # civ id -> (version, color, map rect, surface) as last composited
+        self._new_territory_cache = {}  # civ id -> (key, tiles gained this tick)
+        self._city_dot_cache = {}  # (radius, color) -> city marker surface
+        self._city_label_cache = {}  # city name -> (label surface, text rect)
+        self._civ_index_list = []  # world.civilizations as of the last _refresh_civ_index
+        self._civ_index_map = {}  # civ -> position in that list
+        self._pop_text_cache = {}  # civ id -> (population, short text, long text) - see _format_pop
+        self._traits_text_cache = {}  # civ id -> (traits list, list line, full text) - see _traits_text
+        self._civ_list_swatch_cache = {}  # (color, list width) -> civ list swatch and highlight
+        self._notification_lines = None  # ((message, width), wrapped lines) - see _wrap_notification
+        self._text_cache = OrderedDict()  # (font, text, color) -> rendered text, least recently used first
+        self._surface_pool = _SurfacePool()  # scratch surfaces for per-frame label/popup drawing
+        
+        # white tile for the selected position - its pulse is a surface-wide alpha, set each frame
+        self._highlight_surface = pygame.Surface((self.grid_cell_size, self.grid_cell_size), pygame.SRCALPHA)
+        self._highlight_surface.fill((255, 255, 255, 255))
         
         # special location types
         self.location_types = {
@@ -80,8 +194,7 @@ class Renderer:
         ]
         
         # highlight animation
-        self.highlight_timer = 0
-        self.highlight_direction = 1
+        self.highlight_timer = 0.3
         
         # rendering flags
         self.god_mode_active = False
@@ -91,6 +204,9 @@ class Renderer:
         # pre-render the terrain
         self._prerender_terrain()
         
+        # the screen and panel backgrounds are fixed gradients - drawn once here, blitted each frame
+        self._prerender_backgrounds()
+        
         # for civilization detail popup
         self.showing_civ_details = False
         self.detail_civ = None
@@ -100,6 +216,10 @@ class Renderer:
         self.detail_scroll_y = 0  # Current scroll position (y-offset)
         self.detail_max_scroll_y = 0 # max scrollable amount
         self.detail_content_height = 0 # actual height of all content
+        self._detail_base = None  # popup body without the close button and scroll bar
+        self._detail_key = None  # what _detail_base was last drawn for
+        self._detail_gradient = None  # top strip of the details popup, see _get_detail_gradient
+        self._detail_content_end = 0  # y the popup content ended at when last drawn
         self.scroll_bar_rect = None
         self.scroll_thumb_rect = None
         self.dragging_scrollbar = False
@@ -109,158 +229,368 @@ class Renderer:
         self.simulation = None
 
         # Starfield properties
-        self.stars = []
+        self._star_sprites = {}  # (radius, color value) -> star surface
         self._initialize_stars()
+        self._build_star_masks()
 
     def _initialize_stars(self):
-        """Initialize star properties for the background starfield."""
-        self.stars = []
+        """Initialize star properties for the background starfield.
+        stars are kept as parallel numpy arrays (one per property) so a frame updates them all at once"""
         num_stars = 150  # Adjust for density
+        stars = []
         for _ in range(num_stars):
-            star = {
-                'x': random.randint(0, self.width),
-                'y': random.randint(0, self.height),
-                'size': random.uniform(0.5, 2.0), # More variation in size
-                'brightness': random.uniform(0.3, 1.0), # Base brightness (0.0 to 1.0)
-                'twinkle_speed': random.uniform(0.01, 0.05), # How fast it twinkles
-                'twinkle_phase': random.uniform(0, 2 * math.pi), # Initial phase for twinkling
-                'dx': random.uniform(-0.05, 0.05), # Slow horizontal drift
-                'dy': random.uniform(-0.05, 0.05)  # Slow vertical drift
-            }
-            self.stars.append(star)
+            stars.append((
+                random.randint(0, self.width),  # x
+                random.randint(0, self.height),  # y
+                random.uniform(0.5, 2.0), # size - more variation in size
+                random.uniform(0.3, 1.0), # Base brightness (0.0 to 1.0)
+                random.uniform(0.01, 0.05), # How fast it twinkles
+                random.uniform(0, 2 * math.pi), # Initial phase for twinkling
+                random.uniform(-0.05, 0.05), # Slow horizontal drift
+                random.uniform(-0.05, 0.05)  # Slow vertical drift
+            ))
+        columns = np.array(stars, dtype=np.float64).reshape(-1, 8).T
+        self.stars = dict(zip(('x', 'y', 'size', 'brightness', 'twinkle_speed', 'twinkle_phase', 'dx', 'dy'),
+                              columns.copy()))
 
     def _update_and_draw_stars(self):
         """Update star positions and brightness, then draw them."""
-        map_rect = pygame.Rect(
-            self.offset_x, 
-            self.offset_y, 
-            self.world.width * self.grid_cell_size,
-            self.world.height * self.grid_cell_size
-        )
-
-        for star in self.stars:
+        stars = self.stars
+        star_mask = self._star_mask_with_bottom if self.show_bottom_panel else self._star_mask
+        
+        if NUMBA_AVAILABLE:
+            # one fused compiled pass over the stars instead of a string of numpy ops
+            star_x, star_y, color_val, radius, visible = _step_stars(
+                stars['x'], stars['y'], stars['dx'], stars['dy'], stars['twinkle_phase'],
+                stars['twinkle_speed'], stars['brightness'], stars['size'],
+                self.width, self.height, star_mask)
+            if not visible.any():
+                return
+            star_x = star_x[visible]
+            star_y = star_y[visible]
+            color_val = color_val[visible]
+            radius = radius[visible]
+        else:
             # Update position
-            star['x'] += star['dx']
-            star['y'] += star['dy']
+            x = stars['x']
+            y = stars['y']
+            x += stars['dx']
+            y += stars['dy']
 
             # Wrap stars around the screen
-            if star['x'] < 0: star['x'] = self.width
-            if star['x'] > self.width: star['x'] = 0
-            if star['y'] < 0: star['y'] = self.height
-            if star['y'] > self.height: star['y'] = 0
+            x[x < 0] = self.width
+            x[x > self.width] = 0
+            y[y < 0] = self.height
+            y[y > self.height] = 0
             
             # Update twinkle
-            star['twinkle_phase'] += star['twinkle_speed']
-            if star['twinkle_phase'] > 2 * math.pi:
-                star['twinkle_phase'] -= 2 * math.pi
+            phase = stars['twinkle_phase']
+            phase += stars['twinkle_speed']
+            phase[phase > 2 * math.pi] -= 2 * math.pi
             
             # Calculate current brightness based on sin wave
-            current_brightness_factor = (math.sin(star['twinkle_phase']) + 1) / 2 # Range 0 to 1
+            current_brightness_factor = (np.sin(phase) + 1) / 2 # Range 0 to 1
             # Modulate base brightness with twinkle factor
-            final_brightness = star['brightness'] * (0.5 + current_brightness_factor * 0.5) # Ensure stars don't get too dim
-
+            final_brightness = stars['brightness'] * (0.5 + current_brightness_factor * 0.5) # Ensure stars don't get too dim
+            
+            # Only draw stars in the background areas (not over map or panels)
+            star_x = x.astype(np.int64)
+            star_y = y.astype(np.int64)
+            visible = star_mask[star_x, star_y]
+            if not visible.any():
+                return
+            star_x = star_x[visible]
+            star_y = star_y[visible]
+            
             # Create star color (white-ish with varying brightness)
-            color_val = int(final_brightness * 200) + 55 # Range 55 to 255
-            star_color = (min(255,color_val), min(255,color_val + 10), min(255,color_val + 20))
+            color_val = (final_brightness[visible] * 200).astype(np.int64) + 55 # Range 55 to 255
+            current_size = stars['size'][visible] * (0.7 + current_brightness_factor[visible] * 0.3) # Size also varies with twinkle
+            radius = np.where(current_size >= 1, current_size, 0).astype(np.int64)
+        
+        # Draw circles for larger stars, single pixels for very small/dim ones (radius 0) - each
+        # from a cached sprite so the whole field goes out in one blits() call
+        sprites = self._star_sprites
+        batch = []
+        for sx, sy, cv, r in zip(star_x.tolist(), star_y.tolist(), color_val.tolist(), radius.tolist()):
+            sprite = sprites.get((r, cv))
+            if sprite is None:
+                sprite = self._make_star_sprite(r, cv)
+            if r:
+                batch.append((sprite, (sx - r - 1, sy - r - 1)))
+            else:
+                batch.append((sprite, (sx, sy)))
+        self.screen.blits(batch, doreturn=False)
 
-            # Only draw stars in the background areas (not over map or panels)
-            star_pos = (int(star['x']), int(star['y']))
-            if not map_rect.collidepoint(star_pos) and \
-               not (star_pos[0] < self.left_panel_width or \
-                    star_pos[0] > self.width - self.side_panel_width or \
-                    (self.show_bottom_panel and star_pos[1] > self.height - self.bottom_panel_height and \
-                     star_pos[0] > self.left_panel_width and star_pos[0] < self.width - self.side_panel_width)):
-                
-                current_size = star['size'] * (0.7 + current_brightness_factor * 0.3) # Size also varies with twinkle
-                if current_size >= 1: # Draw circles for larger stars
-                    pygame.draw.circle(self.screen, star_color, star_pos, int(current_size))
-                else: # Draw single pixels for very small/dim stars
-                     self.screen.set_at(star_pos, star_color)
+    def _build_star_masks(self):
+        """(x, y) grids of where stars may be drawn - everywhere but the map and the panels.
+        one 1px bigger than the screen each way, since wrapped stars can sit exactly on the edge"""
+        mask = np.ones((self.width + 1, self.height + 1), dtype=bool)
+        map_left, map_top, map_right, map_bottom = self._map_bounds
+        mask[max(0, map_left):max(0, map_right), max(0, map_top):max(0, map_bottom)] = False
+        mask[:self.left_panel_width] = False
+        mask[self.width - self.side_panel_width + 1:] = False
+        self._star_mask = mask
+        
+        # and with the bottom panel showing
+        with_bottom = mask.copy()
+        with_bottom[self.left_panel_width + 1:self.width - self.side_panel_width,
+                    self.height - self.bottom_panel_height + 1:] = False
+        self._star_mask_with_bottom = with_bottom
+
+    def _make_star_sprite(self, radius, color_val):
+        """star of the given radius (0 = a single pixel) and brightness, cached in _star_sprites"""
+        star_color = (min(255, color_val), min(255, color_val + 10), min(255, color_val + 20))
+        if radius:
+            sprite = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, star_color, (radius + 1, radius + 1), radius)
+        else:
+            sprite = pygame.Surface((1, 1))
+            sprite.fill(star_color)
+        self._star_sprites[(radius, color_val)] = sprite
+        return sprite
+
+    def _prerender_backgrounds(self):
+        """build the screen and panel gradient backgrounds"""
+        map_bg_color_top = (10, 20, 50)
+        map_bg_color_bottom = (30, 40, 80)
+        self._bg_gradient = self._make_gradient(
+            self.width, self.height, map_bg_color_top,
+            [bottom - top for top, bottom in zip(map_bg_color_top, map_bg_color_bottom)])
+        self._left_panel_bg = self._make_gradient(
+            self.left_panel_width, self.height, (10, 20, 50), (15, 20, 30))
+        self._side_panel_bg = self._make_gradient(
+            self.side_panel_width, self.height, (15, 25, 60), (15, 20, 30))
+        self._bottom_panel_bg = self._make_gradient(
+            self.width - self.left_panel_width - self.side_panel_width, self.bottom_panel_height,
+            (15, 25, 60), (15, 20, 30))
+
+    def _make_gradient(self, width, height, top, span):
+        """vertical gradient where row y is int(top + (y / height) * span) per channel -
+        built as a 1 pixel wide column and stretched to width"""
+        t = np.arange(height) / height
+        column = (np.asarray(top, dtype=np.float64) + t[:, None] * np.asarray(span, dtype=np.float64)).astype(np.uint8)
+        strip = pygame.surfarray.make_surface(column[None, :, :])
+        surface = pygame.transform.scale(strip, (width, height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
 
     def _prerender_terrain(self):
         """pre-render the terrain to a surface for performance"""
         self.terrain_surface = pygame.Surface((self.world.width * self.grid_cell_size, 
                                               self.world.height * self.grid_cell_size))
         
-        for x in range(self.world.width):
-            for y in range(self.world.height):
-                # calculate surface position
-                surface_x = x * self.grid_cell_size
-                surface_y = y * self.grid_cell_size
-                
-                # get terrain type at this position
-                terrain_type = self.world.get_terrain_at((x, y))
-                
-                # draw terrain
-                if terrain_type is not None:
-                    color = self.terrain_colors.get(terrain_type, (100, 100, 100))
-                    pygame.draw.rect(
-                        self.terrain_surface,
-                        color,
-                        (surface_x, surface_y, self.grid_cell_size, self.grid_cell_size)
-                    )
+        # one color lookup over the whole terrain grid (x, y order, same as surfarray), then each
+        # tile blown up to a grid_cell_size square
+        terrain = self.world.terrain
+        lut = np.full((max(max(self.terrain_colors), int(terrain.max())) + 1, 3), 100, dtype=np.uint8)
+        for terrain_type, color in self.terrain_colors.items():
+            lut[terrain_type] = color
+        cs = self.grid_cell_size
+        if cs > 0:
+            tiles = np.repeat(np.repeat(lut[terrain], cs, axis=0), cs, axis=1)
+            try:
+                pygame.surfarray.blit_array(self.terrain_surface, tiles)
+            except (ImportError, NotImplementedError):
+                # pygame built without surfarray support - fill merged runs instead
+                self._fill_terrain_runs(lut, cs)
 
-    def _cache_civilization_territory(self, civ, civ_index, force_update=False):
-        """cache the territory rendering for a civilization"""
-        if civ.id in self.territory_surfaces and not force_update:
-            return self.territory_surfaces[civ.id]
-            
-        # create new surface for this civilization's territory
-        territory_surface = pygame.Surface((self.world.width * self.grid_cell_size, 
-                                           self.world.height * self.grid_cell_size), 
-                                           pygame.SRCALPHA)
-        
-        # get color for this civilization
-        color = self.civilization_colors[civ_index % len(self.civilization_colors)]
-        
-        # make selected civilization stand out
-        is_selected = (civ == self.selected_civilization)
-        
-        # check if this civilization is protected
-        is_protected = hasattr(civ, 'protected_until_tick')
-        
-        # adjust brightness for selected and protected status
-        brightness = 1.0
-        if is_selected:
-            brightness += 0.3 * self.highlight_timer
-        if is_protected:
-            brightness += 0.5 + 0.2 * self.highlight_timer
-        
-        # enhanced brightness color
-        draw_color = (
-            min(255, int(color[0] * brightness)),
-            min(255, int(color[1] * brightness)),
-            min(255, int(color[2] * brightness))
-        )
+    def _fill_terrain_runs(self, lut, cs):
+        """draw the terrain one rect per horizontal run of the same terrain type, instead of
+        one per tile"""
+        terrain = self.world.terrain
+        for y in range(self.world.height):
+            row = terrain[:, y]
+            starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+            ends = np.r_[starts[1:], len(row)]
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self.terrain_surface.fill(tuple(lut[row[start]].tolist()),
+                                          (start * cs, y * cs, (end - start) * cs, cs))
+
+    def _get_territory_surface(self, civ, civ_color):
+        """translucent fill over a civ's territory with its outer borders drawn on, cropped to
+        its bounding box. returns (surface, screen position) - rebuilt only when the territory
+        or color changes"""
+        key = (civ.territory_version, civ_color)
+        cached = self._territory_surfaces.get(civ.id)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        
+        cs = self.grid_cell_size
+        xy = civ.territory_xy()
+        low = xy.min(axis=0)
+        local = xy - low
+        size = local.max(axis=0) + 1
+        mask = np.zeros(size, dtype=bool)
+        mask[local[:, 0], local[:, 1]] = True
+        pixel_mask = np.repeat(np.repeat(mask, cs, axis=0), cs, axis=1)
+        
+        # one spare pixel right and below - the 2px border lines reach 1px past their tile
+        surface = pygame.Surface((size[0] * cs + 1, size[1] * cs + 1), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[:-1, :-1][pixel_mask] = civ_color
+        del rgb  # unlock the surface
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:-1, :-1][pixel_mask] = 160
+        del alpha
+        
+        # Add civilization borders on every edge facing a tile that isn't ours. these are the
+        # pixels the old per-frame pygame.draw.line(..., 2) calls covered, as filled rects
+        mine = np.zeros(size + 2, dtype=bool)
+        mine[1:-1, 1:-1] = mask
+        lx = local[:, 0] + 1
+        ly = local[:, 1] + 1
+        border_color = (0, 0, 0, 255)  # the screen has no alpha, so the old lines were solid
+        for open_side, (ox, oy, w, h) in (
+            (~mine[lx, ly + 1], (0, cs - 1, cs + 1, 2)),  # Bottom
+            (~mine[lx + 1, ly], (cs - 1, 0, 2, cs + 1)),  # Right
+            (~mine[lx, ly - 1], (0, 0, cs + 1, 2)),  # Top
+            (~mine[lx - 1, ly], (0, 0, 2, cs + 1)),  # Left
+        ):
+            for x, y in local[open_side].tolist():
+                surface.fill(border_color, (x * cs + ox, y * cs + oy, w, h))
+        
+        position = (int(low[0]) * cs + self.offset_x, int(low[1]) * cs + self.offset_y)
+        self._territory_surfaces[civ.id] = (key, surface, position)
+        return surface, position
+
+    def _update_world_cache(self, drawn):
+        """bring the terrain + territories composite up to date with drawn, a list of (civ, color)
+        in draw order. the map is split into TERRITORY_SECTION x TERRITORY_SECTION tile panels and
+        only the panels under a civ whose territory or color changed (both where its surface was
+        and where it is now) get the terrain and every civ over them redrawn"""
+        placed = {}
+        for civ, civ_color in drawn:
+            # Draw main territory with transparency and borders - one cached surface per civ
+            surface, pos = self._get_territory_surface(civ, civ_color)
+            rect = surface.get_rect(topleft=(pos[0] - self.offset_x, pos[1] - self.offset_y))
+            placed[civ.id] = (civ.territory_version, civ_color, rect, surface)
+        
+        old = self._world_cache_civs
+        self._world_cache_civs = placed
+        same_order = [civ_id for civ_id in old if civ_id in placed] == [civ_id for civ_id in placed if civ_id in old]
+        if self._world_cache is None or not same_order:
+            # nothing to patch, or borders that overlap would now stack the other way round
+            self._world_cache = self.terrain_surface.copy()
+            for _, _, rect, surface in placed.values():
+                self._world_cache.blit(surface, rect)
+            return
         
-        # special border for protected civilizations
-        if is_protected:
-            border_color = (255, 255, 255)  # white border for protected
+        changed = []  # map rects to redraw under
+        for civ_id in old.keys() | placed.keys():
+            before, after = old.get(civ_id), placed.get(civ_id)
+            if before is not None and after is not None and before[:2] == after[:2]:
+                continue
+            changed += [entry[2] for entry in (before, after) if entry is not None]
+        panel_px = self.TERRITORY_SECTION * self.grid_cell_size
+        dirty = set()
+        for rect in changed:
+            for px in range(rect.left // panel_px, (rect.right - 1) // panel_px + 1):
+                for py in range(rect.top // panel_px, (rect.bottom - 1) // panel_px + 1):
+                    dirty.add((px, py))
+        
+        bounds = self._world_cache.get_rect()
+        for px, py in dirty:
+            panel = pygame.Rect(px * panel_px, py * panel_px, panel_px, panel_px).clip(bounds)
+            if not panel:
+                continue
+            self._world_cache.set_clip(panel)
+            self._world_cache.blit(self.terrain_surface, panel, panel)
+            for _, _, rect, surface in placed.values():
+                if rect.colliderect(panel):
+                    self._world_cache.blit(surface, rect)
+        self._world_cache.set_clip(None)
+
+    def _get_city_dot(self, radius, color):
+        """city marker (white circle, colored outline) on a transparent square, centered at
+        (radius + 1, radius + 1) - drawn once per radius and color"""
+        key = (radius, color)
+        dot = self._city_dot_cache.get(key)
+        if dot is None:
+            dot = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+            center = (radius + 1, radius + 1)
+            pygame.draw.circle(dot, (255, 255, 255), center, radius)
+            pygame.draw.circle(dot, color, center, radius, 2)
+            self._city_dot_cache[key] = dot
+        return dot
+
+    def _get_city_label(self, name):
+        """city name on its white box, ready to blit 2px up and left of the text position.
+        returns (surface, text rect)"""
+        cached = self._city_label_cache.get(name)
+        if cached is None:
+            name_surface, name_rect = self.font_small.render(name, (0, 0, 0))
+            
+            # Draw background for better visibility
+            label = pygame.Surface((name_rect.width + 4, name_rect.height + 4))
+            label.fill((255, 255, 255))
+            pygame.draw.rect(label, (0, 0, 0), label.get_rect(), 1)
+            label.blit(name_surface, (2, 2))
+            cached = (label, name_rect)
+            self._city_label_cache[name] = cached
+        return cached
+
+    def _get_text(self, font, text, color):
+        """text rendered once with font and color, then reused - most panel text is the same
+        from frame to frame. the least recently used strings are dropped past TEXT_CACHE_SIZE"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = font.render(text, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
         else:
-            border_color = (min(color[0] + 50, 255), min(color[1] + 50, 255), min(color[2] + 50, 255))
-        
-        # draw territory
-        for pos in civ.territory:
-            x, y = pos
-            surface_x = x * self.grid_cell_size
-            surface_y = y * self.grid_cell_size
-            
-            pygame.draw.rect(
-                territory_surface,
-                draw_color,
-                (surface_x, surface_y, self.grid_cell_size, self.grid_cell_size)
-            )
-            
-            pygame.draw.rect(
-                territory_surface,
-                border_color,
-                (surface_x, surface_y, self.grid_cell_size, self.grid_cell_size),
-                1
-            )
-        
-        # store in cache
-        self.territory_surfaces[civ.id] = territory_surface
-        return territory_surface
+            self._text_cache.move_to_end(key)
+        return surface
+
+    def _blit_text(self, font, pos, text, color, target=None):
+        """draw text at pos like font.render_to, from the text cache"""
+        (target or self.screen).blit(self._get_text(font, text, color), pos)
+
+    def _format_pop(self, civ):
+        """the civ's population as (short, long) text, reformatted only when it changes"""
+        cached = self._pop_text_cache.get(civ.id)
+        if cached is None or cached[0] != civ.population:
+            cached = (civ.population, *_format_population(civ.population))
+            self._pop_text_cache[civ.id] = cached
+        return cached[1], cached[2]
+
+    def _traits_text(self, civ):
+        """the civ's traits as (civ list line, full comma separated list). traits are only ever
+        swapped for a new list, never edited in place, so the text is kept until the list changes"""
+        cached = self._traits_text_cache.get(civ.id)
+        if cached is None or cached[0] is not civ.traits:
+            short = "Traits: " + ", ".join(civ.traits[:2])
+            if len(civ.traits) > 2:
+                short += "..."
+            cached = (civ.traits, short, ", ".join(civ.traits))
+            self._traits_text_cache[civ.id] = cached
+        return cached[1], cached[2]
+
+    def _new_territory(self, civ):
+        """tiles the civ gained since its last tick - only recomputed when either side changes"""
+        last_tick = getattr(civ, 'territory_last_tick', None)
+        if not last_tick:
+            return ()
+        key = (civ.territory_version, id(last_tick), len(last_tick))
+        cached = self._new_territory_cache.get(civ.id)
+        if cached is None or cached[0] != key:
+            cached = (key, civ.territory - last_tick)
+            self._new_territory_cache[civ.id] = cached
+        return cached[1]
+
+    def _refresh_civ_index(self):
+        """rebuild the civ -> list position map if world.civilizations changed since last time"""
+        civs = self.world.civilizations
+        if civs != self._civ_index_list:
+            self._civ_index_list = list(civs)
+            self._civ_index_map = {civ: i for i, civ in enumerate(civs)}
+
+    def _civ_index(self, civ):
+        """civ's position in world.civilizations as of the start of this frame, or None if it
+        isn't in there (collapsed)"""
+        return self._civ_index_map.get(civ)
 
     def _get_civilization_color(self, civ):
         """Get the color for a civilization.
@@ -272,9 +602,8 @@ class Renderer:
             A RGB tuple representing the color
         """
         # Find the index of this civilization in the world's list
-        try:
-            civ_index = self.world.civilizations.index(civ)
-        except ValueError:
+        civ_index = self._civ_index(civ)
+        if civ_index is None:
             # If civilization isn't in the list (might be collapsed), use its ID as index
             civ_index = civ.id
             
@@ -283,17 +612,15 @@ class Renderer:
 
     def render(self):
         """Render the entire simulation"""
-        # Create a background similar to main menu
-        map_bg_color_top = (10, 20, 50)
-        map_bg_color_bottom = (30, 40, 80)
+        self._refresh_civ_index()
         
-        # Fill the whole screen with gradient background
-        for y in range(self.height):
-            # Calculate gradient colors
-            r = int(map_bg_color_top[0] + (map_bg_color_bottom[0] - map_bg_color_top[0]) * (y / self.height))
-            g = int(map_bg_color_top[1] + (map_bg_color_bottom[1] - map_bg_color_top[1]) * (y / self.height))
-            b = int(map_bg_color_top[2] + (map_bg_color_bottom[2] - map_bg_color_top[2]) * (y / self.height))
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        # Update highlight animation - a 0.3..1.0 triangle wave off the clock, so the pulse runs
+        # at the same speed whatever the frame rate and holds still within a frame
+        phase = (pygame.time.get_ticks() % self.HIGHLIGHT_PERIOD_MS) / (self.HIGHLIGHT_PERIOD_MS / 2)
+        self.highlight_timer = 0.3 + 0.7 * (phase if phase < 1.0 else 2.0 - phase)
+        
+        # Fill the whole screen with gradient background (similar to main menu, see _prerender_backgrounds)
+        self.screen.blit(self._bg_gradient, (0, 0))
         
         # Update and draw the starfield
         self._update_and_draw_stars()
@@ -315,86 +642,48 @@ class Renderer:
         if self.event_notification:
             self._render_notification()
         
-        # Update highlight animation
-        self.highlight_timer += 0.05 * self.highlight_direction
-        if self.highlight_timer > 1.0:
-            self.highlight_direction = -1
-            self.highlight_timer = 1.0
-        elif self.highlight_timer < 0.3:
-            self.highlight_direction = 1
-            self.highlight_timer = 0.3
-        
         # Draw civilization details popup if active
         if self.showing_civ_details and self.detail_civ:
             self._draw_civ_details()
     
     def _render_world_grid(self):
         """Render the world grid with civilizations"""
-        # Draw the pre-rendered terrain
-        self.screen.blit(self.terrain_surface, (self.offset_x, self.offset_y))
-        
-        # Track new territories to highlight them
-        new_territories = {}
-        for civ in self.world.civilizations:
-            if hasattr(civ, 'territory_last_tick'):
-                new_territories[civ.id] = set()
-                for pos in civ.territory:
-                    if civ.territory_last_tick and pos not in civ.territory_last_tick:
-                        new_territories[civ.id].add(pos)
-        
-        # Draw civilization territories
-        for civ in self.world.civilizations:
-            # Skip drawing collapsed civs
-            if hasattr(civ, 'has_collapsed') and civ.has_collapsed:
-                continue
-                
-            # Get civilization color
-            civ_color = self._get_civilization_color(civ)
-            
-            # Draw territory with border effect
-            for pos in civ.territory:
-                x, y = pos
+        # pulse strengths for this frame - the same for every tile they're applied to
+        pulse_alpha = int(128 + 127 * abs(math.sin(self.highlight_timer * 10)))  # new territory
+        selection_alpha = int(128 + 127 * abs(math.sin(self.highlight_timer * 5)))  # selected tile
+        
+        # Draw the pre-rendered terrain with every civ's territory on it. the composite only
+        # changes when some civ's territory (or color) does, so it's patched then and reused
+        drawn = [(civ, self._get_civilization_color(civ)) for civ in self.world.civilizations
+                 if not civ.has_collapsed and civ.territory]  # Skip drawing collapsed civs
+        key = tuple((civ.id, civ.territory_version, civ_color) for civ, civ_color in drawn)
+        if key != self._world_cache_key:
+            self._update_world_cache(drawn)
+            self._world_cache_key = key
+        self.screen.blit(self._world_cache, (self.offset_x, self.offset_y))
+        
+        # Highlight newly acquired territories with pulsing effect
+        for civ, _ in drawn:
+            for x, y in self._new_territory(civ):
                 screen_x = x * self.grid_cell_size + self.offset_x
                 screen_y = y * self.grid_cell_size + self.offset_y
-                
-                # Draw main territory with transparency
-                territory_surface = pygame.Surface((self.grid_cell_size, self.grid_cell_size), pygame.SRCALPHA)
-                territory_surface.fill((civ_color[0], civ_color[1], civ_color[2], 160))
-                self.screen.blit(territory_surface, (screen_x, screen_y))
-                
-                # Highlight newly acquired territories with pulsing effect
-                if civ.id in new_territories and pos in new_territories[civ.id]:
-                    # Create pulsing border effect
-                    highlight_alpha = int(128 + 127 * abs(math.sin(self.highlight_timer * 10)))
-                    pygame.draw.rect(self.screen, 
-                                    (255, 255, 255, highlight_alpha), 
-                                    pygame.Rect(screen_x, screen_y, self.grid_cell_size, self.grid_cell_size), 2)
-                    
-                # Add civilization borders
-                borders = []
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    adj_pos = (x + dx, y + dy)
-                    # Check if adjacent tile is outside civ territory
-                    if adj_pos not in civ.territory:
-                        if dx == 0 and dy == 1:  # Bottom
-                            borders.append(((0, self.grid_cell_size-1), (self.grid_cell_size, self.grid_cell_size-1)))
-                        elif dx == 1 and dy == 0:  # Right
-                            borders.append(((self.grid_cell_size-1, 0), (self.grid_cell_size-1, self.grid_cell_size)))
-                        elif dx == 0 and dy == -1:  # Top
-                            borders.append(((0, 0), (self.grid_cell_size, 0)))
-                        elif dx == -1 and dy == 0:  # Left
-                            borders.append(((0, 0), (0, self.grid_cell_size)))
-                
-                # Draw borders
-                for (x1, y1), (x2, y2) in borders:
-                    pygame.draw.line(self.screen, (0, 0, 0, 200), 
-                                     (screen_x + x1, screen_y + y1),
-                                     (screen_x + x2, screen_y + y2), 2)
+                pygame.draw.rect(self.screen, 
+                                (255, 255, 255, pulse_alpha), 
+                                pygame.Rect(screen_x, screen_y, self.grid_cell_size, self.grid_cell_size), 2)
+        
+        # forget territory surfaces of civs that are gone
+        if len(self._territory_surfaces) > len(self.world.civilizations):
+            live = {civ.id for civ in self.world.civilizations}
+            for civ_id in [civ_id for civ_id in self._territory_surfaces if civ_id not in live]:
+                del self._territory_surfaces[civ_id]
+                self._new_territory_cache.pop(civ_id, None)
+                self._pop_text_cache.pop(civ_id, None)
+                self._traits_text_cache.pop(civ_id, None)
         
         # Draw cities
         if self.show_cities:
             for civ in self.world.civilizations:
-                if hasattr(civ, 'has_collapsed') and civ.has_collapsed:
+                if civ.has_collapsed:
                     continue
                     
                 civ_color = self._get_civilization_color(civ)
@@ -404,26 +693,19 @@ class Renderer:
                     screen_x = x * self.grid_cell_size + self.offset_x + self.grid_cell_size // 2
                     screen_y = y * self.grid_cell_size + self.offset_y + self.grid_cell_size // 2
                     
-                    # Draw city dot (white circle with black outline)
+                    # Draw city dot (white circle with civ colored outline)
                     city_radius = min(8, max(4, int(math.log(city["population"] + 1, 10) * 2)))
-                    pygame.draw.circle(self.screen, (255, 255, 255), (screen_x, screen_y), city_radius)
-                    pygame.draw.circle(self.screen, civ_color, (screen_x, screen_y), city_radius, 2)
+                    dot = self._get_city_dot(city_radius, civ_color)
+                    self.screen.blit(dot, (screen_x - city_radius - 1, screen_y - city_radius - 1))
                     
                     # Draw city name if showing labels or this city is selected
                     if self.show_all_labels or (self.selected_position == pos):
-                        name_font = pygame.freetype.SysFont("Arial", 12)
-                        name_surface, name_rect = name_font.render(city["name"], (0, 0, 0))
+                        label, name_rect = self._get_city_label(city["name"])
                         
                         # Position name above city
                         name_x = screen_x - name_rect.width // 2
                         name_y = screen_y - name_rect.height - 10
-                        
-                        # Draw background for better visibility
-                        bg_rect = pygame.Rect(name_x - 2, name_y - 2, name_rect.width + 4, name_rect.height + 4)
-                        pygame.draw.rect(self.screen, (255, 255, 255, 180), bg_rect)
-                        pygame.draw.rect(self.screen, (0, 0, 0), bg_rect, 1)
-                        
-                        self.screen.blit(name_surface, (name_x, name_y))
+                        self.screen.blit(label, (name_x - 2, name_y - 2))
         
         # Draw highlighted position if any
         if self.selected_position:
@@ -432,36 +714,20 @@ class Renderer:
             screen_y = y * self.grid_cell_size + self.offset_y
             
             # Create pulsing highlight effect
-            highlight_alpha = int(128 + 127 * abs(math.sin(self.highlight_timer * 5)))
-            highlight_surface = pygame.Surface((self.grid_cell_size, self.grid_cell_size), pygame.SRCALPHA)
-            highlight_surface.fill((255, 255, 255, highlight_alpha // 2))
-            self.screen.blit(highlight_surface, (screen_x, screen_y))
+            self._highlight_surface.set_alpha(selection_alpha // 2)
+            self.screen.blit(self._highlight_surface, (screen_x, screen_y))
             
             # Draw selection border
             pygame.draw.rect(self.screen, (255, 255, 255), 
                            pygame.Rect(screen_x, screen_y, self.grid_cell_size, self.grid_cell_size), 2)
-            
-        # Update highlight animation
-        self.highlight_timer -= 0.016  # Assuming 60fps
-        if self.highlight_timer <= 0:
-            self.highlight_timer = 0.3
-            self.highlight_direction *= -1
 
     def _render_left_panel(self):
         """Render left panel with buttons and controls"""
         # Draw left panel background with gradient similar to main menu
         panel_rect = pygame.Rect(0, 0, self.left_panel_width, self.height)
         
-        # Create gradient background
-        panel_surface = pygame.Surface((self.left_panel_width, self.height))
-        for y in range(self.height):
-            r = int(10 + (y / self.height) * 15)
-            g = int(20 + (y / self.height) * 20)
-            b = int(50 + (y / self.height) * 30)
-            pygame.draw.line(panel_surface, (r, g, b), (0, y), (self.left_panel_width, y))
-        
         # Blit the gradient background
-        self.screen.blit(panel_surface, (0, 0))
+        self.screen.blit(self._left_panel_bg, (0, 0))
         
         # Add border with glow effect
         pygame.draw.rect(self.screen, (100, 150, 250, 150), panel_rect, 1)
@@ -491,16 +757,8 @@ class Renderer:
         panel_rect = pygame.Rect(self.width - self.side_panel_width, 0, 
                                 self.side_panel_width, self.height)
         
-        # Create gradient background
-        panel_surface = pygame.Surface((self.side_panel_width, self.height))
-        for y in range(self.height):
-            r = int(15 + (y / self.height) * 15)
-            g = int(25 + (y / self.height) * 20)
-            b = int(60 + (y / self.height) * 30)
-            pygame.draw.line(panel_surface, (r, g, b), (0, y), (self.side_panel_width, y))
-        
         # Blit the gradient background
-        self.screen.blit(panel_surface, (self.width - self.side_panel_width, 0))
+        self.screen.blit(self._side_panel_bg, (self.width - self.side_panel_width, 0))
         
         # Add border with glow effect
         pygame.draw.rect(self.screen, (100, 150, 250, 150), panel_rect, 1)
@@ -508,14 +766,14 @@ class Renderer:
         # Draw title with shadow
         title_shadow_pos = (self.width - self.side_panel_width + 11, 11)
         title_pos = (self.width - self.side_panel_width + 10, 10)
-        self.font_large.render_to(
-            self.screen, 
+        self._blit_text(
+            self.font_large,
             title_shadow_pos,
             "Civilization Info",
             (0, 0, 0)
         )
-        self.font_large.render_to(
-            self.screen, 
+        self._blit_text(
+            self.font_large,
             title_pos,
             "Civilization Info",
             (255, 255, 255)
@@ -531,20 +789,20 @@ class Renderer:
         
         # Otherwise show a hint
         else:
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (self.width - self.side_panel_width + 10, 50),
                 "Click on the map to select",
                 (220, 220, 255)
             )
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (self.width - self.side_panel_width + 10, 70),
                 "a civilization or press C",
                 (220, 220, 255)
             )
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (self.width - self.side_panel_width + 10, 90),
                 "to show civilization list.",
                 (220, 220, 255)
@@ -556,16 +814,8 @@ class Renderer:
         panel_rect = pygame.Rect(self.left_panel_width, self.height - self.bottom_panel_height, 
                                 self.width - self.left_panel_width - self.side_panel_width, self.bottom_panel_height)
         
-        # Create gradient background
-        panel_surface = pygame.Surface((panel_rect.width, panel_rect.height))
-        for y in range(panel_rect.height):
-            r = int(15 + (y / panel_rect.height) * 15)
-            g = int(25 + (y / panel_rect.height) * 20)
-            b = int(60 + (y / panel_rect.height) * 30)
-            pygame.draw.line(panel_surface, (r, g, b), (0, y), (panel_rect.width, y))
-        
         # Blit the gradient background
-        self.screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
+        self.screen.blit(self._bottom_panel_bg, (panel_rect.x, panel_rect.y))
         
         # Add border with glow effect
         pygame.draw.rect(self.screen, (100, 150, 250, 150), panel_rect, 1)
@@ -575,8 +825,8 @@ class Renderer:
             self._render_position_info()
         else:
             # Show a hint when nothing is selected
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (self.left_panel_width + 10, self.height - self.bottom_panel_height + 10),
                 "Click on the map to select a tile or civilization",
                 (220, 220, 255)
@@ -597,7 +847,7 @@ class Renderer:
         color = self.civilization_colors[civ_index % len(self.civilization_colors)]
         
         # Check if this civilization is protected or selected
-        is_protected = hasattr(civ, 'protected_until_tick')
+        is_protected = civ.protected_until_tick is not None
         is_selected = (civ == self.selected_civilization)
         
         # Only show labels for larger civilizations or when selected, protected, or show_all_labels is true
@@ -616,9 +866,10 @@ class Renderer:
             )
             
             # Semi-transparent background for better visibility
-            label_bg = pygame.Surface((label_width, 20), pygame.SRCALPHA)
+            label_bg = self._surface_pool.get((label_width, 20), pygame.SRCALPHA)
             label_bg.fill((0, 0, 0, 180))  # Semi-transparent black
             self.screen.blit(label_bg, (label_x - label_width // 2, label_y - 20))
+            self._surface_pool.release(label_bg)
             
             if is_protected:
                 # Gold/white border for protected civilizations
@@ -631,8 +882,8 @@ class Renderer:
             if is_protected:
                 label_text += " ⛨"  # Protection symbol
             
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (label_x - label_width // 2 + 5, label_y - 17),
                 label_text,
                 (255, 255, 255) if is_protected else color
@@ -643,38 +894,28 @@ class Renderer:
         # Render in the side panel
         list_start_y = 50
         list_width = self.side_panel_width - 20
+        list_x = self.width - self.side_panel_width
+        
+        # everything in the list goes out in one screen.blits() call at the end
+        blit_seq = []
         
         # Title
-        self.font.render_to(
-            self.screen, 
-            (self.width - self.side_panel_width + 10, list_start_y), 
-            "Active Civilizations", 
-            (255, 255, 255)
-        )
+        blit_seq.append((self._get_text(self.font, "Active Civilizations", (255, 255, 255)),
+                         (list_x + 10, list_start_y)))
         
         # Counter
         total = len(self.world.civilizations)
-        self.font.render_to(
-            self.screen,
-            (self.width - self.side_panel_width + 10, list_start_y + 25),
-            f"Total: {total} civilization{'s' if total != 1 else ''}",
-            (200, 200, 200)
-        )
+        blit_seq.append((self._get_text(self.font, f"Total: {total} civilization{'s' if total != 1 else ''}",
+                                        (200, 200, 200)),
+                         (list_x + 10, list_start_y + 25)))
         
         # If no civilizations, show a message
         if total == 0:
-            self.font.render_to(
-                self.screen,
-                (self.width - self.side_panel_width + 10, list_start_y + 55),
-                "No civilizations yet!",
-                (255, 100, 100)
-            )
-            self.font.render_to(
-                self.screen,
-                (self.width - self.side_panel_width + 10, list_start_y + 75),
-                "Use God Mode to add some.",
-                (200, 200, 200)
-            )
+            blit_seq.append((self._get_text(self.font, "No civilizations yet!", (255, 100, 100)),
+                             (list_x + 10, list_start_y + 55)))
+            blit_seq.append((self._get_text(self.font, "Use God Mode to add some.", (200, 200, 200)),
+                             (list_x + 10, list_start_y + 75)))
+            self.screen.blits(blit_seq, doreturn=False)
             return
         
         # Calculate how many civilizations can fit in the panel
@@ -684,93 +925,56 @@ class Renderer:
         for i in range(max_visible):
             civ = self.world.civilizations[i]
             color = self.civilization_colors[i % len(self.civilization_colors)]
+            swatch, highlight = self._get_civ_list_swatches(color, list_width)
             
             y_pos = list_start_y + 55 + i * 70
             
             # Highlight if this is the selected civilization
             if civ == self.selected_civilization:
-                highlight_rect = pygame.Rect(
-                    self.width - self.side_panel_width + 5, 
-                    y_pos - 5, 
-                    list_width, 
-                    65
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    (60, 60, 60),
-                    highlight_rect
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    color,
-                    highlight_rect,
-                    1
-                )
+                blit_seq.append((highlight, (list_x + 5, y_pos - 5)))
             
             # Draw color indicator
-            pygame.draw.rect(
-                self.screen,
-                color,
-                (self.width - self.side_panel_width + 10, y_pos, 15, 15)
-            )
+            blit_seq.append((swatch, (list_x + 10, y_pos)))
             
             # Draw civilization name and basic info
             civ_text = f"{civ.name}"
-            self.font.render_to(
-                self.screen, 
-                (self.width - self.side_panel_width + 30, y_pos), 
-                civ_text, 
-                (255, 255, 255)
-            )
+            blit_seq.append((self._get_text(self.font, civ_text, (255, 255, 255)), (list_x + 30, y_pos)))
             
-            # Format population with commas and handle large numbers
-            if civ.population > 1000000000:
-                pop_text = f"{civ.population/1000000000:.1f}B"
-            elif civ.population > 1000000:
-                pop_text = f"{civ.population/1000000:.1f}M"
-            elif civ.population > 1000:
-                pop_text = f"{civ.population/1000:.1f}K"
-            else:
-                pop_text = f"{civ.population}"
-                
             # Population and territory
-            pop_text = f"Pop: {pop_text} | Territory: {len(civ.territory)}"
-            self.font_small.render_to(
-                self.screen, 
-                (self.width - self.side_panel_width + 30, y_pos + 20), 
-                pop_text, 
-                (200, 200, 200)
-            )
+            pop_text = f"Pop: {self._format_pop(civ)[0]} | Territory: {len(civ.territory)}"
+            blit_seq.append((self._get_text(self.font_small, pop_text, (200, 200, 200)), (list_x + 30, y_pos + 20)))
             
             # Technology and resources
             tech_text = f"Tech: {civ.technology:.1f} | Cities: {len(civ.cities)}"
-            self.font_small.render_to(
-                self.screen, 
-                (self.width - self.side_panel_width + 30, y_pos + 35), 
-                tech_text, 
-                (200, 200, 200)
-            )
+            blit_seq.append((self._get_text(self.font_small, tech_text, (200, 200, 200)), (list_x + 30, y_pos + 35)))
             
             # Traits
             if civ.traits:
-                traits_text = "Traits: " + ", ".join(civ.traits[:2])
-                if len(civ.traits) > 2:
-                    traits_text += "..."
-                self.font_small.render_to(
-                    self.screen, 
-                    (self.width - self.side_panel_width + 30, y_pos + 50), 
-                    traits_text, 
-                    (180, 180, 220)
-                )
+                traits_text = self._traits_text(civ)[0]
+                blit_seq.append((self._get_text(self.font_small, traits_text, (180, 180, 220)),
+                                 (list_x + 30, y_pos + 50)))
         
         # If there are more civilizations than can fit, show a message
         if total > max_visible:
-            self.font_small.render_to(
-                self.screen,
-                (self.width - self.side_panel_width + 10, list_start_y + 55 + max_visible * 70),
-                f"+ {total - max_visible} more...",
-                (200, 200, 200)
-            )
+            blit_seq.append((self._get_text(self.font_small, f"+ {total - max_visible} more...", (200, 200, 200)),
+                             (list_x + 10, list_start_y + 55 + max_visible * 70)))
+        
+        self.screen.blits(blit_seq, doreturn=False)
+
+    def _get_civ_list_swatches(self, color, list_width):
+        """(color indicator, selected-row highlight) surfaces for the civ list - drawn once per
+        color and list width"""
+        key = (color, list_width)
+        cached = self._civ_list_swatch_cache.get(key)
+        if cached is None:
+            swatch = pygame.Surface((15, 15))
+            swatch.fill(color)
+            highlight = pygame.Surface((list_width, 65))
+            highlight.fill((60, 60, 60))
+            pygame.draw.rect(highlight, color, highlight.get_rect(), 1)
+            cached = (swatch, highlight)
+            self._civ_list_swatch_cache[key] = cached
+        return cached
 
     def _render_civilization_info(self):
         """Render information about the selected civilization"""
@@ -781,8 +985,7 @@ class Renderer:
         start_x = self.width - self.side_panel_width + 10
         
         # Civilization name and color
-        civ_index = self.world.civilizations.index(civ)
-        color = self.civilization_colors[civ_index % len(self.civilization_colors)]
+        color = self._get_civilization_color(civ)
         
         # Draw color box
         pygame.draw.rect(
@@ -792,8 +995,8 @@ class Renderer:
         )
         
         # Civilization name
-        self.font_large.render_to(
-            self.screen, 
+        self._blit_text(
+            self.font_large,
             (start_x + 25, start_y), 
             civ.name, 
             (255, 255, 255)
@@ -802,52 +1005,42 @@ class Renderer:
         # Basic info
         start_y += 30
         
-        # Format population with commas and handle large numbers
-        if civ.population > 1000000000:
-            pop_text = f"{civ.population/1000000000:.1f} billion"
-        elif civ.population > 1000000:
-            pop_text = f"{civ.population/1000000:.1f} million"
-        elif civ.population > 1000:
-            pop_text = f"{civ.population/1000:.1f} thousand"
-        else:
-            pop_text = f"{civ.population}"
-            
-        basic_info = f"Population: {pop_text}"
-        self.font.render_to(self.screen, (start_x, start_y), basic_info, (255, 255, 255))
+        basic_info = f"Population: {self._format_pop(civ)[1]}"
+        self._blit_text(self.font, (start_x, start_y), basic_info, (255, 255, 255))
         
         start_y += 20
         territory_info = f"Territory: {len(civ.territory)} tiles | Cities: {len(civ.cities)}"
-        self.font.render_to(self.screen, (start_x, start_y), territory_info, (255, 255, 255))
+        self._blit_text(self.font, (start_x, start_y), territory_info, (255, 255, 255))
         
         start_y += 20
         tech_info = f"Technology: {civ.technology:.1f}"
-        self.font.render_to(self.screen, (start_x, start_y), tech_info, (255, 255, 255))
+        self._blit_text(self.font, (start_x, start_y), tech_info, (255, 255, 255))
         
         # Traits and belief system
         start_y += 30
         traits_text = f"Traits:"
-        self.font.render_to(self.screen, (start_x, start_y), traits_text, (255, 255, 255))
+        self._blit_text(self.font, (start_x, start_y), traits_text, (255, 255, 255))
         
         start_y += 20
         for trait in civ.traits:
-            self.font_small.render_to(self.screen, (start_x + 10, start_y), trait, (200, 200, 200))
+            self._blit_text(self.font_small, (start_x + 10, start_y), trait, (200, 200, 200))
             start_y += 15
         
         start_y += 15
         belief_text = f"Belief System:"
-        self.font.render_to(self.screen, (start_x, start_y), belief_text, (255, 255, 255))
+        self._blit_text(self.font, (start_x, start_y), belief_text, (255, 255, 255))
         
         start_y += 20
-        self.font_small.render_to(
-            self.screen, 
+        self._blit_text(
+            self.font_small,
             (start_x + 10, start_y), 
             civ.belief_system.name, 
             (200, 200, 200)
         )
         
         start_y += 15
-        self.font_small.render_to(
-            self.screen, 
+        self._blit_text(
+            self.font_small,
             (start_x + 10, start_y), 
             f"Stance: {civ.belief_system.foreign_stance}", 
             (200, 200, 200)
@@ -856,13 +1049,13 @@ class Renderer:
         # Resources
         start_y += 30
         resources_text = "Resources:"
-        self.font.render_to(self.screen, (start_x, start_y), resources_text, (255, 255, 255))
+        self._blit_text(self.font, (start_x, start_y), resources_text, (255, 255, 255))
         
         start_y += 20
         for resource, amount in civ.resources.items():
             resource_text = f"{resource}: {amount:.1f}"
-            self.font_small.render_to(
-                self.screen, 
+            self._blit_text(
+                self.font_small,
                 (start_x + 10, start_y), 
                 resource_text, 
                 (200, 200, 200)
@@ -872,8 +1065,8 @@ class Renderer:
         # Draw "God Mode Actions Available" if god mode is active
         if self.god_mode_active:
             start_y += 20
-            self.font.render_to(
-                self.screen,
+            self._blit_text(
+                self.font,
                 (start_x, start_y),
                 "God Mode Actions Available!",
                 (255, 200, 0)
@@ -909,34 +1102,30 @@ class Renderer:
         popup_y = (h - popup_height) // 2
         
         # Draw popup background with transparency
-        popup_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+        popup_surface = self._surface_pool.get((popup_width, popup_height), pygame.SRCALPHA)
         popup_surface.fill((30, 30, 30, 230))  # Dark, semi-transparent background
         
         # Draw border
         border_color = (150, 150, 150)
         if self.event_notification["civ"]:
             # Check if civilization still exists before trying to get its color
-            civ = self.event_notification["civ"]
-            try:
-                if civ in self.world.civilizations:
-                    civ_index = self.world.civilizations.index(civ)
-                    border_color = self.civilization_colors[civ_index % len(self.civilization_colors)]
-                else:
-                    # Civilization no longer exists (likely collapsed), use a default color
-                    border_color = (200, 100, 100)  # Reddish color for collapsed civs
-            except ValueError:
-                # Handle case where civ can't be found in list
-                border_color = (200, 100, 100)
+            civ_index = self._civ_index(self.event_notification["civ"])
+            if civ_index is not None:
+                border_color = self.civilization_colors[civ_index % len(self.civilization_colors)]
+            else:
+                # Civilization no longer exists (likely collapsed), use a default color
+                border_color = (200, 100, 100)  # Reddish color for collapsed civs
         
         pygame.draw.rect(popup_surface, border_color, (0, 0, popup_width, popup_height), 3)
         
         # Draw title
-        title_font = pygame.freetype.SysFont("Arial", 24)
-        title_font.render_to(
-            popup_surface,
+        title_font = self._notif_title_font
+        self._blit_text(
+            title_font,
             (20, 20),
             self.event_notification["title"],
-            (255, 255, 255)
+            (255, 255, 255),
+            popup_surface
         )
         
         # Draw underline
@@ -949,46 +1138,68 @@ class Renderer:
         )
         
         # Draw message with word wrap
-        message_font = pygame.freetype.SysFont("Arial", 18)
-        message = self.event_notification["message"]
-        
-        # Simple word wrap
-        words = message.split(' ')
-        lines = []
-        current_line = words[0]
-        
-        for word in words[1:]:
-            test_line = current_line + ' ' + word
-            text_width, _ = message_font.get_rect(test_line)[2:4]
-            
-            if text_width < popup_width - 40:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        
-        lines.append(current_line)
+        message_font = self._notif_msg_font
+        lines = self._wrap_notification(self.event_notification["message"], popup_width - 40)
         
         # Render each line
         for i, line in enumerate(lines):
-            message_font.render_to(
-                popup_surface,
+            self._blit_text(
+                message_font,
                 (20, 70 + i * 25),
                 line,
-                (220, 220, 220)
+                (220, 220, 220),
+                popup_surface
             )
         
         # Draw "Click to dismiss" message
-        dismiss_font = pygame.freetype.SysFont("Arial", 14)
-        dismiss_font.render_to(
-            popup_surface,
+        dismiss_font = self._notif_dismiss_font
+        self._blit_text(
+            dismiss_font,
             (popup_width - 150, popup_height - 30),
             "Click to dismiss",
-            (180, 180, 180)
+            (180, 180, 180),
+            popup_surface
         )
         
         # Blit the popup to the screen
         self.screen.blit(popup_surface, (popup_x, popup_y))
+        self._surface_pool.release(popup_surface)
+
+    def _wrap_notification(self, message, max_width):
+        """word wrap a notification message into lines narrower than max_width. line widths are
+        summed from per-word widths, and the result is kept for as long as the message is up"""
+        key = (message, max_width)
+        if self._notification_lines is not None and self._notification_lines[0] == key:
+            return self._notification_lines[1]
+        
+        # widths are summed glyph advances - unlike get_rect's ink box they add up across words
+        # and spaces without losing the side bearings
+        message_font = self._notif_msg_font
+        def advance(text):
+            return sum(metrics[4] for metrics in message_font.get_metrics(text) if metrics)
+        
+        # Simple word wrap
+        words = message.split(' ')
+        widths = [advance(word) for word in words]
+        space_width = advance(' ')
+        lines = []
+        current_line = words[0]
+        current_width = widths[0]
+        
+        for word, word_width in zip(words[1:], widths[1:]):
+            test_width = current_width + space_width + word_width
+            
+            if test_width < max_width:
+                current_line = current_line + ' ' + word
+                current_width = test_width
+            else:
+                lines.append(current_line)
+                current_line = word
+                current_width = word_width
+        
+        lines.append(current_line)
+        self._notification_lines = (key, lines)
+        return lines
 
     def _render_position_info(self):
         """Render information about the selected position"""
@@ -1024,25 +1235,25 @@ class Renderer:
         pos_x = self.left_panel_width + 10
         pos_y = self.height - self.bottom_panel_height + 10
         text = f"Position: ({x}, {y}) | Terrain: {terrain_name}{resource_text}"
-        self.font.render_to(self.screen, (pos_x, pos_y), text, (255, 255, 255))
+        self._blit_text(self.font, (pos_x, pos_y), text, (255, 255, 255))
         
         # Continue with owner info on next line if needed
         if civ_text:
-            self.font.render_to(self.screen, (pos_x, pos_y + 20), civ_text, (255, 255, 255))
+            self._blit_text(self.font, (pos_x, pos_y + 20), civ_text, (255, 255, 255))
         
         # If it's a city, show additional details
         if city_info:
             details = f"City Details - Name: {city_info['name']} | Population: {city_info['population']}"
-            self.font.render_to(self.screen, (pos_x, pos_y + 40), details, (220, 220, 255))
+            self._blit_text(self.font, (pos_x, pos_y + 40), details, (220, 220, 255))
             
             # Additional city details if available
             if len(civ_text) > 0:
                 civ = civs_at_pos[0]
-                city_traits = f"City Owner Traits: {', '.join(civ.traits)}"
-                self.font.render_to(self.screen, (pos_x, pos_y + 60), city_traits, (200, 200, 255))
+                city_traits = f"City Owner Traits: {self._traits_text(civ)[1]}"
+                self._blit_text(self.font, (pos_x, pos_y + 60), city_traits, (200, 200, 255))
                 
                 belief_text = f"Belief System: {civ.belief_system.name} ({civ.belief_system.foreign_stance})"
-                self.font.render_to(self.screen, (pos_x, pos_y + 80), belief_text, (200, 200, 255))
+                self._blit_text(self.font, (pos_x, pos_y + 80), belief_text, (200, 200, 255))
 
     def check_notification_click(self, pos):
         """Check if a notification was clicked and dismiss it if so"""
@@ -1116,7 +1327,7 @@ class Renderer:
             
             # Draw the symbol in white with colored border
             font_size = max(12, min(int(math.log10(location_info["population"]) * 3), self.grid_cell_size))
-            symbol_font = pygame.freetype.SysFont("Arial", font_size)
+            symbol_font = _get_font("Arial", font_size)
             
             text_surf, text_rect = symbol_font.render(location_symbol, (255, 255, 255))
             text_rect.center = (screen_x, screen_y)
@@ -1187,14 +1398,8 @@ class Renderer:
         x, y = screen_pos
         
         # Check if click is within the map area
-        map_rect = pygame.Rect(
-            self.offset_x, 
-            self.offset_y, 
-            self.world.width * self.grid_cell_size,
-            self.world.height * self.grid_cell_size
-        )
-        
-        if not map_rect.collidepoint(x, y):
+        map_left, map_top, map_right, map_bottom = self._map_bounds
+        if not (map_left <= x < map_right and map_top <= y < map_bottom):
             return False
             
         # Calculate grid coordinates
@@ -1295,13 +1500,6 @@ class Renderer:
             self.showing_civ_details = False
             return
         
-        # Import lore generator with error handling
-        try:
-            from src.lore import get_detailed_civilization_info
-        except ImportError as e:
-            print(f"Error importing lore module: {e}")
-            get_detailed_civilization_info = None
-        
         screen_width, screen_height = self.screen.get_size()
         
         # Create detail surface if needed
@@ -1328,27 +1526,18 @@ class Renderer:
             # Reset scroll position
             self.detail_scroll_y = 0
         
-        # Fill with solid deep blue background (no transparency)
-        primary_bg_color = (20, 35, 65)
-        self.detail_surface.fill(primary_bg_color)
-        
-        # Add subtle gradient at the top
-        for y in range(40):
-            gradient_strength = 40 - y
-            if gradient_strength > 0:
-                gradient_color = (
-                    min(255, primary_bg_color[0] + gradient_strength),
-                    min(255, primary_bg_color[1] + gradient_strength),
-                    min(255, primary_bg_color[2] + gradient_strength*2)
-                )
-                pygame.draw.line(self.detail_surface, gradient_color,
-                               (0, y), (self.detail_surface.get_width(), y))
-        
-        # Draw an elegant border
-        border_color = (80, 120, 200)
-        pygame.draw.rect(self.detail_surface, border_color,
-                       (0, 0, self.detail_surface.get_width(), self.detail_surface.get_height()),
-                       2, border_radius=12)
+        # the popup body only changes with the civ, the scroll position, the popup size and the
+        # simulation moving on (or a god event hitting the civ, which can happen while paused -
+        # shift_ideology swaps the traits list and belief system) - otherwise the last one is
+        # reused and just the parts that react to the mouse are drawn over it
+        civ = self.detail_civ
+        key = (id(civ), self.detail_surface.get_size(), self.detail_scroll_y, self.detail_max_scroll_y,
+               self.simulation.tick_count, civ.population, civ.technology, len(civ.event_log),
+               id(civ.traits), id(civ.belief_system), civ.territory_version, len(civ.cities), civ.age)
+        if key != self._detail_key:
+            self._rebuild_civ_details_surface()
+            self._detail_key = key
+        self.detail_surface.blit(self._detail_base, (0, 0))
         
         # Draw stylish close button
         close_button_color = (40, 60, 100)
@@ -1408,22 +1597,104 @@ class Renderer:
             2
         )
         
+        # Draw styled scroll bar if needed
+        popup_height = self.detail_surface.get_height()
+        if self.detail_content_height > popup_height:
+            # Calculate the total height of the content
+            self.detail_content_height = self._detail_content_end
+            self.detail_max_scroll_y = max(0, self.detail_content_height - popup_height)
+            
+            # Calculate scrollbar track dimensions
+            scrollbar_width = 8
+            scrollbar_height = popup_height - 40  # 20px padding top and bottom
+            scrollbar_x = self.detail_surface.get_width() - scrollbar_width - 15  # 15px from right edge
+            scrollbar_y = 20  # 20px from top
+            
+            # Store the scroll bar rect for interaction
+            self.scroll_bar_rect = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_height)
+            
+            # Draw scrollbar track (subtle background)
+            pygame.draw.rect(self.detail_surface, (40, 60, 100, 100), 
+                           self.scroll_bar_rect, border_radius=4)
+            
+            # Calculate thumb dimensions
+            thumb_height_ratio = min(1.0, popup_height / self.detail_content_height)
+            thumb_height = max(40, int(scrollbar_height * thumb_height_ratio))
+            
+            # Calculate thumb position
+            scroll_ratio = self.detail_scroll_y / max(1, self.detail_max_scroll_y)
+            thumb_y = scrollbar_y + int((scrollbar_height - thumb_height) * scroll_ratio)
+            
+            # Store the scroll thumb rect
+            self.scroll_thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
+            
+            # Check if mouse is over the scrollbar thumb
+            mouse_pos = pygame.mouse.get_pos()
+            rel_mouse_pos = (mouse_pos[0] - self.detail_rect.x, mouse_pos[1] - self.detail_rect.y)
+            scrollbar_hovered = self.scroll_thumb_rect.collidepoint(rel_mouse_pos) or self.dragging_scrollbar
+            
+            # Draw thumb with appropriate style
+            if scrollbar_hovered:
+                # Glowing effect when hovered
+                for i in range(2):
+                    glow_rect = self.scroll_thumb_rect.inflate(i*2, i*2)
+                    pygame.draw.rect(self.detail_surface, (100, 180, 255),
+                                   glow_rect, border_radius=4)
+                
+                thumb_color = (100, 180, 255, 220)
+            else:
+                thumb_color = (80, 140, 220, 180)
+            
+            # Draw the actual thumb
+            pygame.draw.rect(self.detail_surface, thumb_color, 
+                           self.scroll_thumb_rect, border_radius=4)
+        
+        # Blit detail surface to screen
+        self.screen.blit(self.detail_surface, self.detail_rect)
+
+    def _rebuild_civ_details_surface(self):
+        """draw everything in the civ details popup that doesn't react to the mouse into
+        _detail_base - the title, info box, lore and scroll fades. the close button and scroll
+        bar go on top in _draw_civ_details"""
+        if self._detail_base is None or self._detail_base.get_size() != self.detail_surface.get_size():
+            self._detail_base = pygame.Surface(self.detail_surface.get_size())
+        
+        # Import lore generator with error handling
+        try:
+            from src.lore import get_detailed_civilization_info
+        except ImportError as e:
+            print(f"Error importing lore module: {e}")
+            get_detailed_civilization_info = None
+        
+        # Fill with solid deep blue background (no transparency)
+        primary_bg_color = (20, 35, 65)
+        self._detail_base.fill(primary_bg_color)
+        
+        # Add subtle gradient at the top
+        self._detail_base.blit(self._get_detail_gradient(self._detail_base.get_width(), primary_bg_color), (0, 0))
+        
+        # Draw an elegant border
+        border_color = (80, 120, 200)
+        pygame.draw.rect(self._detail_base, border_color,
+                       (0, 0, self._detail_base.get_width(), self._detail_base.get_height()),
+                       2, border_radius=12)
+        
         # Set up fonts - using more modern fonts
-        title_font = pygame.freetype.SysFont("Segoe UI", 32, bold=True)
-        header_font = pygame.freetype.SysFont("Segoe UI", 22, bold=True)
-        text_font = pygame.freetype.SysFont("Segoe UI", 16)
+        title_font = self._detail_title_font
+        header_font = self._detail_header_font
+        text_font = self._detail_text_font
         
         # Draw title with shadow and underline
         title_shadow, _ = title_font.render(f"{self.detail_civ.name}", (0, 0, 0, 100))
         title_text, _ = title_font.render(f"{self.detail_civ.name}", (255, 255, 255))
         
         # Add shadow effect
-        self.detail_surface.blit(title_shadow, (22, 22))
-        self.detail_surface.blit(title_text, (20, 20))
+        self._detail_base.blit(title_shadow, (22, 22))
+        self._detail_base.blit(title_text, (20, 20))
         
         # Add decorative underline
         pygame.draw.line(
-            self.detail_surface,
+            self._detail_base,
             (100, 180, 255, 180),
             (20, 60),
             (min(300, 20 + title_text.get_width() + 20), 60),
@@ -1437,8 +1708,8 @@ class Renderer:
         header_shadow, _ = header_font.render("Basic Information", (0, 0, 0, 80))
         header_text, _ = header_font.render("Basic Information", (200, 220, 255))
         
-        self.detail_surface.blit(header_shadow, (22, y_pos - self.detail_scroll_y + 2))
-        self.detail_surface.blit(header_text, (20, y_pos - self.detail_scroll_y))
+        self._detail_base.blit(header_shadow, (22, y_pos - self.detail_scroll_y + 2))
+        self._detail_base.blit(header_text, (20, y_pos - self.detail_scroll_y))
         y_pos += header_text.get_height() + 10
         
         # Create a subtle background box for basic info
@@ -1456,7 +1727,7 @@ class Renderer:
             f"Belief System: {self.detail_civ.belief_system.name} ({self.detail_civ.belief_system.foreign_stance})",
         ]
         
-        max_info_width = self.detail_surface.get_width() - 80 # 40px padding on each side of the info text itself
+        max_info_width = self._detail_base.get_width() - 80 # 40px padding on each side of the info text itself
         
         for item_text in basic_info_items:
             wrapped_lines = self._wrap_text(item_text, text_font, max_info_width)
@@ -1466,17 +1737,17 @@ class Renderer:
                 
                 # Check if the line is visible before blitting
                 if current_info_box_y - self.detail_scroll_y > 0 and \
-                   current_info_box_y - self.detail_scroll_y < self.detail_surface.get_height() - header_text.get_height(): # ensure not drawing over footer/next section
-                    self.detail_surface.blit(text_shadow, (42, current_info_box_y - self.detail_scroll_y + 1))
-                    self.detail_surface.blit(text_surface, (40, current_info_box_y - self.detail_scroll_y))
+                   current_info_box_y - self.detail_scroll_y < self._detail_base.get_height() - header_text.get_height(): # ensure not drawing over footer/next section
+                    self._detail_base.blit(text_shadow, (42, current_info_box_y - self.detail_scroll_y + 1))
+                    self._detail_base.blit(text_surface, (40, current_info_box_y - self.detail_scroll_y))
                 
                 current_info_box_y += line_rect.height + 3 # Small spacing between lines
             current_info_box_y += 2 # Extra spacing between items
         
         info_box_height = current_info_box_y - info_box_content_start_y + 10 # Add bottom padding
-        info_box_rect = pygame.Rect(20, info_box_content_start_y -10 , self.detail_surface.get_width() - 40, info_box_height)
-        pygame.draw.rect(self.detail_surface, (30, 45, 75, 160), info_box_rect, border_radius=8)
-        pygame.draw.rect(self.detail_surface, (60, 100, 180, 100), info_box_rect, 1, border_radius=8)
+        info_box_rect = pygame.Rect(20, info_box_content_start_y -10 , self._detail_base.get_width() - 40, info_box_height)
+        pygame.draw.rect(self._detail_base, (30, 45, 75, 160), info_box_rect, border_radius=8)
+        pygame.draw.rect(self._detail_base, (60, 100, 180, 100), info_box_rect, 1, border_radius=8)
         
         # Redraw the text on top of the now-drawn box (if visible)
         current_info_box_y = info_box_content_start_y # Reset y for redrawing text
@@ -1491,9 +1762,9 @@ class Renderer:
                 line_abs_y_on_surface = current_info_box_y - self.detail_scroll_y
                 if line_abs_y_on_surface + line_rect.height > info_box_rect.top - self.detail_scroll_y and \
                    line_abs_y_on_surface < info_box_rect.bottom - self.detail_scroll_y and \
-                   line_abs_y_on_surface > 0 and line_abs_y_on_surface < self.detail_surface.get_height() - text_font.get_sized_height():
-                    self.detail_surface.blit(text_shadow, (42, line_abs_y_on_surface + 1))
-                    self.detail_surface.blit(text_surface, (40, line_abs_y_on_surface))
+                   line_abs_y_on_surface > 0 and line_abs_y_on_surface < self._detail_base.get_height() - text_font.get_sized_height():
+                    self._detail_base.blit(text_shadow, (42, line_abs_y_on_surface + 1))
+                    self._detail_base.blit(text_surface, (40, line_abs_y_on_surface))
                 
                 current_info_box_y += line_rect.height + 3
             current_info_box_y += 2
@@ -1519,16 +1790,16 @@ class Renderer:
                 header_shadow, _ = header_font.render(title, (0, 0, 0, 80))
                 header_text, _ = header_font.render(title, (200, 220, 255))
                 
-                if y_position - self.detail_scroll_y > -header_text.get_height() and y_position - self.detail_scroll_y < self.detail_surface.get_height():
-                    self.detail_surface.blit(header_shadow, (22, y_position - self.detail_scroll_y + 2))
-                    self.detail_surface.blit(header_text, (20, y_position - self.detail_scroll_y))
+                if y_position - self.detail_scroll_y > -header_text.get_height() and y_position - self.detail_scroll_y < self._detail_base.get_height():
+                    self._detail_base.blit(header_shadow, (22, y_position - self.detail_scroll_y + 2))
+                    self._detail_base.blit(header_text, (20, y_position - self.detail_scroll_y))
                 
                 section_y = y_position + header_text.get_height() + 5
                 
                 # Draw section underline
-                if section_y - self.detail_scroll_y > 0 and section_y - self.detail_scroll_y < self.detail_surface.get_height():
+                if section_y - self.detail_scroll_y > 0 and section_y - self.detail_scroll_y < self._detail_base.get_height():
                     pygame.draw.line(
-                        self.detail_surface,
+                        self._detail_base,
                         (100, 180, 255, 100),
                         (20, section_y - self.detail_scroll_y),
                         (min(280, 20 + header_text.get_width() + 40), section_y - self.detail_scroll_y),
@@ -1538,15 +1809,15 @@ class Renderer:
                 section_y += 10
                 
                 # Wrap and draw the text with shadow
-                wrapped_text = self._wrap_text(content, text_font, self.detail_surface.get_width() - 60)
+                wrapped_text = self._wrap_text(content, text_font, self._detail_base.get_width() - 60)
                 for line in wrapped_text:
                     # Only render if would be visible
-                    if section_y - self.detail_scroll_y > -text_font.get_sized_height() and section_y - self.detail_scroll_y < self.detail_surface.get_height():
+                    if section_y - self.detail_scroll_y > -text_font.get_sized_height() and section_y - self.detail_scroll_y < self._detail_base.get_height():
                         shadow_surf, _ = text_font.render(line, (0, 0, 0, 60))
                         text_surf, _ = text_font.render(line, (220, 240, 255))
                         
-                        self.detail_surface.blit(shadow_surf, (42, section_y - self.detail_scroll_y + 1))
-                        self.detail_surface.blit(text_surf, (40, section_y - self.detail_scroll_y))
+                        self._detail_base.blit(shadow_surf, (42, section_y - self.detail_scroll_y + 1))
+                        self._detail_base.blit(text_surf, (40, section_y - self.detail_scroll_y))
                     
                     section_y += text_surf.get_height() + 2
                 
@@ -1570,28 +1841,28 @@ class Renderer:
                 header_shadow, _ = header_font.render("Major Cities", (0, 0, 0, 80))
                 header_text, _ = header_font.render("Major Cities", (200, 220, 255))
                 
-                if y_pos - self.detail_scroll_y > -header_text.get_height() and y_pos - self.detail_scroll_y < self.detail_surface.get_height():
-                    self.detail_surface.blit(header_shadow, (22, y_pos - self.detail_scroll_y + 2))
-                    self.detail_surface.blit(header_text, (20, y_pos - self.detail_scroll_y))
+                if y_pos - self.detail_scroll_y > -header_text.get_height() and y_pos - self.detail_scroll_y < self._detail_base.get_height():
+                    self._detail_base.blit(header_shadow, (22, y_pos - self.detail_scroll_y + 2))
+                    self._detail_base.blit(header_text, (20, y_pos - self.detail_scroll_y))
                 y_pos += header_text.get_height() + 15
                 
                 for city_name, city_description in lore_content["cities"].items():
                     # Check if city section would be visible before rendering
-                    if y_pos - self.detail_scroll_y < self.detail_surface.get_height():
+                    if y_pos - self.detail_scroll_y < self._detail_base.get_height():
                         # Create a subtle box for each city
                         city_box_start = y_pos
                         
                         # Calculate city box height
                         city_text_height = text_font.get_sized_height() + 5
-                        wrapped_city = self._wrap_text(city_description, text_font, self.detail_surface.get_width() - 80)
+                        wrapped_city = self._wrap_text(city_description, text_font, self._detail_base.get_width() - 80)
                         city_box_height = city_text_height + len(wrapped_city) * (text_font.get_sized_height() + 2) + 15
                         
                         # Draw city box if it would be visible
                         if (y_pos - self.detail_scroll_y + city_box_height > 0):
                             city_box = pygame.Rect(40, y_pos - self.detail_scroll_y, 
-                                                  self.detail_surface.get_width() - 80, city_box_height)
-                            pygame.draw.rect(self.detail_surface, (30, 45, 75, 120), city_box, border_radius=8)
-                            pygame.draw.rect(self.detail_surface, (60, 100, 180, 80), city_box, 1, border_radius=8)
+                                                  self._detail_base.get_width() - 80, city_box_height)
+                            pygame.draw.rect(self._detail_base, (30, 45, 75, 120), city_box, border_radius=8)
+                            pygame.draw.rect(self._detail_base, (60, 100, 180, 80), city_box, 1, border_radius=8)
                             
                             # Add 5px padding
                             y_pos += 10
@@ -1600,8 +1871,8 @@ class Renderer:
                             city_name_shadow, _ = text_font.render(f"{city_name}:", (0, 0, 0, 60))
                             city_name_text, _ = text_font.render(f"{city_name}:", (240, 250, 190))
                             
-                            self.detail_surface.blit(city_name_shadow, (52, y_pos - self.detail_scroll_y + 1))
-                            self.detail_surface.blit(city_name_text, (50, y_pos - self.detail_scroll_y))
+                            self._detail_base.blit(city_name_shadow, (52, y_pos - self.detail_scroll_y + 1))
+                            self._detail_base.blit(city_name_text, (50, y_pos - self.detail_scroll_y))
                             y_pos += city_name_text.get_height() + 5
                             
                             # City description
@@ -1609,8 +1880,8 @@ class Renderer:
                                 text_shadow, _ = text_font.render(line, (0, 0, 0, 60))
                                 text_surface, _ = text_font.render(line, (210, 230, 255))
                                 
-                                self.detail_surface.blit(text_shadow, (62, y_pos - self.detail_scroll_y + 1))
-                                self.detail_surface.blit(text_surface, (60, y_pos - self.detail_scroll_y))
+                                self._detail_base.blit(text_shadow, (62, y_pos - self.detail_scroll_y + 1))
+                                self._detail_base.blit(text_surface, (60, y_pos - self.detail_scroll_y))
                                 y_pos += text_surface.get_height() + 2
                             
                             # Add padding at bottom
@@ -1628,71 +1899,28 @@ class Renderer:
             for i in range(20):
                 alpha = min(180, i * 9)
                 fade_color = (*primary_bg_color[:3], alpha)
-                pygame.draw.rect(self.detail_surface, fade_color, (0, i, self.detail_surface.get_width(), 1))
+                pygame.draw.rect(self._detail_base, fade_color, (0, i, self._detail_base.get_width(), 1))
         
         if self.detail_scroll_y < self.detail_max_scroll_y:
             # Bottom fade when more content below
             for i in range(20):
                 alpha = min(180, i * 9)
                 fade_color = (*primary_bg_color[:3], alpha)
-                bottom_y = self.detail_surface.get_height() - i - 1
-                pygame.draw.rect(self.detail_surface, fade_color, 
-                               (0, bottom_y, self.detail_surface.get_width(), 1))
+                bottom_y = self._detail_base.get_height() - i - 1
+                pygame.draw.rect(self._detail_base, fade_color, 
+                               (0, bottom_y, self._detail_base.get_width(), 1))
         
-        # Draw styled scroll bar if needed
-        popup_height = self.detail_surface.get_height()
-        if self.detail_content_height > popup_height:
-            # Calculate the total height of the content
-            self.detail_content_height = y_pos
-            self.detail_max_scroll_y = max(0, self.detail_content_height - popup_height)
-            
-            # Calculate scrollbar track dimensions
-            scrollbar_width = 8
-            scrollbar_height = popup_height - 40  # 20px padding top and bottom
-            scrollbar_x = self.detail_surface.get_width() - scrollbar_width - 15  # 15px from right edge
-            scrollbar_y = 20  # 20px from top
-            
-            # Store the scroll bar rect for interaction
-            self.scroll_bar_rect = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_height)
-            
-            # Draw scrollbar track (subtle background)
-            pygame.draw.rect(self.detail_surface, (40, 60, 100, 100), 
-                           self.scroll_bar_rect, border_radius=4)
-            
-            # Calculate thumb dimensions
-            thumb_height_ratio = min(1.0, popup_height / self.detail_content_height)
-            thumb_height = max(40, int(scrollbar_height * thumb_height_ratio))
-            
-            # Calculate thumb position
-            scroll_ratio = self.detail_scroll_y / max(1, self.detail_max_scroll_y)
-            thumb_y = scrollbar_y + int((scrollbar_height - thumb_height) * scroll_ratio)
-            
-            # Store the scroll thumb rect
-            self.scroll_thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-            
-            # Check if mouse is over the scrollbar thumb
-            mouse_pos = pygame.mouse.get_pos()
-            rel_mouse_pos = (mouse_pos[0] - self.detail_rect.x, mouse_pos[1] - self.detail_rect.y)
-            scrollbar_hovered = self.scroll_thumb_rect.collidepoint(rel_mouse_pos) or self.dragging_scrollbar
-            
-            # Draw thumb with appropriate style
-            if scrollbar_hovered:
-                # Glowing effect when hovered
-                for i in range(2):
-                    glow_rect = self.scroll_thumb_rect.inflate(i*2, i*2)
-                    pygame.draw.rect(self.detail_surface, (100, 180, 255),
-                                   glow_rect, border_radius=4)
-                
-                thumb_color = (100, 180, 255, 220)
-            else:
-                thumb_color = (80, 140, 220, 180)
-            
-            # Draw the actual thumb
-            pygame.draw.rect(self.detail_surface, thumb_color, 
-                           self.scroll_thumb_rect, border_radius=4)
-        
-        # Blit detail surface to screen
-        self.screen.blit(self.detail_surface, self.detail_rect)
+        self._detail_content_end = y_pos
+
+    def _get_detail_gradient(self, width, bg_color):
+        """the 40px strip at the top of the civ details popup, brightening towards the top edge
+        from bg_color - built once per popup width"""
+        if self._detail_gradient is None or self._detail_gradient.get_width() != width:
+            strength = 40 - np.arange(40)
+            column = np.minimum(255, np.asarray(bg_color) + strength[:, None] * np.array([1, 1, 2]))
+            strip = pygame.surfarray.make_surface(column[None, :, :].astype(np.uint8))
+            self._detail_gradient = pygame.transform.scale(strip, (width, 40))
+        return self._detail_gradient
 
     def _wrap_text(self, text, font, max_width):
         """Wrap text to fit within a given width"""
@@ -388,7 +388,7 @@ class Visualizer:
                     "foreign_stance": civ.belief_system.foreign_stance
                 },
                 "resources": civ.resources,
-                "relations": civ.relations
+                "relations": dict(civ.relations)
             }
             data["active_civilizations"].append(civ_data)
         
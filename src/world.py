@@ -5,6 +5,9 @@ import random
 import numpy as np
 import math
 
+# the 8 tiles around a tile
+NEIGHBOUR_OFFSETS = ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1))
+
 class TerrainType:
     WATER = 0
     LAND = 1
@@ -18,6 +21,26 @@ class World:
         self.terrain = np.zeros((self.width, self.height), dtype=int)
         self.civilizations = []
         self.resources = {}  # maps positions to resource availability
+        
+        # which civ owns each tile, by civ.index (-1 = nobody) - kept in sync by the civs
+        self.tile_owner = np.full((self.width, self.height), -1, dtype=np.int32)
+        self.civs_by_index = {}
+        self.civs_by_id = {}  # civ.id -> civ, for quick enemy/neighbour lookups
+        self._next_civ_index = 0
+        
+        # civ.index <-> civ.id for every civ we've heard of, including ones that are gone
+        # (other civs still remember how they felt about them)
+        self._index_of_id = {}
+        self._id_of_index = {}
+        
+        # relation_matrix[i, j] is how civ index i feels about civ index j (-1 to 1, nan = never met)
+        # civ.relations is a dict-like view over one row of this
+        self.relation_matrix = np.full((8, 8), np.nan)
+        
+        # bumped whenever tile_owner changes, so derived data (like adjacency) knows when to rebuild
+        self.owner_version = 0
+        self._neighbours = {}
+        self._neighbours_version = -1
 
     def generate(self, seed=None):
         """generate a procedural world with terrain features"""
@@ -224,6 +247,157 @@ class World:
         """add a civilization to the world"""
         self.civilizations.append(civilization)
         
+        # hand out a small int index and mark its land on the ownership map
+        if civilization.index is None:
+            civilization.index = self.index_for_id(civilization.id)
+        self.civs_by_index[civilization.index] = civilization
+        self.civs_by_id[civilization.id] = civilization
+        if civilization.territory:
+            self.claim_tiles(civilization, civilization.territory_xy())
+    
+    def forget_civilization(self, civilization):
+        """drop a civ that has left the world from the ownership map"""
+        self.civs_by_index.pop(civilization.index, None)
+        self.civs_by_id.pop(civilization.id, None)
+        if civilization.territory:
+            self.release_tiles(civilization, civilization.territory_xy())
+    
+    def clear_civilizations(self):
+        """remove every civ (used when loading a save)"""
+        self.civilizations = []
+        self.civs_by_index = {}
+        self.civs_by_id = {}
+        self._index_of_id = {}
+        self._id_of_index = {}
+        self._next_civ_index = 0
+        self.relation_matrix.fill(np.nan)
+        self.tile_owner.fill(-1)
+        self.owner_version += 1
+    
+    def index_for_id(self, civ_id):
+        """the index that goes with a civ id, handing out a new one if we haven't seen it before"""
+        index = self._index_of_id.get(civ_id)
+        if index is None:
+            index = self._next_civ_index
+            self._next_civ_index += 1
+            self._index_of_id[civ_id] = index
+            self._id_of_index[index] = civ_id
+            
+            # grow the relation matrix by doubling
+            size = len(self.relation_matrix)
+            if index >= size:
+                grown = np.full((size * 2, size * 2), np.nan)
+                grown[:size, :size] = self.relation_matrix
+                self.relation_matrix = grown
+        return index
+    
+    def id_for_index(self, index):
+        """the civ id that goes with an index"""
+        return self._id_of_index[index]
+    
+    def get_relation(self, index1, index2):
+        """how civ index1 feels about index2, or None if they've never met"""
+        value = self.relation_matrix[index1, index2]
+        return None if np.isnan(value) else float(value)
+    
+    def set_relation(self, index1, index2, value):
+        """set the relation between two civs both ways"""
+        self.relation_matrix[index1, index2] = value
+        self.relation_matrix[index2, index1] = value
+    
+    def claim_tile(self, civilization, position):
+        """mark a tile as owned by a civ"""
+        self.tile_owner[position] = civilization.index
+        self.owner_version += 1
+    
+    def release_tile(self, civilization, position):
+        """unmark a tile, unless someone else has taken it since"""
+        if self.tile_owner[position] == civilization.index:
+            self.tile_owner[position] = -1
+            self._hand_back(civilization, np.array([position]))
+            self.owner_version += 1
+    
+    def claim_tiles(self, civilization, xy):
+        """claim_tile for an (N, 2) array of x, y"""
+        self.tile_owner[xy[:, 0], xy[:, 1]] = civilization.index
+        self.owner_version += 1
+    
+    def release_tiles(self, civilization, xy):
+        """release_tile for an (N, 2) array of x, y"""
+        mine = xy[self.tile_owner[xy[:, 0], xy[:, 1]] == civilization.index]
+        self.tile_owner[mine[:, 0], mine[:, 1]] = -1
+        self._hand_back(civilization, mine)
+        self.owner_version += 1
+    
+    def _hand_back(self, civilization, xy):
+        """territories can overlap but tile_owner only keeps the last civ to claim a tile, so
+        give tiles the civ just let go of to any other civ that still holds them"""
+        for other in self.civs_by_index.values():
+            if not len(xy):
+                return
+            if other is civilization:
+                continue
+            territory = other.territory
+            held = np.fromiter(((x, y) in territory for x, y in xy.tolist()), dtype=bool, count=len(xy))
+            if held.any():
+                self.tile_owner[xy[held, 0], xy[held, 1]] = other.index
+                xy = xy[~held]
+    
+    def neighbour_indices(self):
+        """{civ.index: set of civ indices whose land touches it (diagonals count)}"""
+        if self._neighbours_version != self.owner_version:
+            self._neighbours = self._find_neighbours()
+            self._neighbours_version = self.owner_version
+        return self._neighbours
+    
+    def _find_neighbours(self):
+        """compare the ownership map against itself shifted one tile in each direction"""
+        owner = self.tile_owner
+        # right, down and both diagonals - the other four directions are the same pairs flipped
+        shifted = (
+            (owner[:-1, :], owner[1:, :]),
+            (owner[:, :-1], owner[:, 1:]),
+            (owner[:-1, :-1], owner[1:, 1:]),
+            (owner[:-1, 1:], owner[1:, :-1])
+        )
+        stride = self._next_civ_index
+        codes = []
+        for a, b in shifted:
+            touching = (a >= 0) & (b >= 0) & (a != b)
+            a, b = a[touching], b[touching]
+            codes.append(np.minimum(a, b).astype(np.int64) * stride + np.maximum(a, b))
+        
+        neighbours = {}
+        for code in np.unique(np.concatenate(codes)).tolist():
+            a, b = divmod(code, stride)
+            neighbours.setdefault(a, set()).add(b)
+            neighbours.setdefault(b, set()).add(a)
+        return neighbours
+    
+    def tiles_touching(self, xy, civilization):
+        """mask of the rows of an (N, 2) x, y array that sit next to a tile the civ owns"""
+        touching = np.zeros(len(xy), dtype=bool)
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            x = xy[:, 0] + dx
+            y = xy[:, 1] + dy
+            inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+            owner = self.tile_owner[np.clip(x, 0, self.width - 1), np.clip(y, 0, self.height - 1)]
+            touching |= inside & (owner == civilization.index)
+        return touching
+    
+    def count_owned_in_radius(self, x, y, radius):
+        """how many tiles each civ owns within radius of (x, y) - {civ.index: count}"""
+        x0, x1 = max(0, x - radius), min(self.width, x + radius + 1)
+        y0, y1 = max(0, y - radius), min(self.height, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return {}
+        
+        dx = np.arange(x0, x1)[:, None] - x
+        dy = np.arange(y0, y1)[None, :] - y
+        owners = self.tile_owner[x0:x1, y0:y1][dx * dx + dy * dy <= radius * radius]
+        counts = np.bincount(owners[owners >= 0])
+        return {index: int(counts[index]) for index in np.flatnonzero(counts).tolist()}
+        
     def get_civilizations_at(self, position):
         """get all civilizations at a specific position"""
         return [civ for civ in self.civilizations if civ.has_territory_at(position)] 
\ No newline at end of file
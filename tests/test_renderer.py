@@ -0,0 +1,40 @@
+import random
+
+import pygame
+
+from src.simulation import Simulation
+from src.ui.renderer import Renderer
+from src.world import World
+
+
+def make_renderer():
+    pygame.init()
+    screen = pygame.display.set_mode((1200, 800))
+    random.seed(4)
+    world = World((60, 60)).generate(seed=4)
+    sim = Simulation(world)
+    sim.initialize(num_civs=3)
+    renderer = Renderer(screen, world)
+    renderer.set_simulation(sim)
+    return sim, renderer
+
+
+def test_civ_details_rebuilt_after_shift_ideology():
+    sim, renderer = make_renderer()
+    civ = sim.world.civilizations[0]
+    renderer.show_civ_details(civ)
+    
+    rebuilds = []
+    rebuild = renderer._rebuild_civ_details_surface
+    renderer._rebuild_civ_details_surface = lambda: (rebuilds.append(1), rebuild())
+    
+    renderer._draw_civ_details()
+    renderer._draw_civ_details()
+    assert len(rebuilds) == 1  # nothing changed, so the cached body is reused
+    
+    # paused - the tick count doesn't move, but the traits and belief system are replaced
+    old_traits, old_belief = civ.traits, civ.belief_system
+    sim.trigger_god_event("shift_ideology", civ)
+    assert civ.traits is not old_traits and civ.belief_system is not old_belief
+    renderer._draw_civ_details()
+    assert len(rebuilds) == 2
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from src.simulation import Simulation
+from src.world import World
+
+
+@pytest.fixture
+def sim(tmp_path, monkeypatch):
+    # saves go to data/ under the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    random.seed(5)
+    sim = Simulation(World((50, 50)).generate(seed=5))
+    sim.initialize(num_civs=3)
+    return sim
+
+
+def wait_for_save(sim):
+    sim._pending_save.result()
+    return sim.save_result()
+
+
+def test_save_result_reports_the_write(sim):
+    success, filename = sim.save_state("ok")
+    assert success and filename == "ok.pickle"
+    assert wait_for_save(sim) == (True, "ok.pickle")
+    assert sim.save_result() is None  # only reported once
+
+
+def test_save_result_reports_a_failed_write(sim, tmp_path):
+    (tmp_path / "data" / "blocked.pickle").mkdir()  # can't open a directory for writing
+    success, _ = sim.save_state("blocked")
+    assert success  # queued
+    success, message = wait_for_save(sim)
+    assert not success and message
+
+
+def test_loading_a_save_keeps_the_event_logs_of_other_saves(sim, tmp_path):
+    sim.event_logger.add_event(sim.year, "before the first save")
+    sim.save_state("game")
+    wait_for_save(sim)
+    first_events = [event["description"] for event in sim.event_logger.get_all_events()]
+    
+    sim.event_logger.add_event(sim.year, "between the saves")
+    sim.save_state("game_later")
+    wait_for_save(sim)
+    later_events = [event["description"] for event in sim.event_logger.get_all_events()]
+    assert later_events[:-1] == first_events
+    
+    logs = {path: path.stat().st_size for path in (tmp_path / "data").glob("events_*.jsonl")}
+    success, _ = sim.load_state("game")
+    assert success
+    assert [event["description"] for event in sim.event_logger.get_all_events()] == first_events
+    assert {path: path.stat().st_size for path in logs} == logs  # loading never truncates a log
+    
+    # carry on from the first save and save it again - the later save still loads as it was
+    sim.event_logger.add_event(sim.year, "after loading the first save")
+    sim.save_state("game")
+    wait_for_save(sim)
+    success, _ = sim.load_state("game_later")
+    assert success
+    assert [event["description"] for event in sim.event_logger.get_all_events()] == later_events
+    success, _ = sim.load_state("game")
+    assert success
+    assert [event["description"] for event in sim.event_logger.get_all_events()][-1] == "after loading the first save"
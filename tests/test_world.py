@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+
+from src.simulation import Simulation
+from src.world import World
+
+
+def make_sim(seed=1, civs=3):
+    random.seed(seed)
+    sim = Simulation(World((60, 60)).generate(seed=seed))
+    sim.initialize(num_civs=civs)
+    return sim
+
+
+def check_tile_owner(world):
+    """every owned tile belongs to a civ that holds it, and every held tile is owned"""
+    holders = {}
+    for civ in world.civs_by_index.values():
+        for position in civ.territory:
+            holders.setdefault(position, set()).add(civ.index)
+    
+    for x, y in np.argwhere(world.tile_owner >= 0).tolist():
+        assert world.tile_owner[x, y] in holders.get((x, y), ())
+    for position, indices in holders.items():
+        assert world.tile_owner[position] in indices
+
+
+def test_overlapping_civ_collapse_keeps_neighbour_tiles():
+    sim = make_sim()
+    first, second = sim.world.civilizations[:2]
+    # second claims half of first's land on top of it, so it is the recorded owner there
+    shared = sorted(first.territory)[::2]
+    second.add_tiles(shared)
+    check_tile_owner(sim.world)
+    
+    second.has_collapsed = True
+    sim._remove_collapsed_civilizations()
+    assert second not in sim.world.civilizations
+    check_tile_owner(sim.world)
+    assert all(sim.world.tile_owner[position] == first.index for position in shared)
+
+
+def test_forget_civilization_hands_tiles_back():
+    sim = make_sim(seed=2)
+    first, second = sim.world.civilizations[:2]
+    second.add_tile(next(iter(first.territory)))
+    second.territory = set(second.territory) | set(sorted(first.territory)[:5])
+    check_tile_owner(sim.world)
+    
+    second.remove_tile(next(iter(first.territory)))
+    check_tile_owner(sim.world)
+    
+    sim.world.civilizations.remove(second)
+    sim.world.forget_civilization(second)
+    check_tile_owner(sim.world)
+
+
+def test_tile_owner_matches_territory_over_a_run():
+    sim = make_sim(seed=3, civs=5)
+    for _ in range(60):
+        sim.tick()
+        check_tile_owner(sim.world)